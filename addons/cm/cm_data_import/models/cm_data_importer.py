@@ -1,14 +1,17 @@
+import json
 import logging
 import os
 import re
 from collections import Counter
-from datetime import date, datetime, time
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
 from typing import TypedDict, TypeVar
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from odoo import api, fields, models
 from odoo.addons.transaction_utilities.models.cron_budget_mixin import CronRuntimeBudgetExceeded
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
 
 from ..external_identity import (
     EMPLOYEE_EXTERNAL_SYSTEM_APPLICABLE_MODEL_XMLIDS,
@@ -84,6 +87,36 @@ PTO_USAGE_RESOURCE = "pto_usage"
 VACATION_USAGE_RESOURCE = "vacation_usage"
 TIMECLOCK_IN_RESOURCE = "timeclock_in"
 TIMECLOCK_OUT_RESOURCE = "timeclock_out"
+EXTERNAL_ID_BATCH_SIZE = 500
+CM_DATA_PHASE_STATE_VERSION = 1
+CM_DATA_PHASE_STATE_PARAM = "cm_data.phase_state"
+CM_DATA_PHASE_PRICE_LISTS = "price_lists"
+CM_DATA_PHASE_PRICING_LINES = "pricing_lines"
+CM_DATA_PHASE_CONTACTS = "contacts"
+CM_DATA_PHASE_DIRECTIONS = "directions"
+CM_DATA_PHASE_SHIPPING_INSTRUCTIONS = "shipping_instructions"
+CM_DATA_PHASE_NOTES = "notes"
+CM_DATA_PHASE_PASSWORDS = "passwords"
+CM_DATA_PHASE_MODEL_NUMBERS = "model_numbers"
+CM_DATA_PHASE_DELIVERY_LOGS = "delivery_logs"
+CM_DATA_PHASE_PTO_USAGE = "pto_usage"
+CM_DATA_PHASE_VACATION_USAGE = "vacation_usage"
+# Phases that read only rows changed since their own watermark. Accounts, pricing catalogs,
+# employees and timeclock punches are always read in full: their rows build the lookup maps
+# later phases resolve against, and the employee tables have no updated_at column.
+CM_DATA_INCREMENTAL_PHASES = (
+    CM_DATA_PHASE_PRICE_LISTS,
+    CM_DATA_PHASE_PRICING_LINES,
+    CM_DATA_PHASE_CONTACTS,
+    CM_DATA_PHASE_DIRECTIONS,
+    CM_DATA_PHASE_SHIPPING_INSTRUCTIONS,
+    CM_DATA_PHASE_NOTES,
+    CM_DATA_PHASE_PASSWORDS,
+    CM_DATA_PHASE_MODEL_NUMBERS,
+    CM_DATA_PHASE_DELIVERY_LOGS,
+    CM_DATA_PHASE_PTO_USAGE,
+    CM_DATA_PHASE_VACATION_USAGE,
+)
 NOTE_TYPE_RESOURCES = {
     "intake": "intake",
     "diagnostic": "diagnostic",
@@ -131,12 +164,16 @@ class CmDataImporter(models.Model):
     def _run_import(self, *, update_last_sync: bool) -> None:
         sync_started_at = fields.Datetime.now()
         use_last_sync_at = self._use_last_sync_at()
-        start_datetime = self._get_last_sync_at() if update_last_sync and use_last_sync_at else None
+        phase_starts = self._get_phase_starts(sync_started_at) if update_last_sync and use_last_sync_at else {}
         try:
             system = self._get_cm_data_system()
             with CmDataClient(self._get_connection_settings()) as client:
-                price_list_rows = client.fetch_price_lists(updated_at=None)
-                self._import_price_lists(price_list_rows, system, sync_started_at)
+                self._import_price_lists(
+                    client.iter_price_lists(updated_at=phase_starts.get(CM_DATA_PHASE_PRICE_LISTS)),
+                    system,
+                    sync_started_at,
+                )
+                self._complete_phase(CM_DATA_PHASE_PRICE_LISTS, phase_starts, sync_started_at)
                 account_rows = client.fetch_account_names(updated_at=None)
                 account_partner_map = self._import_accounts(
                     account_rows,
@@ -145,7 +182,6 @@ class CmDataImporter(models.Model):
                 )
                 self._import_account_aliases(account_rows, account_partner_map)
                 pricing_catalog_rows = client.fetch_pricing_catalogs(updated_at=None)
-                pricing_line_rows = client.fetch_pricing_lines(updated_at=None)
                 catalog_row_map, catalog_id_map = self._import_pricing_catalogs(
                     pricing_catalog_rows,
                     account_partner_map,
@@ -153,47 +189,84 @@ class CmDataImporter(models.Model):
                     sync_started_at,
                 )
                 self._import_pricing_lines(
-                    pricing_line_rows,
+                    client.iter_pricing_lines(updated_at=phase_starts.get(CM_DATA_PHASE_PRICING_LINES)),
                     catalog_row_map,
                     catalog_id_map,
                     system,
                     sync_started_at,
                 )
-                self._import_contacts(client, start_datetime, account_partner_map, system, sync_started_at)
-                direction_rows = client.fetch_directions(updated_at=start_datetime)
+                self._complete_phase(CM_DATA_PHASE_PRICING_LINES, phase_starts, sync_started_at)
+                self._import_contacts(
+                    client,
+                    phase_starts.get(CM_DATA_PHASE_CONTACTS),
+                    account_partner_map,
+                    system,
+                    sync_started_at,
+                )
+                self._complete_phase(CM_DATA_PHASE_CONTACTS, phase_starts, sync_started_at)
+                direction_start_datetime = phase_starts.get(CM_DATA_PHASE_DIRECTIONS)
+                direction_rows = client.fetch_directions(updated_at=direction_start_datetime)
                 self._import_directions(
                     client,
-                    start_datetime,
+                    direction_start_datetime,
                     account_partner_map,
                     system,
                     sync_started_at,
                     direction_rows=direction_rows,
                 )
+                self._complete_phase(CM_DATA_PHASE_DIRECTIONS, phase_starts, sync_started_at)
                 location_partner_map = self._build_location_partner_map(
                     account_rows,
                     direction_rows,
                     account_partner_map,
                 )
                 location_alias_partner_map = self._build_location_alias_partner_map(system)
-                self._import_shipping_instructions(client, start_datetime, account_partner_map, system, sync_started_at)
-                self._import_note_tables(client, None, account_partner_map, system, sync_started_at)
-                self._import_passwords(client, None, account_partner_map)
-                self._import_model_numbers(client, None, system, sync_started_at)
+                self._import_shipping_instructions(
+                    client,
+                    phase_starts.get(CM_DATA_PHASE_SHIPPING_INSTRUCTIONS),
+                    account_partner_map,
+                    system,
+                    sync_started_at,
+                )
+                self._complete_phase(CM_DATA_PHASE_SHIPPING_INSTRUCTIONS, phase_starts, sync_started_at)
+                self._import_note_tables(
+                    client,
+                    phase_starts.get(CM_DATA_PHASE_NOTES),
+                    account_partner_map,
+                    system,
+                    sync_started_at,
+                )
+                self._complete_phase(CM_DATA_PHASE_NOTES, phase_starts, sync_started_at)
+                self._import_passwords(client, phase_starts.get(CM_DATA_PHASE_PASSWORDS), account_partner_map)
+                self._complete_phase(CM_DATA_PHASE_PASSWORDS, phase_starts, sync_started_at)
+                self._import_model_numbers(client, phase_starts.get(CM_DATA_PHASE_MODEL_NUMBERS), system, sync_started_at)
+                self._complete_phase(CM_DATA_PHASE_MODEL_NUMBERS, phase_starts, sync_started_at)
                 self._import_delivery_logs(
                     client,
-                    start_datetime,
+                    phase_starts.get(CM_DATA_PHASE_DELIVERY_LOGS),
                     account_partner_map,
                     location_partner_map,
                     location_alias_partner_map,
                     system,
                     sync_started_at,
                 )
+                self._complete_phase(CM_DATA_PHASE_DELIVERY_LOGS, phase_starts, sync_started_at)
                 employee_rows = client.fetch_employees(updated_at=None)
                 employee_map, timeclock_employee_map = self._import_employees(employee_rows, system, sync_started_at)
-                pto_rows = client.fetch_pto_usage(updated_at=None)
-                self._import_pto_usage(pto_rows, employee_map, system, sync_started_at)
-                vacation_rows = client.fetch_vacation_usage(updated_at=None)
-                self._import_vacation_usage(vacation_rows, employee_map, system, sync_started_at)
+                self._import_pto_usage(
+                    client.iter_pto_usage(updated_at=phase_starts.get(CM_DATA_PHASE_PTO_USAGE)),
+                    employee_map,
+                    system,
+                    sync_started_at,
+                )
+                self._complete_phase(CM_DATA_PHASE_PTO_USAGE, phase_starts, sync_started_at)
+                self._import_vacation_usage(
+                    client.iter_vacation_usage(updated_at=phase_starts.get(CM_DATA_PHASE_VACATION_USAGE)),
+                    employee_map,
+                    system,
+                    sync_started_at,
+                )
+                self._complete_phase(CM_DATA_PHASE_VACATION_USAGE, phase_starts, sync_started_at)
                 timeclock_rows = client.fetch_timeclock_punches(updated_at=None)
                 self._ensure_timeclock_placeholder_employees(
                     timeclock_rows,
@@ -483,10 +556,12 @@ class CmDataImporter(models.Model):
         system: "odoo.model.external_system",
         sync_started_at: datetime,
     ) -> None:
-        contacts = client.fetch_contacts(updated_at=start_datetime)
+        contacts = client.iter_contacts(updated_at=start_datetime)
         partner_model = self.env["res.partner"].sudo().with_context(IMPORT_CONTEXT)
         commit_interval = self._get_commit_interval()
+        batch_size = commit_interval if commit_interval > 0 else EXTERNAL_ID_BATCH_SIZE
         processed_count = 0
+        contact_batch: list[tuple[str, dict[str, object], datetime | None]] = []
         for row in contacts:
             parent_partner_id = self._resolve_account_partner_id(row.account_name, partner_map)
             if not parent_partner_id:
@@ -505,18 +580,27 @@ class CmDataImporter(models.Model):
                 values["email"] = structured_email or False
             if "function" in partner_model._fields:
                 values["function"] = row.sub_name if structured_name and row.sub_name and structured_name != row.sub_name else False
-            self._get_or_create_by_external_id_with_sync(
+            contact_batch.append((str(row.record_id), values, row.updated_at))
+            if len(contact_batch) < batch_size:
+                continue
+            self._get_or_create_many_by_external_id_with_sync(
                 partner_model,
                 system,
-                str(row.record_id),
-                values,
+                contact_batch,
                 resource=CONTACT_RESOURCE,
-                updated_at=row.updated_at,
                 sync_started_at=sync_started_at,
             )
-            processed_count += 1
+            processed_count += len(contact_batch)
+            contact_batch = []
             if self._maybe_commit(processed_count, commit_interval, label="contact"):
                 partner_model = self.env["res.partner"].sudo().with_context(IMPORT_CONTEXT)
+        self._get_or_create_many_by_external_id_with_sync(
+            partner_model,
+            system,
+            contact_batch,
+            resource=CONTACT_RESOURCE,
+            sync_started_at=sync_started_at,
+        )
 
     def _import_directions(
         self,
@@ -584,7 +668,7 @@ class CmDataImporter(models.Model):
         system: "odoo.model.external_system",
         sync_started_at: datetime,
     ) -> None:
-        instruction_rows = client.fetch_shipping_instructions(updated_at=start_datetime)
+        instruction_rows = client.iter_shipping_instructions(updated_at=start_datetime)
         instruction_model = self.env["integration.cm_data.shipping.instruction"].sudo().with_context(IMPORT_CONTEXT)
         commit_interval = self._get_commit_interval()
         processed_count = 0
@@ -643,19 +727,20 @@ class CmDataImporter(models.Model):
         system: "odoo.model.external_system",
         sync_started_at: datetime,
     ) -> None:
-        note_groups = [
-            ("intake", client.fetch_intake_notes(updated_at=start_datetime)),
-            ("diagnostic", client.fetch_diagnostic_notes(updated_at=start_datetime)),
-            ("repair", client.fetch_repair_notes(updated_at=start_datetime)),
-            ("quality_control", client.fetch_quality_control_notes(updated_at=start_datetime)),
-            ("invoice", client.fetch_invoice_notes(updated_at=start_datetime)),
+        # Each note table is streamed only once the previous one has been imported.
+        note_readers = [
+            ("intake", client.iter_intake_notes),
+            ("diagnostic", client.iter_diagnostic_notes),
+            ("repair", client.iter_repair_notes),
+            ("quality_control", client.iter_quality_control_notes),
+            ("invoice", client.iter_invoice_notes),
         ]
-        for note_type, note_rows in note_groups:
-            self._import_note_rows(note_rows, note_type, partner_map, system, sync_started_at)
+        for note_type, read_notes in note_readers:
+            self._import_note_rows(read_notes(updated_at=start_datetime), note_type, partner_map, system, sync_started_at)
 
     def _import_note_rows(
         self,
-        note_rows: list[CmDataNoteRow],
+        note_rows: Iterable[CmDataNoteRow],
         note_type: str,
         partner_map: dict[str, int],
         system: "odoo.model.external_system",
@@ -742,7 +827,7 @@ class CmDataImporter(models.Model):
         start_datetime: datetime | None,
         partner_map: dict[str, int],
     ) -> None:
-        password_rows = client.fetch_passwords(updated_at=start_datetime)
+        password_rows = client.iter_passwords(updated_at=start_datetime)
         password_model = self.env["integration.cm_data.password"].sudo().with_context(IMPORT_CONTEXT)
         commit_interval = self._get_commit_interval()
         processed_count = 0
@@ -781,7 +866,7 @@ class CmDataImporter(models.Model):
 
     def _import_price_lists(
         self,
-        price_list_rows: list[CmDataPriceList],
+        price_list_rows: Iterable[CmDataPriceList],
         system: "odoo.model.external_system",
         sync_started_at: datetime,
     ) -> None:
@@ -881,7 +966,7 @@ class CmDataImporter(models.Model):
 
     def _import_pricing_lines(
         self,
-        line_rows: list[CmDataPricingLine],
+        line_rows: Iterable[CmDataPricingLine],
         catalog_row_map: dict[int, CmDataPricingCatalog],
         catalog_id_map: dict[int, int],
         system: "odoo.model.external_system",
@@ -1135,7 +1220,7 @@ class CmDataImporter(models.Model):
         system: "odoo.model.external_system",
         sync_started_at: datetime,
     ) -> None:
-        model_rows = client.fetch_model_numbers(updated_at=start_datetime)
+        model_rows = client.iter_model_numbers(updated_at=start_datetime)
         device_model = self.env["service.device.model"].sudo().with_context(IMPORT_CONTEXT)
         commit_interval = self._get_commit_interval()
         processed_count = 0
@@ -1167,7 +1252,7 @@ class CmDataImporter(models.Model):
         sync_started_at: datetime,
     ) -> None:
         transport_model = self.env["service.transport.order"].sudo().with_context(IMPORT_CONTEXT)
-        delivery_rows = client.fetch_delivery_logs(updated_at=start_datetime)
+        delivery_rows = client.iter_delivery_logs(updated_at=start_datetime)
         commit_interval = self._get_commit_interval()
         processed_count = 0
         unmatched_locations: dict[str, int] = {}
@@ -1458,7 +1543,7 @@ class CmDataImporter(models.Model):
 
     def _import_pto_usage(
         self,
-        usage_rows: list[CmDataPtoUsage],
+        usage_rows: Iterable[CmDataPtoUsage],
         employee_map: dict[int, int],
         system: "odoo.model.external_system",
         sync_started_at: datetime,
@@ -1492,7 +1577,7 @@ class CmDataImporter(models.Model):
 
     def _import_vacation_usage(
         self,
-        usage_rows: list[CmDataVacationUsage],
+        usage_rows: Iterable[CmDataVacationUsage],
         employee_map: dict[int, int],
         system: "odoo.model.external_system",
         sync_started_at: datetime,
@@ -1554,6 +1639,16 @@ class CmDataImporter(models.Model):
                 if employee_id not in open_attendance_by_employee:
                     open_attendance_by_employee[employee_id] = attendance.id
 
+        # Every punch is compared against one prefetch of the timeclock bindings, and last_sync
+        # stamps are written back in one UPDATE per commit, so unchanged punches cost no queries.
+        timeclock_sync_state = self._prefetch_timeclock_sync_state(system)
+        pending_last_sync: dict[tuple[str, str], datetime] = {}
+
+        def maybe_commit() -> bool:
+            if commit_interval > 0 and processed_count % commit_interval == 0:
+                self._write_external_id_last_sync(system, pending_last_sync)
+            return self._maybe_commit(processed_count, commit_interval, label="attendance")
+
         def punch_sort_key(punch: CmDataTimeclockPunch) -> tuple[int, datetime, int]:
             employee_id = self._resolve_timeclock_employee_id(punch, timeclock_employee_map) or 0
             sort_time = self._resolve_punch_time(punch) or datetime.min
@@ -1574,15 +1669,14 @@ class CmDataImporter(models.Model):
             resource = TIMECLOCK_IN_RESOURCE if punch_kind == "in" else TIMECLOCK_OUT_RESOURCE
             updated_at = self._resolve_punch_updated_at(row) or punch_time
             external_id_value = str(row.record_id)
-            if not self._should_process_external_row(system, external_id_value, resource, updated_at):
+            bound_attendance_id, last_sync = timeclock_sync_state.get((resource, external_id_value), (None, None))
+            if last_sync and last_sync >= updated_at:
                 continue
 
-            attendance_record = attendance_model.search_by_external_id(
-                EXTERNAL_SYSTEM_CODE,
-                external_id_value,
-                resource,
+            attendance_record = (
+                attendance_model.browse(bound_attendance_id).exists() if bound_attendance_id else attendance_model.browse()
             )
-            if attendance_record and attendance_record.exists():
+            if attendance_record:
                 if punch_kind == "in":
                     values: "odoo.values.hr_attendance" = {
                         "employee_id": employee_id,
@@ -1617,9 +1711,9 @@ class CmDataImporter(models.Model):
                             reason=f"timeclock_existing_check_out punch={row.record_id}",
                         )
                     open_attendance_by_employee.pop(employee_id, None)
-                self._mark_external_id_synced(system, external_id_value, resource, updated_at)
+                pending_last_sync[(resource, external_id_value)] = updated_at
                 processed_count += 1
-                if self._maybe_commit(processed_count, commit_interval, label="attendance"):
+                if maybe_commit():
                     attendance_model = self.env["hr.attendance"].sudo().with_context(IMPORT_CONTEXT)
                 continue
 
@@ -1715,10 +1809,11 @@ class CmDataImporter(models.Model):
                 open_attendance_by_employee.pop(employee_id, None)
 
             attendance_record.set_external_id(EXTERNAL_SYSTEM_CODE, external_id_value, resource)
-            self._mark_external_id_synced(system, external_id_value, resource, updated_at)
+            pending_last_sync[(resource, external_id_value)] = updated_at
             processed_count += 1
-            if self._maybe_commit(processed_count, commit_interval, label="attendance"):
+            if maybe_commit():
                 attendance_model = self.env["hr.attendance"].sudo().with_context(IMPORT_CONTEXT)
+        self._write_external_id_last_sync(system, pending_last_sync)
 
         for attendance_id in open_attendance_by_employee.values():
             attendance = attendance_model.browse(attendance_id).exists()
@@ -2391,6 +2486,64 @@ class CmDataImporter(models.Model):
             return True
         return external_id_record.last_sync < updated_at
 
+    def _prefetch_timeclock_sync_state(
+        self,
+        system: "odoo.model.external_system",
+    ) -> dict[tuple[str, str], tuple[int | None, datetime | None]]:
+        external_id_records = (
+            self.env["external.id"]
+            .sudo()
+            .search_fetch(
+                [
+                    ("system_id", "=", system.id),
+                    ("resource", "in", [TIMECLOCK_IN_RESOURCE, TIMECLOCK_OUT_RESOURCE]),
+                ],
+                ["resource", "external_id", "res_model", "res_id", "last_sync"],
+            )
+        )
+        return {
+            (record.resource, record.external_id): (
+                record.res_id if record.res_model == "hr.attendance" else None,
+                record.last_sync or None,
+            )
+            for record in external_id_records
+        }
+
+    def _write_external_id_last_sync(
+        self,
+        system: "odoo.model.external_system",
+        last_sync_by_key: dict[tuple[str, str], datetime],
+    ) -> None:
+        if not last_sync_by_key:
+            return
+        external_id_model = self.env["external.id"].sudo()
+        external_id_model.flush_model()
+        synced_rows = SQL(", ").join(
+            SQL("(%s, %s, %s::timestamp)", resource, external_id_value, sync_timestamp)
+            for (resource, external_id_value), sync_timestamp in last_sync_by_key.items()
+        )
+        self.env.cr.execute(
+            SQL(
+                """
+                UPDATE %(table)s AS external_id
+                   SET last_sync = synced.last_sync,
+                       write_uid = %(uid)s,
+                       write_date = NOW() AT TIME ZONE 'UTC'
+                  FROM (VALUES %(synced_rows)s) AS synced(resource, external_id, last_sync)
+                 WHERE external_id.system_id = %(system_id)s
+                   AND external_id.active
+                   AND external_id.resource = synced.resource
+                   AND external_id.external_id = synced.external_id
+                """,
+                table=SQL.identifier(external_id_model._table),
+                uid=self.env.uid,
+                synced_rows=synced_rows,
+                system_id=system.id,
+            )
+        )
+        external_id_model.invalidate_model(["last_sync", "write_uid", "write_date"])
+        last_sync_by_key.clear()
+
     def _mark_external_id_synced(
         self,
         system: "odoo.model.external_system",
@@ -2442,6 +2595,63 @@ class CmDataImporter(models.Model):
         self._mark_external_id_synced(system, external_id_value, resolved_resource, sync_timestamp)
         return record
 
+    def _get_or_create_many_by_external_id_with_sync(
+        self,
+        record_model: ExternalIdRecordModel,
+        system: "odoo.model.external_system",
+        rows: list[tuple[str, dict[str, object], datetime | None]],
+        *,
+        resource: str,
+        sync_started_at: datetime,
+    ) -> dict[str, ExternalIdRecordModel]:
+        # Batch form of _get_or_create_by_external_id_with_sync: the last_sync check, the
+        # get-or-create and the last_sync stamps each cost one round trip per batch.
+        if not rows:
+            return {}
+        external_id_model = self.env["external.id"].sudo().with_context(active_test=False)
+        external_id_domain = [
+            ("system_id", "=", system.id),
+            ("resource", "=", resource),
+            ("external_id", "in", [external_id_value for external_id_value, _values, _updated_at in rows]),
+        ]
+        external_id_record_by_value = {record.external_id: record for record in external_id_model.search(external_id_domain)}
+
+        records_by_external_id: dict[str, ExternalIdRecordModel] = {}
+        pending_rows: list[tuple[str, dict[str, object], datetime | None]] = []
+        for external_id_value, values, updated_at in rows:
+            external_id_record = external_id_record_by_value.get(external_id_value)
+            if (
+                updated_at
+                and external_id_record
+                and external_id_record.last_sync
+                and external_id_record.last_sync >= updated_at
+                and external_id_record.active
+                and external_id_record.res_model == record_model._name
+            ):
+                records_by_external_id[external_id_value] = record_model.browse(external_id_record.res_id)
+                continue
+            pending_rows.append((external_id_value, values, updated_at))
+        if not pending_rows:
+            return records_by_external_id
+
+        records_by_external_id.update(
+            record_model.get_or_create_by_external_id_many(
+                EXTERNAL_SYSTEM_CODE,
+                [(external_id_value, values) for external_id_value, values, _updated_at in pending_rows],
+                resource,
+            )
+        )
+
+        synced_record_by_value = {record.external_id: record for record in external_id_model.search(external_id_domain)}
+        synced_ids_by_timestamp: dict[datetime, list[int]] = {}
+        for external_id_value, _values, updated_at in pending_rows:
+            synced_record = synced_record_by_value.get(external_id_value)
+            if synced_record:
+                synced_ids_by_timestamp.setdefault(updated_at or sync_started_at, []).append(synced_record.id)
+        for sync_timestamp, synced_ids in synced_ids_by_timestamp.items():
+            external_id_model.browse(synced_ids).write({"last_sync": sync_timestamp})
+        return records_by_external_id
+
     def _get_cm_data_system(self) -> "odoo.model.external_system":
         desired_id_format = r"^[A-Za-z0-9._-]+$"
         system = self.env["external.system"].ensure_system(
@@ -2469,6 +2679,87 @@ class CmDataImporter(models.Model):
     def _set_last_sync_at(self, value: datetime) -> None:
         self.env["ir.config_parameter"].sudo().set_param("cm_data.last_sync_at", fields.Datetime.to_string(value))
 
+    def _get_full_reconcile_interval_hours(self) -> int:
+        return self._get_config_int(
+            "cm_data.full_reconcile_interval_hours",
+            "ENV_OVERRIDE_CONFIG_PARAM__CM_DATA__FULL_RECONCILE_INTERVAL_HOURS",
+            default=24,
+        )
+
+    def _get_phase_state(self) -> dict[str, dict[str, str]]:
+        parameter_model = self.env["ir.config_parameter"].sudo()
+        raw_state = parameter_model.get_param(CM_DATA_PHASE_STATE_PARAM)
+        if not raw_state:
+            return {}
+        try:
+            loaded_state = json.loads(raw_state)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(loaded_state, dict) or loaded_state.get("version") != CM_DATA_PHASE_STATE_VERSION:
+            return {}
+        loaded_phases = loaded_state.get("phases")
+        if not isinstance(loaded_phases, dict):
+            return {}
+        phase_state: dict[str, dict[str, str]] = {}
+        for phase_name, loaded_phase in loaded_phases.items():
+            if phase_name not in CM_DATA_INCREMENTAL_PHASES or not isinstance(loaded_phase, dict):
+                continue
+            phase_state[phase_name] = {
+                marker: loaded_phase[marker]
+                for marker in ("synced_at", "reconciled_at")
+                if self._parse_phase_timestamp(loaded_phase.get(marker))
+            }
+        return phase_state
+
+    def _set_phase_state(self, phase_state: dict[str, dict[str, str]]) -> None:
+        self.env["ir.config_parameter"].sudo().set_param(
+            CM_DATA_PHASE_STATE_PARAM,
+            json.dumps({"version": CM_DATA_PHASE_STATE_VERSION, "phases": phase_state}, sort_keys=True),
+        )
+
+    @staticmethod
+    def _parse_phase_timestamp(value: object) -> datetime | None:
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            return fields.Datetime.from_string(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _get_phase_starts(self, sync_started_at: datetime) -> dict[str, datetime | None]:
+        # A phase without recorded state falls back to the last successful run, which read
+        # every phase; a phase whose last full read is older than the reconcile interval
+        # reads in full again so rows edited without touching updated_at are picked up.
+        phase_state = self._get_phase_state()
+        last_sync_at = self._get_last_sync_at()
+        reconcile_interval_hours = self._get_full_reconcile_interval_hours()
+        reconcile_before = sync_started_at - timedelta(hours=reconcile_interval_hours) if reconcile_interval_hours > 0 else None
+        phase_starts: dict[str, datetime | None] = {}
+        for phase_name in CM_DATA_INCREMENTAL_PHASES:
+            markers = phase_state.get(phase_name, {})
+            synced_at = self._parse_phase_timestamp(markers.get("synced_at")) or last_sync_at
+            reconciled_at = self._parse_phase_timestamp(markers.get("reconciled_at")) or last_sync_at
+            if not synced_at or not reconciled_at or (reconcile_before and reconciled_at <= reconcile_before):
+                phase_starts[phase_name] = None
+            else:
+                phase_starts[phase_name] = synced_at
+        return phase_starts
+
+    def _complete_phase(
+        self,
+        phase_name: str,
+        phase_starts: dict[str, datetime | None],
+        sync_started_at: datetime,
+    ) -> None:
+        if phase_name not in phase_starts:
+            return
+        phase_state = self._get_phase_state()
+        markers = phase_state.setdefault(phase_name, {})
+        markers["synced_at"] = fields.Datetime.to_string(sync_started_at)
+        if phase_starts[phase_name] is None:
+            markers["reconciled_at"] = fields.Datetime.to_string(sync_started_at)
+        self._set_phase_state(phase_state)
+
     @api.model
     def _get_placeholder_attendance_health_snapshot(self) -> dict[str, object]:
         external_id_model = self.env["external.id"].sudo().with_context(active_test=False)
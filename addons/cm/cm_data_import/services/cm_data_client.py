@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
@@ -13,6 +13,7 @@ _logger = logging.getLogger(__name__)
 
 SCHOOL_INFORMATION_DATABASE = "school_information"
 PRICING_DATABASE = "pricing"
+CM_DATA_PAGE_SIZE = 1000
 
 
 @dataclass(frozen=True)
@@ -297,6 +298,9 @@ class CmDataClient:
         self._connection = None
 
     def fetch_account_names(self, updated_at: datetime | None) -> list[CmDataAccountName]:
+        return list(self.iter_account_names(updated_at))
+
+    def iter_account_names(self, updated_at: datetime | None) -> Iterator[CmDataAccountName]:
         columns = [
             "id",
             "account_name",
@@ -313,37 +317,36 @@ class CmDataClient:
             "location_drop",
             "updated_at",
         ]
-        rows = self._fetch_table_rows(
+        rows = self._iter_table_rows(
             "account_names",
             columns,
             updated_at=updated_at,
         )
-        results: list[CmDataAccountName] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="account_names.id")
             account_name = _require_text(row.get("account_name"), field_name="account_names.account_name")
-            results.append(
-                CmDataAccountName(
-                    record_id=record_id,
-                    account_name=account_name,
-                    ticket_name=_to_text(row.get("ticket_name")),
-                    ticket_name_report=_to_text(row.get("ticket_name_report")),
-                    label_names=_to_text(row.get("label_names")),
-                    claim_name_list=_to_text(row.get("claim_name_list")),
-                    multi_building_flag=_to_bool(row.get("multi_building_flag")),
-                    price_list=_to_text(row.get("price_list")),
-                    price_list_2=_to_text(row.get("price_list_2")),
-                    priority_flag=_to_bool(row.get("priority_flag")),
-                    on_delivery_schedule=_to_bool(row.get("on_delivery_schedule")),
-                    shipping_enable=_to_bool(row.get("shipping_enable")),
-                    location_drop=_to_text(row.get("location_drop")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                )
+            yield CmDataAccountName(
+                record_id=record_id,
+                account_name=account_name,
+                ticket_name=_to_text(row.get("ticket_name")),
+                ticket_name_report=_to_text(row.get("ticket_name_report")),
+                label_names=_to_text(row.get("label_names")),
+                claim_name_list=_to_text(row.get("claim_name_list")),
+                multi_building_flag=_to_bool(row.get("multi_building_flag")),
+                price_list=_to_text(row.get("price_list")),
+                price_list_2=_to_text(row.get("price_list_2")),
+                priority_flag=_to_bool(row.get("priority_flag")),
+                on_delivery_schedule=_to_bool(row.get("on_delivery_schedule")),
+                shipping_enable=_to_bool(row.get("shipping_enable")),
+                location_drop=_to_text(row.get("location_drop")),
+                updated_at=_to_datetime(row.get("updated_at")),
             )
-        return results
 
     def fetch_contacts(self, updated_at: datetime | None) -> list[CmDataContact]:
-        rows = self._fetch_table_rows(
+        return list(self.iter_contacts(updated_at))
+
+    def iter_contacts(self, updated_at: datetime | None) -> Iterator[CmDataContact]:
+        rows = self._iter_table_rows(
             "who_to_contact",
             [
                 "id",
@@ -355,24 +358,20 @@ class CmDataClient:
             ],
             updated_at=updated_at,
         )
-        results: list[CmDataContact] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="who_to_contact.id")
             account_name = _require_text(row.get("account_name"), field_name="who_to_contact.account_name")
-            results.append(
-                CmDataContact(
-                    record_id=record_id,
-                    account_name=account_name,
-                    sub_name=_to_text(row.get("sub_name")),
-                    contact_notes=_to_text(row.get("contact_notes")),
-                    sort_order=_to_int(row.get("sort_order")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                )
+            yield CmDataContact(
+                record_id=record_id,
+                account_name=account_name,
+                sub_name=_to_text(row.get("sub_name")),
+                contact_notes=_to_text(row.get("contact_notes")),
+                sort_order=_to_int(row.get("sort_order")),
+                updated_at=_to_datetime(row.get("updated_at")),
             )
-        return results
 
-    def fetch_delivery_logs(self, updated_at: datetime | None) -> list[CmDataDeliveryLog]:
-        rows = self._fetch_table_rows(
+    def iter_delivery_logs(self, updated_at: datetime | None) -> Iterator[CmDataDeliveryLog]:
+        rows = self._iter_table_rows(
             "delivery_log",
             [
                 "id",
@@ -390,31 +389,30 @@ class CmDataClient:
             ],
             updated_at=updated_at,
         )
-        results: list[CmDataDeliveryLog] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="delivery_log.id")
             location_name = _require_text(row.get("location_name"), field_name="delivery_log.location_name")
             status = _require_text(row.get("status"), field_name="delivery_log.status")
-            results.append(
-                CmDataDeliveryLog(
-                    record_id=record_id,
-                    location_id=_to_int(row.get("location_id")),
-                    location_name=location_name,
-                    status=status,
-                    units=_to_int(row.get("units")) or 0,
-                    discord_id=_to_int(row.get("discord_id")),
-                    discord_name=_to_text(row.get("discord_name")),
-                    notes=_to_text(row.get("notes")),
-                    edit_notes=_to_text(row.get("edit_notes")),
-                    ocr_notes=_to_text(row.get("ocr_notes")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                )
+            yield CmDataDeliveryLog(
+                record_id=record_id,
+                location_id=_to_int(row.get("location_id")),
+                location_name=location_name,
+                status=status,
+                units=_to_int(row.get("units")) or 0,
+                discord_id=_to_int(row.get("discord_id")),
+                discord_name=_to_text(row.get("discord_name")),
+                notes=_to_text(row.get("notes")),
+                edit_notes=_to_text(row.get("edit_notes")),
+                ocr_notes=_to_text(row.get("ocr_notes")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=_to_datetime(row.get("updated_at")),
             )
-        return results
 
     def fetch_directions(self, updated_at: datetime | None) -> list[CmDataDirection]:
-        rows = self._fetch_table_rows(
+        return list(self.iter_directions(updated_at))
+
+    def iter_directions(self, updated_at: datetime | None) -> Iterator[CmDataDirection]:
+        rows = self._iter_table_rows(
             "directions",
             [
                 "id",
@@ -441,41 +439,37 @@ class CmDataClient:
             ],
             updated_at=updated_at,
         )
-        results: list[CmDataDirection] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="directions.id")
             account_name = _require_text(row.get("account_name"), field_name="directions.account_name")
             ticket_title_name = _to_text(row.get("ticket_title_name")) or account_name
             school_name = _to_text(row.get("school_name")) or account_name
-            results.append(
-                CmDataDirection(
-                    record_id=record_id,
-                    account_name=account_name,
-                    ticket_title_name=ticket_title_name,
-                    school_name=school_name,
-                    delivery_day=_to_text(row.get("delivery_day")),
-                    address=_to_text(row.get("address")),
-                    directions=_to_text(row.get("directions")),
-                    contact=_to_text(row.get("contact")),
-                    priority=_to_bool(row.get("priority")),
-                    on_schedule_flag=_to_bool(row.get("on_schedule_flag")),
-                    delivery_order=_to_float(row.get("delivery_order")),
-                    longitude=_to_float(row.get("longitude")),
-                    latitude=_to_float(row.get("latitude")),
-                    available_start=_to_text(row.get("available_start")),
-                    available_end=_to_text(row.get("available_end")),
-                    break_start=_to_text(row.get("break_start")),
-                    break_end=_to_text(row.get("break_end")),
-                    est_arrival_time=_to_text(row.get("est_arrival_time")),
-                    shipping_enabled_flag=_to_bool(row.get("shipping_enabled_flag")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                )
+            yield CmDataDirection(
+                record_id=record_id,
+                account_name=account_name,
+                ticket_title_name=ticket_title_name,
+                school_name=school_name,
+                delivery_day=_to_text(row.get("delivery_day")),
+                address=_to_text(row.get("address")),
+                directions=_to_text(row.get("directions")),
+                contact=_to_text(row.get("contact")),
+                priority=_to_bool(row.get("priority")),
+                on_schedule_flag=_to_bool(row.get("on_schedule_flag")),
+                delivery_order=_to_float(row.get("delivery_order")),
+                longitude=_to_float(row.get("longitude")),
+                latitude=_to_float(row.get("latitude")),
+                available_start=_to_text(row.get("available_start")),
+                available_end=_to_text(row.get("available_end")),
+                break_start=_to_text(row.get("break_start")),
+                break_end=_to_text(row.get("break_end")),
+                est_arrival_time=_to_text(row.get("est_arrival_time")),
+                shipping_enabled_flag=_to_bool(row.get("shipping_enabled_flag")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=_to_datetime(row.get("updated_at")),
             )
-        return results
 
-    def fetch_shipping_instructions(self, updated_at: datetime | None) -> list[CmDataShippingInstruction]:
-        rows = self._fetch_table_rows(
+    def iter_shipping_instructions(self, updated_at: datetime | None) -> Iterator[CmDataShippingInstruction]:
+        rows = self._iter_table_rows(
             "shipping_instructions",
             [
                 "id",
@@ -509,7 +503,6 @@ class CmDataClient:
             updated_at=updated_at,
             updated_column=None,
         )
-        results: list[CmDataShippingInstruction] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="shipping_instructions.id")
             account_name = _require_text(
@@ -520,56 +513,53 @@ class CmDataClient:
                 row.get("address_key"),
                 field_name="shipping_instructions.address_key",
             )
-            results.append(
-                CmDataShippingInstruction(
-                    record_id=record_id,
-                    account_name=account_name,
-                    address_key=address_key,
-                    inbound_carrier=_to_text(row.get("inbound_carrier")),
-                    inbound_service=_to_text(row.get("inbound_service")),
-                    outbound_carrier=_to_text(row.get("outbound_carrier")),
-                    outbound_service=_to_text(row.get("outbound_service")),
-                    to_address_name=_to_text(row.get("to_address_name")),
-                    to_address_company=_to_text(row.get("to_address_company")),
-                    to_address_street1=_to_text(row.get("to_address_street1")),
-                    to_address_street2=_to_text(row.get("to_address_street2")),
-                    to_address_city=_to_text(row.get("to_address_city")),
-                    to_address_state=_to_text(row.get("to_address_state")),
-                    to_address_zip=_to_text(row.get("to_address_zip")),
-                    to_address_country=_to_text(row.get("to_address_country")),
-                    to_address_phone=_to_text(row.get("to_address_phone")),
-                    to_address_email=_to_text(row.get("to_address_email")),
-                    to_address_residential_flag=_to_bool(row.get("to_address_residential_flag")),
-                    parcel_length=_to_float(row.get("parcel_length")),
-                    parcel_width=_to_float(row.get("parcel_width")),
-                    parcel_height=_to_float(row.get("parcel_height")),
-                    parcel_weight=_to_float(row.get("parcel_weight")),
-                    options_print_custom_1=_to_text(row.get("options_print_custom_1")),
-                    options_print_custom_2=_to_text(row.get("options_print_custom_2")),
-                    options_label_format=_to_text(row.get("options_label_format")),
-                    options_label_size=_to_text(row.get("options_label_size")),
-                    options_hazmat=_to_text(row.get("options_hazmat")),
-                )
+            yield CmDataShippingInstruction(
+                record_id=record_id,
+                account_name=account_name,
+                address_key=address_key,
+                inbound_carrier=_to_text(row.get("inbound_carrier")),
+                inbound_service=_to_text(row.get("inbound_service")),
+                outbound_carrier=_to_text(row.get("outbound_carrier")),
+                outbound_service=_to_text(row.get("outbound_service")),
+                to_address_name=_to_text(row.get("to_address_name")),
+                to_address_company=_to_text(row.get("to_address_company")),
+                to_address_street1=_to_text(row.get("to_address_street1")),
+                to_address_street2=_to_text(row.get("to_address_street2")),
+                to_address_city=_to_text(row.get("to_address_city")),
+                to_address_state=_to_text(row.get("to_address_state")),
+                to_address_zip=_to_text(row.get("to_address_zip")),
+                to_address_country=_to_text(row.get("to_address_country")),
+                to_address_phone=_to_text(row.get("to_address_phone")),
+                to_address_email=_to_text(row.get("to_address_email")),
+                to_address_residential_flag=_to_bool(row.get("to_address_residential_flag")),
+                parcel_length=_to_float(row.get("parcel_length")),
+                parcel_width=_to_float(row.get("parcel_width")),
+                parcel_height=_to_float(row.get("parcel_height")),
+                parcel_weight=_to_float(row.get("parcel_weight")),
+                options_print_custom_1=_to_text(row.get("options_print_custom_1")),
+                options_print_custom_2=_to_text(row.get("options_print_custom_2")),
+                options_label_format=_to_text(row.get("options_label_format")),
+                options_label_size=_to_text(row.get("options_label_size")),
+                options_hazmat=_to_text(row.get("options_hazmat")),
             )
-        return results
 
-    def fetch_intake_notes(self, updated_at: datetime | None) -> list[CmDataNoteRow]:
-        return self._fetch_note_rows("intake", "intake_notes", updated_at)
+    def iter_intake_notes(self, updated_at: datetime | None) -> Iterator[CmDataNoteRow]:
+        return self._iter_note_rows("intake", "intake_notes", updated_at)
 
-    def fetch_diagnostic_notes(self, updated_at: datetime | None) -> list[CmDataNoteRow]:
-        return self._fetch_note_rows("diagnostics", "diagnostic_notes", updated_at)
+    def iter_diagnostic_notes(self, updated_at: datetime | None) -> Iterator[CmDataNoteRow]:
+        return self._iter_note_rows("diagnostics", "diagnostic_notes", updated_at)
 
-    def fetch_repair_notes(self, updated_at: datetime | None) -> list[CmDataNoteRow]:
-        return self._fetch_note_rows("repair", "repair_notes", updated_at)
+    def iter_repair_notes(self, updated_at: datetime | None) -> Iterator[CmDataNoteRow]:
+        return self._iter_note_rows("repair", "repair_notes", updated_at)
 
-    def fetch_quality_control_notes(self, updated_at: datetime | None) -> list[CmDataNoteRow]:
-        return self._fetch_note_rows("qc", "qc_notes", updated_at)
+    def iter_quality_control_notes(self, updated_at: datetime | None) -> Iterator[CmDataNoteRow]:
+        return self._iter_note_rows("qc", "qc_notes", updated_at)
 
-    def fetch_invoice_notes(self, updated_at: datetime | None) -> list[CmDataNoteRow]:
-        return self._fetch_note_rows("invoice", "invoice_notes", updated_at)
+    def iter_invoice_notes(self, updated_at: datetime | None) -> Iterator[CmDataNoteRow]:
+        return self._iter_note_rows("invoice", "invoice_notes", updated_at)
 
-    def fetch_passwords(self, updated_at: datetime | None) -> list[CmDataPassword]:
-        rows = self._fetch_table_rows(
+    def iter_passwords(self, updated_at: datetime | None) -> Iterator[CmDataPassword]:
+        rows = self._iter_table_rows(
             "passwords",
             [
                 "account_name",
@@ -581,27 +571,24 @@ class CmDataClient:
                 "updated_at",
             ],
             updated_at=updated_at,
+            key_column=None,
         )
-        results: list[CmDataPassword] = []
         for row in rows:
             account_name = _require_text(row.get("account_name"), field_name="passwords.account_name")
             sub_name = _to_text(row.get("sub_name"))
             updated_at_value = _to_datetime(row.get("updated_at")) or _to_datetime(row.get("created_at"))
-            results.append(
-                CmDataPassword(
-                    account_name=account_name,
-                    sub_name=sub_name,
-                    user_name=_to_text(row.get("user_name")),
-                    password=_to_text(row.get("password")),
-                    notes=_to_text(row.get("notes")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=updated_at_value,
-                )
+            yield CmDataPassword(
+                account_name=account_name,
+                sub_name=sub_name,
+                user_name=_to_text(row.get("user_name")),
+                password=_to_text(row.get("password")),
+                notes=_to_text(row.get("notes")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=updated_at_value,
             )
-        return results
 
-    def fetch_price_lists(self, updated_at: datetime | None) -> list[CmDataPriceList]:
-        rows = self._fetch_table_rows(
+    def iter_price_lists(self, updated_at: datetime | None) -> Iterator[CmDataPriceList]:
+        rows = self._iter_table_rows(
             "price_lists",
             [
                 "id",
@@ -611,22 +598,21 @@ class CmDataClient:
             ],
             updated_at=updated_at,
         )
-        results: list[CmDataPriceList] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="price_lists.id")
             updated_at_value = _to_datetime(row.get("updated_at")) or _to_datetime(row.get("created_at"))
-            results.append(
-                CmDataPriceList(
-                    record_id=record_id,
-                    link=_to_text(row.get("link")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=updated_at_value,
-                )
+            yield CmDataPriceList(
+                record_id=record_id,
+                link=_to_text(row.get("link")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=updated_at_value,
             )
-        return results
 
     def fetch_pricing_catalogs(self, updated_at: datetime | None) -> list[CmDataPricingCatalog]:
-        rows = self._fetch_table_rows(
+        return list(self.iter_pricing_catalogs(updated_at))
+
+    def iter_pricing_catalogs(self, updated_at: datetime | None) -> Iterator[CmDataPricingCatalog]:
+        rows = self._iter_table_rows(
             "pricing_catalog",
             [
                 "id",
@@ -641,26 +627,22 @@ class CmDataClient:
             updated_at=updated_at,
             database=PRICING_DATABASE,
         )
-        results: list[CmDataPricingCatalog] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="pricing_catalog.id")
             updated_at_value = _to_datetime(row.get("updated_at")) or _to_datetime(row.get("created_at"))
-            results.append(
-                CmDataPricingCatalog(
-                    record_id=record_id,
-                    code=_require_text(row.get("code"), field_name="pricing_catalog.code"),
-                    name=_require_text(row.get("name"), field_name="pricing_catalog.name"),
-                    partner_label=_to_text(row.get("partner_label")),
-                    active=_to_bool(row.get("active")),
-                    notes=_to_text(row.get("notes")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=updated_at_value,
-                )
+            yield CmDataPricingCatalog(
+                record_id=record_id,
+                code=_require_text(row.get("code"), field_name="pricing_catalog.code"),
+                name=_require_text(row.get("name"), field_name="pricing_catalog.name"),
+                partner_label=_to_text(row.get("partner_label")),
+                active=_to_bool(row.get("active")),
+                notes=_to_text(row.get("notes")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=updated_at_value,
             )
-        return results
 
-    def fetch_pricing_lines(self, updated_at: datetime | None) -> list[CmDataPricingLine]:
-        rows = self._fetch_table_rows(
+    def iter_pricing_lines(self, updated_at: datetime | None) -> Iterator[CmDataPricingLine]:
+        rows = self._iter_table_rows(
             "pricing_line",
             [
                 "id",
@@ -678,29 +660,25 @@ class CmDataClient:
             updated_at=updated_at,
             database=PRICING_DATABASE,
         )
-        results: list[CmDataPricingLine] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="pricing_line.id")
             updated_at_value = _to_datetime(row.get("updated_at")) or _to_datetime(row.get("created_at"))
-            results.append(
-                CmDataPricingLine(
-                    record_id=record_id,
-                    catalog_id=_require_int(row.get("catalog_id"), field_name="pricing_line.catalog_id"),
-                    model_label=_require_text(row.get("model_label"), field_name="pricing_line.model_label"),
-                    repair_label=_require_text(row.get("repair_label"), field_name="pricing_line.repair_label"),
-                    price=_to_float(row.get("price")),
-                    currency=_to_text(row.get("currency")),
-                    active=_to_bool(row.get("active")),
-                    source_batch=_to_text(row.get("source_batch")),
-                    source_file=_to_text(row.get("source_file")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=updated_at_value,
-                )
+            yield CmDataPricingLine(
+                record_id=record_id,
+                catalog_id=_require_int(row.get("catalog_id"), field_name="pricing_line.catalog_id"),
+                model_label=_require_text(row.get("model_label"), field_name="pricing_line.model_label"),
+                repair_label=_require_text(row.get("repair_label"), field_name="pricing_line.repair_label"),
+                price=_to_float(row.get("price")),
+                currency=_to_text(row.get("currency")),
+                active=_to_bool(row.get("active")),
+                source_batch=_to_text(row.get("source_batch")),
+                source_file=_to_text(row.get("source_file")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=updated_at_value,
             )
-        return results
 
-    def fetch_model_numbers(self, updated_at: datetime | None) -> list[CmDataModelNumber]:
-        rows = self._fetch_table_rows(
+    def iter_model_numbers(self, updated_at: datetime | None) -> Iterator[CmDataModelNumber]:
+        rows = self._iter_table_rows(
             "model_numbers",
             [
                 "id",
@@ -710,22 +688,21 @@ class CmDataClient:
             ],
             updated_at=updated_at,
         )
-        results: list[CmDataModelNumber] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="model_numbers.id")
             model = _require_text(row.get("model"), field_name="model_numbers.model")
-            results.append(
-                CmDataModelNumber(
-                    record_id=record_id,
-                    model=model,
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                )
+            yield CmDataModelNumber(
+                record_id=record_id,
+                model=model,
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=_to_datetime(row.get("updated_at")),
             )
-        return results
 
     def fetch_employees(self, updated_at: datetime | None) -> list[CmDataEmployee]:
-        rows = self._fetch_table_rows(
+        return list(self.iter_employees(updated_at))
+
+    def iter_employees(self, updated_at: datetime | None) -> Iterator[CmDataEmployee]:
+        rows = self._iter_table_rows(
             "employees",
             [
                 "id",
@@ -749,33 +726,29 @@ class CmDataClient:
             updated_column=None,
             database="employee",
         )
-        results: list[CmDataEmployee] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="employees.id")
-            results.append(
-                CmDataEmployee(
-                    record_id=record_id,
-                    legal_name=_to_text(row.get("legal_name")),
-                    legal_last=_to_text(row.get("legal_last")),
-                    legal_first=_to_text(row.get("legal_first")),
-                    name=_to_text(row.get("name")),
-                    repairshopr_id=_to_int(row.get("repairshopr_id")),
-                    timeclock_id=_to_int(row.get("timeclock_id")),
-                    discord_id=_to_int(row.get("discord_id")),
-                    grafana_username=_to_text(row.get("grafana_username")),
-                    date_of_hire=_to_datetime(row.get("date_of_hire")),
-                    date_of_birth=_to_datetime(row.get("date_of_birth")),
-                    last_day=_to_datetime(row.get("last_day")),
-                    dept=_to_text(row.get("dept")),
-                    team=_to_text(row.get("team")),
-                    active=_to_bool(row.get("active")),
-                    on_site=_to_bool(row.get("on_site")),
-                )
+            yield CmDataEmployee(
+                record_id=record_id,
+                legal_name=_to_text(row.get("legal_name")),
+                legal_last=_to_text(row.get("legal_last")),
+                legal_first=_to_text(row.get("legal_first")),
+                name=_to_text(row.get("name")),
+                repairshopr_id=_to_int(row.get("repairshopr_id")),
+                timeclock_id=_to_int(row.get("timeclock_id")),
+                discord_id=_to_int(row.get("discord_id")),
+                grafana_username=_to_text(row.get("grafana_username")),
+                date_of_hire=_to_datetime(row.get("date_of_hire")),
+                date_of_birth=_to_datetime(row.get("date_of_birth")),
+                last_day=_to_datetime(row.get("last_day")),
+                dept=_to_text(row.get("dept")),
+                team=_to_text(row.get("team")),
+                active=_to_bool(row.get("active")),
+                on_site=_to_bool(row.get("on_site")),
             )
-        return results
 
-    def fetch_pto_usage(self, updated_at: datetime | None) -> list[CmDataPtoUsage]:
-        rows = self._fetch_table_rows(
+    def iter_pto_usage(self, updated_at: datetime | None) -> Iterator[CmDataPtoUsage]:
+        rows = self._iter_table_rows(
             "pto_usage",
             [
                 "id",
@@ -791,26 +764,22 @@ class CmDataClient:
             updated_at=updated_at,
             database="employee",
         )
-        results: list[CmDataPtoUsage] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="pto_usage.id")
-            results.append(
-                CmDataPtoUsage(
-                    record_id=record_id,
-                    used_at=_to_datetime(row.get("used_at")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                    pay_period_ending=_to_datetime(row.get("pay_period_ending")),
-                    employee_id=_to_int(row.get("employee_id")),
-                    name=_to_text(row.get("name")),
-                    usage=_to_float(row.get("usage")),
-                    notes=_to_text(row.get("notes")),
-                    added_by=_to_text(row.get("added_by")),
-                )
+            yield CmDataPtoUsage(
+                record_id=record_id,
+                used_at=_to_datetime(row.get("used_at")),
+                updated_at=_to_datetime(row.get("updated_at")),
+                pay_period_ending=_to_datetime(row.get("pay_period_ending")),
+                employee_id=_to_int(row.get("employee_id")),
+                name=_to_text(row.get("name")),
+                usage=_to_float(row.get("usage")),
+                notes=_to_text(row.get("notes")),
+                added_by=_to_text(row.get("added_by")),
             )
-        return results
 
-    def fetch_vacation_usage(self, updated_at: datetime | None) -> list[CmDataVacationUsage]:
-        rows = self._fetch_table_rows(
+    def iter_vacation_usage(self, updated_at: datetime | None) -> Iterator[CmDataVacationUsage]:
+        rows = self._iter_table_rows(
             "vacation_usage",
             [
                 "id",
@@ -826,26 +795,25 @@ class CmDataClient:
             updated_at=updated_at,
             database="employee",
         )
-        results: list[CmDataVacationUsage] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="vacation_usage.id")
-            results.append(
-                CmDataVacationUsage(
-                    record_id=record_id,
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=_to_datetime(row.get("updated_at")),
-                    date_of=_to_datetime(row.get("date_of")),
-                    employee_id=_to_int(row.get("employee_id")),
-                    name=_to_text(row.get("name")),
-                    usage_hours=_to_float(row.get("vacation_usage_hours")),
-                    notes=_to_text(row.get("notes")),
-                    added_by=_to_text(row.get("added_by")),
-                )
+            yield CmDataVacationUsage(
+                record_id=record_id,
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=_to_datetime(row.get("updated_at")),
+                date_of=_to_datetime(row.get("date_of")),
+                employee_id=_to_int(row.get("employee_id")),
+                name=_to_text(row.get("name")),
+                usage_hours=_to_float(row.get("vacation_usage_hours")),
+                notes=_to_text(row.get("notes")),
+                added_by=_to_text(row.get("added_by")),
             )
-        return results
 
     def fetch_timeclock_punches(self, updated_at: datetime | None) -> list[CmDataTimeclockPunch]:
-        rows = self._fetch_table_rows(
+        return list(self.iter_timeclock_punches(updated_at))
+
+    def iter_timeclock_punches(self, updated_at: datetime | None) -> Iterator[CmDataTimeclockPunch]:
+        rows = self._iter_table_rows(
             "timeclock_punches",
             [
                 "id",
@@ -872,36 +840,32 @@ class CmDataClient:
             updated_column=None,
             database="payroll-report",
         )
-        results: list[CmDataTimeclockPunch] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name="timeclock_punches.id")
-            results.append(
-                CmDataTimeclockPunch(
-                    record_id=record_id,
-                    compnum=_to_int(row.get("compnum")),
-                    user_id=_to_int(row.get("user_id")),
-                    check_type=_to_text(row.get("check_type")),
-                    check_time=_to_datetime(row.get("check_time")),
-                    sensor_id=_to_text(row.get("sensor_id")),
-                    checked=_to_text(row.get("checked")),
-                    reason=_to_text(row.get("reason")),
-                    work_type=_to_int(row.get("work_type")),
-                    check_number=_to_text(row.get("check_number")),
-                    created_by=_to_text(row.get("created_by")),
-                    edited_by=_to_text(row.get("edited_by")),
-                    created_date=_to_datetime(row.get("created_date")),
-                    edited_day=_to_datetime(row.get("edited_day")),
-                    locked=_to_bool(row.get("locked")),
-                    time_received=_to_datetime(row.get("time_received")),
-                    exception=_to_text(row.get("exception")),
-                    dept_code=_to_int(row.get("dept_code")),
-                    comment=_to_text(row.get("comment")),
-                )
+            yield CmDataTimeclockPunch(
+                record_id=record_id,
+                compnum=_to_int(row.get("compnum")),
+                user_id=_to_int(row.get("user_id")),
+                check_type=_to_text(row.get("check_type")),
+                check_time=_to_datetime(row.get("check_time")),
+                sensor_id=_to_text(row.get("sensor_id")),
+                checked=_to_text(row.get("checked")),
+                reason=_to_text(row.get("reason")),
+                work_type=_to_int(row.get("work_type")),
+                check_number=_to_text(row.get("check_number")),
+                created_by=_to_text(row.get("created_by")),
+                edited_by=_to_text(row.get("edited_by")),
+                created_date=_to_datetime(row.get("created_date")),
+                edited_day=_to_datetime(row.get("edited_day")),
+                locked=_to_bool(row.get("locked")),
+                time_received=_to_datetime(row.get("time_received")),
+                exception=_to_text(row.get("exception")),
+                dept_code=_to_int(row.get("dept_code")),
+                comment=_to_text(row.get("comment")),
             )
-        return results
 
-    def _fetch_note_rows(self, table: str, note_column: str, updated_at: datetime | None) -> list[CmDataNoteRow]:
-        rows = self._fetch_table_rows(
+    def _iter_note_rows(self, table: str, note_column: str, updated_at: datetime | None) -> Iterator[CmDataNoteRow]:
+        rows = self._iter_table_rows(
             table,
             [
                 "id",
@@ -914,25 +878,21 @@ class CmDataClient:
             ],
             updated_at=updated_at,
         )
-        results: list[CmDataNoteRow] = []
         for row in rows:
             record_id = _require_int(row.get("id"), field_name=f"{table}.id")
             account_name = _require_text(row.get("account_name"), field_name=f"{table}.account_name")
             updated_at_value = _to_datetime(row.get("updated_at")) or _to_datetime(row.get("created_at"))
-            results.append(
-                CmDataNoteRow(
-                    record_id=record_id,
-                    account_name=account_name,
-                    sub_name=_to_text(row.get("sub_name")),
-                    note=_to_text(row.get(note_column)),
-                    sort_order=_to_int(row.get("sort_order")),
-                    created_at=_to_datetime(row.get("created_at")),
-                    updated_at=updated_at_value,
-                )
+            yield CmDataNoteRow(
+                record_id=record_id,
+                account_name=account_name,
+                sub_name=_to_text(row.get("sub_name")),
+                note=_to_text(row.get(note_column)),
+                sort_order=_to_int(row.get("sort_order")),
+                created_at=_to_datetime(row.get("created_at")),
+                updated_at=updated_at_value,
             )
-        return results
 
-    def _fetch_table_rows(
+    def _iter_table_rows(
         self,
         table: str,
         columns: list[str],
@@ -940,15 +900,48 @@ class CmDataClient:
         updated_at: datetime | None,
         updated_column: str | None = "updated_at",
         database: str | None = None,
-    ) -> list[RowData]:
+        key_column: str | None = "id",
+    ) -> Iterator[RowData]:
         column_list = ", ".join(f"`{column}`" for column in columns)
         database_name = database or self._database
         query = f"SELECT {column_list} FROM `{database_name}`.`{table}`"
+        conditions: list[str] = []
         parameters: list[QueryParameter] = []
         if updated_at and updated_column:
-            query = f"{query} WHERE `{updated_column}` >= %s"
+            conditions.append(f"`{updated_column}` >= %s")
             parameters.append(updated_at)
-        return self._fetch_rows(query, parameters or None)
+        if key_column is None:
+            where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+            yield from self._stream_rows(f"{query}{where_clause}", parameters or None)
+            return
+
+        # Keyset pages keep at most one page in memory and let a dropped connection retry
+        # just the current page instead of restarting the whole table.
+        last_key: int | None = None
+        while True:
+            page_conditions = list(conditions)
+            page_parameters = list(parameters)
+            if last_key is not None:
+                page_conditions.append(f"`{key_column}` > %s")
+                page_parameters.append(last_key)
+            where_clause = f" WHERE {' AND '.join(page_conditions)}" if page_conditions else ""
+            page_parameters.append(CM_DATA_PAGE_SIZE)
+            rows = self._fetch_rows(f"{query}{where_clause} ORDER BY `{key_column}` LIMIT %s", page_parameters)
+            yield from rows
+            if len(rows) < CM_DATA_PAGE_SIZE:
+                return
+            last_key = _require_int(rows[-1].get(key_column), field_name=f"{table}.{key_column}")
+
+    def _stream_rows(self, query: str, parameters: Sequence[QueryParameter] | None) -> Iterator[RowData]:
+        if self._connection is None:
+            self._connection = self._open_connection()
+        cursor = self._connection.cursor(pymysql.cursors.SSDictCursor)
+        try:
+            cursor.execute(query, parameters)
+            while rows := cursor.fetchmany(CM_DATA_PAGE_SIZE):
+                yield from rows
+        finally:
+            cursor.close()
 
     def _fetch_rows(self, query: str, parameters: Sequence[QueryParameter] | None) -> list[RowData]:
         for attempt in range(2):
@@ -960,8 +953,7 @@ class CmDataClient:
             try:
                 with connection.cursor(pymysql.cursors.DictCursor) as cursor:
                     cursor.execute(query, parameters)
-                    rows = [dict(row) for row in cursor.fetchall()]
-                return rows
+                    return list(cursor.fetchall())
             except (pymysql.err.OperationalError, pymysql.err.InterfaceError) as exc:
                 error_code = exc.args[0] if exc.args else None
                 if error_code not in {2006, 2013} or attempt:
@@ -2,14 +2,18 @@
 
 from . import (
     test_account_partner_lookup,
+    test_cm_data_client_paging,
     test_employee_external_identity_migration,
+    test_phase_watermarks,
     test_timeclock_employee_mapping,
     test_validation_health_snapshot,
 )
 
 __all__ = [
     "test_account_partner_lookup",
+    "test_cm_data_client_paging",
     "test_employee_external_identity_migration",
+    "test_phase_watermarks",
     "test_timeclock_employee_mapping",
     "test_validation_health_snapshot",
 ]
@@ -0,0 +1,44 @@
+from ...services import cm_data_client as _cm_data_client_module
+from ...services.cm_data_client import CmDataClient, CmDataConnectionSettings
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+
+def _model_row(record_id: int) -> dict[str, object]:
+    return {"id": record_id, "model": f"M-{record_id}", "updated_at": None}
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestCmDataClientPaging(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = CmDataClient(CmDataConnectionSettings(host="cm-data.invalid", user="reader", password="secret"))
+
+    def test_iter_model_numbers_pages_by_id(self) -> None:
+        pages = [[_model_row(1), _model_row(2)], [_model_row(5)]]
+        with (
+            common.patch.object(_cm_data_client_module, "CM_DATA_PAGE_SIZE", 2),
+            common.patch.object(CmDataClient, "_fetch_rows", autospec=True, side_effect=pages) as fetch_mock,
+        ):
+            rows = list(self.client.iter_model_numbers(updated_at=None))
+
+        self.assertEqual([row.record_id for row in rows], [1, 2, 5])
+        self.assertEqual(fetch_mock.call_count, 2)
+        first_query, first_parameters = fetch_mock.call_args_list[0].args[1:]
+        second_query, second_parameters = fetch_mock.call_args_list[1].args[1:]
+        self.assertNotIn("`id` >", first_query)
+        self.assertIn("ORDER BY `id` LIMIT %s", first_query)
+        self.assertEqual(first_parameters, [2])
+        self.assertIn("`id` > %s", second_query)
+        self.assertEqual(second_parameters, [2, 2])
+
+    def test_iter_model_numbers_reads_lazily(self) -> None:
+        with (
+            common.patch.object(_cm_data_client_module, "CM_DATA_PAGE_SIZE", 1),
+            common.patch.object(CmDataClient, "_fetch_rows", autospec=True, return_value=[_model_row(1)]) as fetch_mock,
+        ):
+            rows = self.client.iter_model_numbers(updated_at=None)
+            fetch_mock.assert_not_called()
+            self.assertEqual(next(rows).record_id, 1)
+
+        fetch_mock.assert_called_once()
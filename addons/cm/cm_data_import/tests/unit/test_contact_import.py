@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from datetime import datetime
 from typing import cast
 
@@ -27,9 +28,9 @@ class _ContactClientStub:
     def __init__(self, contact_rows: list[CmDataContact]) -> None:
         self._contact_rows = contact_rows
 
-    def fetch_contacts(self, updated_at: datetime | None) -> list[CmDataContact]:
+    def iter_contacts(self, updated_at: datetime | None) -> Iterator[CmDataContact]:
         assert updated_at is None
-        return self._contact_rows
+        return iter(self._contact_rows)
 
 
 @common.tagged(*common.UNIT_TAGS)
@@ -122,3 +123,48 @@ class TestContactImport(UnitTestCase):
         self.assertFalse(contact_partner.email)
         self.assertFalse(contact_partner.function)
         self.assertEqual(contact_partner.cm_data_contact_notes, "Main district contact")
+
+    def test_import_contacts_batches_rows_and_skips_already_synced_contacts(self) -> None:
+        importer = self.CmDataImporter
+        system = importer._get_cm_data_system()
+        account_partner = self.env["res.partner"].create({"name": "Hauppauge UFSD"})
+        synced_partner = self.env["res.partner"].create({"name": "Already Synced", "parent_id": account_partner.id})
+        external_id_model = self.env["external.id"].sudo()
+        synced_external_id = external_id_model.create(
+            {
+                "system_id": system.id,
+                "res_model": "res.partner",
+                "res_id": synced_partner.id,
+                "resource": "contact",
+                "external_id": "501",
+                "last_sync": datetime(2026, 3, 14, 9),
+            }
+        )
+
+        importer._import_contacts(
+            cast(
+                CmDataClient,
+                cast(
+                    object,
+                    _ContactClientStub(
+                        [
+                            _contact_row(record_id=501, account_name="Hauppauge", sub_name="Renamed", contact_notes=None),
+                            _contact_row(record_id=502, account_name="Hauppauge", sub_name="Front Office", contact_notes=None),
+                        ]
+                    ),
+                ),
+            ),
+            None,
+            {importer._normalize_key("Hauppauge"): account_partner.id},
+            system,
+            datetime(2026, 3, 14, 10),
+        )
+
+        new_partner = self.env["res.partner"].search_by_external_id("cm_data", "502", resource="contact")
+        new_external_id = new_partner.external.cm_data.contact.record
+
+        self.assertEqual(synced_partner.name, "Already Synced")
+        self.assertEqual(synced_external_id.last_sync, datetime(2026, 3, 14, 9))
+        self.assertEqual(new_partner.name, "Front Office")
+        self.assertEqual(new_partner.parent_id, account_partner)
+        self.assertEqual(new_external_id.last_sync, datetime(2026, 3, 14, 9))
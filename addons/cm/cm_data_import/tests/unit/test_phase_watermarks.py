@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from ...models.cm_data_importer import (
+    CM_DATA_PHASE_CONTACTS,
+    CM_DATA_PHASE_NOTES,
+    CM_DATA_PHASE_STATE_PARAM,
+)
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestPhaseWatermarks(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.importer = self.CmDataImporter
+        self.parameter_model = self.env["ir.config_parameter"].sudo()
+        self.parameter_model.set_param(CM_DATA_PHASE_STATE_PARAM, "")
+        self.parameter_model.set_param("cm_data.last_sync_at", "")
+        self.parameter_model.set_param("cm_data.full_reconcile_interval_hours", "24")
+
+    def test_phases_read_in_full_without_recorded_state(self) -> None:
+        phase_starts = self.importer._get_phase_starts(datetime(2026, 3, 14, 9))
+
+        self.assertIsNone(phase_starts[CM_DATA_PHASE_CONTACTS])
+
+    def test_phases_fall_back_to_last_sync_at(self) -> None:
+        self.parameter_model.set_param("cm_data.last_sync_at", "2026-03-14 08:00:00")
+
+        phase_starts = self.importer._get_phase_starts(datetime(2026, 3, 14, 9))
+
+        self.assertEqual(phase_starts[CM_DATA_PHASE_CONTACTS], datetime(2026, 3, 14, 8))
+
+    def test_completed_phase_reads_from_its_own_watermark(self) -> None:
+        full_run_at = datetime(2026, 3, 14, 8)
+        self.importer._complete_phase(CM_DATA_PHASE_CONTACTS, {CM_DATA_PHASE_CONTACTS: None}, full_run_at)
+        incremental_run_at = datetime(2026, 3, 14, 9)
+        self.importer._complete_phase(CM_DATA_PHASE_CONTACTS, {CM_DATA_PHASE_CONTACTS: full_run_at}, incremental_run_at)
+
+        phase_starts = self.importer._get_phase_starts(datetime(2026, 3, 14, 10))
+
+        self.assertEqual(phase_starts[CM_DATA_PHASE_CONTACTS], incremental_run_at)
+        self.assertIsNone(phase_starts[CM_DATA_PHASE_NOTES])
+        self.assertEqual(self.importer._get_phase_state()[CM_DATA_PHASE_CONTACTS]["reconciled_at"], "2026-03-14 08:00:00")
+
+    def test_phase_reconciles_in_full_once_interval_elapses(self) -> None:
+        self.importer._complete_phase(CM_DATA_PHASE_CONTACTS, {CM_DATA_PHASE_CONTACTS: None}, datetime(2026, 3, 14, 8))
+        self.importer._complete_phase(
+            CM_DATA_PHASE_CONTACTS,
+            {CM_DATA_PHASE_CONTACTS: datetime(2026, 3, 14, 8)},
+            datetime(2026, 3, 15, 7),
+        )
+
+        phase_starts = self.importer._get_phase_starts(datetime(2026, 3, 15, 8))
+
+        self.assertIsNone(phase_starts[CM_DATA_PHASE_CONTACTS])
+
+    def test_untracked_runs_do_not_record_phase_state(self) -> None:
+        self.importer._complete_phase(CM_DATA_PHASE_CONTACTS, {}, datetime(2026, 3, 14, 8))
+
+        self.assertFalse(self.parameter_model.get_param(CM_DATA_PHASE_STATE_PARAM))
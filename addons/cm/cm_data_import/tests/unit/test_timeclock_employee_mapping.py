@@ -3,6 +3,9 @@ from datetime import datetime
 from ...models.cm_data_importer import (
     EMPLOYEE_TIMECLOCK_PLACEHOLDER_RESOURCE,
     EXTERNAL_SYSTEM_CODE,
+    TIMECLOCK_IN_RESOURCE,
+    TIMECLOCK_OUT_RESOURCE,
+    CmDataImporter,
     CmDataTimeclockPunch,
 )
 from ...services.cm_data_client import CmDataEmployee
@@ -31,13 +34,20 @@ def _employee_row(*, record_id: int, timeclock_id: int | None) -> CmDataEmployee
     )
 
 
-def _punch_row(*, record_id: int, user_id: int | None, compnum: int | None) -> CmDataTimeclockPunch:
+def _punch_row(
+    *,
+    record_id: int,
+    user_id: int | None,
+    compnum: int | None,
+    check_type: str | None = None,
+    check_time: datetime = datetime(2026, 3, 14, 9),
+) -> CmDataTimeclockPunch:
     return CmDataTimeclockPunch(
         record_id=record_id,
         compnum=compnum,
         user_id=user_id,
-        check_type=None,
-        check_time=datetime(2026, 3, 14, 9),
+        check_type=check_type,
+        check_time=check_time,
         sensor_id=None,
         checked=None,
         reason=None,
@@ -159,3 +169,35 @@ class TestTimeclockEmployeeMapping(UnitTestCase):
         self.assertFalse(placeholder_employee.active)
         self.assertEqual(placeholder_employee.name, "Archived CM Employee 42")
         self.assertEqual(timeclock_employee_map[42], placeholder_employee.id)
+
+    def test_import_timeclock_punches_skips_synced_punches_without_queries(self) -> None:
+        system = self.env["external.system"].ensure_system(
+            code=EXTERNAL_SYSTEM_CODE,
+            name="CM Data",
+            applicable_model_xml_ids=(),
+        )
+        employee = self.env["hr.employee"].create({"name": "Timeclock Employee"})
+        punch_rows = [
+            _punch_row(record_id=1, user_id=50, compnum=None, check_type="In", check_time=datetime(2026, 3, 14, 13)),
+            _punch_row(record_id=2, user_id=50, compnum=None, check_type="Out", check_time=datetime(2026, 3, 14, 21)),
+        ]
+
+        self.importer._import_timeclock_punches(punch_rows, {50: employee.id}, system)
+
+        attendance = self.env["hr.attendance"].search([("employee_id", "=", employee.id)])
+        self.assertEqual(len(attendance), 1)
+        self.assertEqual(attendance.check_out, datetime(2026, 3, 14, 21))
+        sync_state = self.importer._prefetch_timeclock_sync_state(system)
+        self.assertEqual(sync_state[(TIMECLOCK_IN_RESOURCE, "1")], (attendance.id, datetime(2026, 3, 14, 13)))
+        self.assertEqual(sync_state[(TIMECLOCK_OUT_RESOURCE, "2")], (attendance.id, datetime(2026, 3, 14, 21)))
+
+        with (
+            common.patch.object(CmDataImporter, "_write_attendance_values", autospec=True) as write_mock,
+            common.patch.object(CmDataImporter, "_create_attendance_with_fix", autospec=True) as create_mock,
+            common.patch.object(CmDataImporter, "_write_external_id_last_sync", autospec=True) as stamp_mock,
+        ):
+            self.importer._import_timeclock_punches(punch_rows, {50: employee.id}, system)
+
+        write_mock.assert_not_called()
+        create_mock.assert_not_called()
+        self.assertEqual(stamp_mock.call_args.args[2], {})
@@ -1,6 +1,18 @@
+from collections.abc import Iterable, Mapping
+
 from odoo import api, fields, models
 from odoo.exceptions import AccessError, ValidationError
-from odoo.addons.cm_device.utils import clean_identifier_value
+from odoo.addons.cm_device.utils import clean_identifier_value, normalize_identifier_value
+
+# identifier type -> (source field, normalized field, clean_identifier_value type)
+DEVICE_IDENTIFIER_FIELDS = {
+    "serial": ("serial_number", "serial_number_normalized", "serial"),
+    "asset_tag": ("asset_tag", "asset_tag_normalized", "asset_tag"),
+    "asset_tag_secondary": ("asset_tag_secondary", "asset_tag_secondary_normalized", "asset_tag"),
+    "imei": ("imei", "imei_normalized", "imei"),
+}
+FUZZY_IDENTIFIER_MIN_LENGTH = 3
+FUZZY_IDENTIFIER_MATCH_LIMIT = 5
 
 
 class Device(models.Model):
@@ -14,6 +26,11 @@ class Device(models.Model):
     asset_tag = fields.Char(tracking=True)
     asset_tag_secondary = fields.Char(tracking=True)
     imei = fields.Char(tracking=True)
+    # Normalized lookup keys: btree indexes serve exact matching, trigram indexes the fuzzy fallback.
+    serial_number_normalized = fields.Char(compute="_compute_normalized_identifiers", store=True, index="trigram")
+    asset_tag_normalized = fields.Char(compute="_compute_normalized_identifiers", store=True, index="trigram")
+    asset_tag_secondary_normalized = fields.Char(compute="_compute_normalized_identifiers", store=True, index="trigram")
+    imei_normalized = fields.Char(compute="_compute_normalized_identifiers", store=True, index="trigram")
     is_serial_unavailable = fields.Boolean(tracking=True)
     model = fields.Many2one(
         "service.device.model",
@@ -44,6 +61,91 @@ class Device(models.Model):
         domain="[('move_type', 'in', ['out_invoice', 'out_refund'])]",
     )
 
+    _serial_number_normalized_idx = models.Index("(serial_number_normalized) WHERE serial_number_normalized IS NOT NULL")
+    _asset_tag_normalized_idx = models.Index("(asset_tag_normalized) WHERE asset_tag_normalized IS NOT NULL")
+    _asset_tag_secondary_normalized_idx = models.Index(
+        "(asset_tag_secondary_normalized) WHERE asset_tag_secondary_normalized IS NOT NULL"
+    )
+    _imei_normalized_idx = models.Index("(imei_normalized) WHERE imei_normalized IS NOT NULL")
+
+    @api.depends("serial_number", "asset_tag", "asset_tag_secondary", "imei")
+    def _compute_normalized_identifiers(self) -> None:
+        for device in self:
+            for source_field_name, normalized_field_name, cleaning_type in DEVICE_IDENTIFIER_FIELDS.values():
+                device[normalized_field_name] = (
+                    normalize_identifier_value(device[source_field_name], identifier_type=cleaning_type) or False
+                )
+
+    @api.model
+    def resolve_devices(
+        self,
+        identifiers: Mapping[str, Iterable[str | None]],
+        partner_id: int | None = None,
+        *,
+        fuzzy: bool = False,
+    ) -> dict[tuple[str, str], "odoo.model.service_device"]:
+        # Matches are keyed by (identifier_type, value) as passed in. Exact matches come from one
+        # query on the normalized columns; with fuzzy, an unmatched value falls back to a trigram
+        # ilike across every identifier column. Devices owned by partner_id (or unowned) win.
+        keys_by_normalized: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        for identifier_type, identifier_values in identifiers.items():
+            identifier_field = DEVICE_IDENTIFIER_FIELDS.get(identifier_type)
+            if not identifier_field:
+                continue
+            for identifier_value in identifier_values:
+                normalized_value = normalize_identifier_value(identifier_value, identifier_type=identifier_field[2])
+                if normalized_value:
+                    keys_by_normalized.setdefault((identifier_type, normalized_value), []).append(
+                        (identifier_type, identifier_value)
+                    )
+        if not keys_by_normalized:
+            return {}
+
+        values_by_type: dict[str, set[str]] = {}
+        for identifier_type, normalized_value in keys_by_normalized:
+            values_by_type.setdefault(identifier_type, set()).add(normalized_value)
+        exact_domain = fields.Domain.OR(
+            [(DEVICE_IDENTIFIER_FIELDS[identifier_type][1], "in", list(normalized_values))]
+            for identifier_type, normalized_values in values_by_type.items()
+        )
+        matches_by_normalized: dict[tuple[str, str], "odoo.model.service_device"] = {}
+        for device in self.search(exact_domain):
+            for identifier_type, normalized_values in values_by_type.items():
+                device_value = device[DEVICE_IDENTIFIER_FIELDS[identifier_type][1]]
+                if device_value in normalized_values:
+                    normalized_key = (identifier_type, device_value)
+                    matches_by_normalized[normalized_key] = matches_by_normalized.get(normalized_key, self.browse()) | device
+
+        resolved: dict[tuple[str, str], "odoo.model.service_device"] = {}
+        for normalized_key, original_keys in keys_by_normalized.items():
+            devices = matches_by_normalized.get(normalized_key) or self.browse()
+            if not devices and fuzzy:
+                devices = self._search_fuzzy_identifier(normalized_key[1], partner_id)
+            if partner_id:
+                devices = devices.filtered(lambda device: not device.owner or device.owner.id == partner_id) or devices
+            if devices:
+                for original_key in original_keys:
+                    resolved[original_key] = devices
+        return resolved
+
+    @api.model
+    def _search_fuzzy_identifier(self, normalized_value: str, partner_id: int | None) -> "odoo.model.service_device":
+        # Trigram indexes cannot serve patterns shorter than three characters.
+        if len(normalized_value) < FUZZY_IDENTIFIER_MIN_LENGTH:
+            return self.browse()
+        fuzzy_domain = fields.Domain.OR(
+            [(normalized_field_name, "ilike", normalized_value)]
+            for _source_field_name, normalized_field_name, _cleaning_type in DEVICE_IDENTIFIER_FIELDS.values()
+        )
+        if partner_id:
+            owned_devices = self.search(
+                fields.Domain([("owner", "=", partner_id)]) & fuzzy_domain,
+                limit=FUZZY_IDENTIFIER_MATCH_LIMIT,
+            )
+            if owned_devices:
+                return owned_devices
+        return self.search(fuzzy_domain, limit=FUZZY_IDENTIFIER_MATCH_LIMIT)
+
     @api.model_create_multi
     def create(self, values_list: list[dict[str, object]]):
         normalized_values_list = [
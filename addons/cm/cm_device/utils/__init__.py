@@ -1,3 +1,3 @@
-from .identifiers import clean_identifier_value
+from .identifiers import clean_identifier_value, normalize_identifier_value
 
-__all__ = ["clean_identifier_value"]
+__all__ = ["clean_identifier_value", "normalize_identifier_value"]
@@ -16,3 +16,9 @@ def clean_identifier_value(value: str | None, *, identifier_type: str) -> str |
     if identifier_type in {"serial", "asset_tag"} and len(cleaned) < 2:
         return None
     return cleaned
+
+
+def normalize_identifier_value(value: str | None, *, identifier_type: str) -> str | None:
+    # Lookup key for matching identifiers: the cleaned value, case-folded.
+    cleaned = clean_identifier_value(value, identifier_type=identifier_type)
+    return cleaned.casefold() if cleaned else None
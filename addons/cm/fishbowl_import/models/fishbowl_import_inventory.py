@@ -18,75 +18,59 @@ class FishbowlImporterInventory(models.Model):
     def _import_on_hand(self, client: FishbowlClient, product_maps: dict[str, dict[int, int]]) -> None:
         stock_location = self._get_location("internal")
         stock_location_id = stock_location.id
-        quant_model = self.env["stock.quant"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
-        product_model = self.env["product.product"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
-        commit_interval = self._get_commit_interval()
-        update_count = 0
         inventory_rows = fishbowl_rows.INVENTORY_ROWS_ADAPTER.validate_python(
             client.fetch_all("SELECT partId, SUM(qtyOnHand) AS qtyOnHand FROM qtyinventorytotals GROUP BY partId")
         )
         if not inventory_rows:
             _logger.warning("Fishbowl on-hand returned no rows; skipping on-hand sync.")
             return
-        fishbowl_part_ids: set[int] = set()
-        def refresh_stock_models() -> None:
-            nonlocal stock_location, quant_model
-            self._commit_and_clear()
-            stock_location = self.env["stock.location"].browse(stock_location_id)
-            quant_model = self.env["stock.quant"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
-
-        def refresh_inventory_models() -> None:
-            nonlocal product_model
-            refresh_stock_models()
-            product_model = self.env["product.product"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
 
+        # Mapped parts Fishbowl no longer reports are reconciled down to zero.
+        target_quantities = dict.fromkeys(product_maps["part"].values(), 0.0)
         for row in inventory_rows:
             if row.partId is None:
                 continue
-            fishbowl_part_ids.add(row.partId)
             product_id = product_maps["part"].get(row.partId)
-            if not product_id:
-                continue
-            product = product_model.browse(product_id)
-            if not self._is_stockable_product(product):
-                continue
-            target_quantity = float(row.qtyOnHand or 0)
-            current_quantity = product.with_context(active_test=False, location=stock_location.id).qty_available
-            delta_quantity = target_quantity - current_quantity
-            if float_is_zero(delta_quantity, precision_rounding=product.uom_id.rounding):
-                continue
-            quant_model._update_available_quantity(product, stock_location, delta_quantity)
-            update_count += 1
-            if commit_interval > 0 and update_count % commit_interval == 0:
-                refresh_inventory_models()
+            if product_id:
+                target_quantities[product_id] = float(row.qtyOnHand or 0)
+        delta_quantities = self._compute_on_hand_deltas(target_quantities, self._get_on_hand_quantities(stock_location))
+        if not delta_quantities:
+            _logger.info("Fishbowl import: on-hand already matches Fishbowl totals")
+            return
 
-        # Clear any lingering on-hand quantities for parts no longer reported by Fishbowl.
-        missing_part_ids = set(product_maps["part"]) - fishbowl_part_ids
-        if missing_part_ids:
-            missing_product_ids = [product_maps["part"][part_id] for part_id in missing_part_ids if part_id in product_maps["part"]]
-            cleared_count = 0
-            for batch in chunked(missing_product_ids, 500):
-                group_rows = quant_model._read_group(
-                    [
-                        ("product_id", "in", batch),
-                        ("location_id", "=", stock_location.id),
-                        ("quantity", "!=", 0),
-                    ],
-                    ["product_id"],
-                    ["quantity:sum"],
-                )
-                if not group_rows:
+        commit_interval = self._get_commit_interval()
+        update_count = 0
+        for batch in chunked(sorted(delta_quantities), commit_interval if commit_interval > 0 else 500):
+            stock_location = self.env["stock.location"].browse(stock_location_id)
+            quant_model = self.env["stock.quant"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
+            product_model = self.env["product.product"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
+            for product in product_model.browse(batch):
+                if not self._is_stockable_product(product):
                     continue
-                for product, group_quantity in group_rows:
-                    if not product or not self._is_stockable_product(product):
-                        continue
-                    if float_is_zero(group_quantity, precision_rounding=product.uom_id.rounding):
-                        continue
-                    quant_model._update_available_quantity(product, stock_location, -float(group_quantity))
-                    cleared_count += 1
-                    update_count += 1
-                    if commit_interval > 0 and update_count % commit_interval == 0:
-                        refresh_stock_models()
-            if cleared_count:
-                _logger.info("Fishbowl import: cleared on-hand for %s stale products", cleared_count)
-        self._commit_and_clear()
+                delta_quantity = delta_quantities[product.id]
+                if float_is_zero(delta_quantity, precision_rounding=product.uom_id.rounding):
+                    continue
+                quant_model._update_available_quantity(product, stock_location, delta_quantity)
+                update_count += 1
+            self._commit_and_clear()
+        _logger.info("Fishbowl import: adjusted on-hand for %s of %s products", update_count, len(target_quantities))
+
+    def _get_on_hand_quantities(self, stock_location: "odoo.model.stock_location") -> dict[int, float]:
+        # Same scope as qty_available with a location context: the location and its children.
+        quant_model = self.env["stock.quant"].sudo().with_context(active_test=False)
+        grouped_quantities = quant_model._read_group(
+            [("location_id", "child_of", stock_location.id)],
+            ["product_id"],
+            ["quantity:sum"],
+        )
+        return {product.id: float(quantity or 0) for product, quantity in grouped_quantities if product}
+
+    @staticmethod
+    def _compute_on_hand_deltas(target_quantities: dict[int, float], current_quantities: dict[int, float]) -> dict[int, float]:
+        # Exact comparison only filters unchanged products; UoM rounding is checked when applying.
+        delta_quantities: dict[int, float] = {}
+        for product_id, target_quantity in target_quantities.items():
+            delta_quantity = target_quantity - current_quantities.get(product_id, 0.0)
+            if delta_quantity:
+                delta_quantities[product_id] = delta_quantity
+        return delta_quantities
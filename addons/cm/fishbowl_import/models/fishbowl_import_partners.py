@@ -61,51 +61,57 @@ class FishbowlImporterPartners(models.Model):
         customer_partner_map: dict[int, int] = {}
         vendor_partner_map: dict[int, int] = {}
 
+        customer_partners = self._get_or_create_many_by_external_id_with_sync(
+            partner_model,
+            fishbowl_system,
+            [
+                (
+                    str(row.id),
+                    {
+                        "name": str(row.name or "").strip() or f"Customer {row.id}",
+                        "ref": str(row.number or "").strip() or False,
+                        "comment": row.note or False,
+                        "active": self._to_bool(row.activeFlag),
+                        "customer_rank": 1,
+                    },
+                )
+                for row in customer_rows
+            ],
+            resource=RESOURCE_CUSTOMER,
+            sync_started_at=sync_started_at,
+        )
         for row in customer_rows:
-            fishbowl_id = row.id
-            values = {
-                "name": str(row.name or "").strip() or f"Customer {fishbowl_id}",
-                "ref": str(row.number or "").strip() or False,
-                "comment": row.note or False,
-                "active": self._to_bool(row.activeFlag),
-                "customer_rank": 1,
-            }
-            partner = self._get_or_create_by_external_id_with_sync(
-                partner_model,
-                fishbowl_system,
-                str(fishbowl_id),
-                values,
-                resource=RESOURCE_CUSTOMER,
-                updated_at=None,
-                sync_started_at=sync_started_at,
-            )
+            partner = customer_partners[str(row.id)]
             account_id = row.accountId
             if account_id is not None:
                 account_partner_map[account_id] = partner.id
-            customer_partner_map[fishbowl_id] = partner.id
+            customer_partner_map[row.id] = partner.id
 
+        vendor_partners = self._get_or_create_many_by_external_id_with_sync(
+            partner_model,
+            fishbowl_system,
+            [
+                (
+                    str(row.id),
+                    {
+                        "name": str(row.name or "").strip() or f"Vendor {row.id}",
+                        "ref": str(row.accountNum or "").strip() or False,
+                        "comment": row.note or False,
+                        "active": self._to_bool(row.activeFlag),
+                        "supplier_rank": 1,
+                    },
+                )
+                for row in vendor_rows
+            ],
+            resource=RESOURCE_VENDOR,
+            sync_started_at=sync_started_at,
+        )
         for row in vendor_rows:
-            fishbowl_id = row.id
-            values = {
-                "name": str(row.name or "").strip() or f"Vendor {fishbowl_id}",
-                "ref": str(row.accountNum or "").strip() or False,
-                "comment": row.note or False,
-                "active": self._to_bool(row.activeFlag),
-                "supplier_rank": 1,
-            }
-            partner = self._get_or_create_by_external_id_with_sync(
-                partner_model,
-                fishbowl_system,
-                str(fishbowl_id),
-                values,
-                resource=RESOURCE_VENDOR,
-                updated_at=None,
-                sync_started_at=sync_started_at,
-            )
+            partner = vendor_partners[str(row.id)]
             account_id = row.accountId
             if account_id is not None:
                 account_partner_map.setdefault(account_id, partner.id)
-            vendor_partner_map[fishbowl_id] = partner.id
+            vendor_partner_map[row.id] = partner.id
 
         address_type_mapping = {
             "ship to": "delivery",
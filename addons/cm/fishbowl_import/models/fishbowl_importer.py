@@ -526,6 +526,23 @@ class FishbowlImporter(models.Model):
         self._mark_external_id_synced(system, external_id_value, resource, sync_timestamp)
         return record
 
+    def _get_or_create_many_by_external_id_with_sync(
+        self,
+        record_model: "odoo.model.external_id_mixin",
+        system: "odoo.model.external_system",
+        values_by_external_id: list[tuple[str, dict[str, object]]],
+        *,
+        resource: str,
+        sync_started_at: datetime,
+    ) -> dict[str, "odoo.model.external_id_mixin"]:
+        records_by_external_id = record_model.get_or_create_by_external_id_many(
+            EXTERNAL_SYSTEM_CODE,
+            values_by_external_id,
+            resource,
+        )
+        self._mark_external_ids_synced(system.id, resource, list(records_by_external_id), sync_started_at)
+        return records_by_external_id
+
     def _get_fishbowl_settings(self) -> FishbowlConnectionSettings:
         host = self._get_config_value("fishbowl.host", "ENV_OVERRIDE_CONFIG_PARAM__FISHBOWL__HOST")
         user = self._get_config_value("fishbowl.user", "ENV_OVERRIDE_CONFIG_PARAM__FISHBOWL__USER")
@@ -316,3 +316,34 @@ class TestFishbowlHelpers(UnitTestCase):
         self.assertEqual(order_maps["sales_line"], {22: 202})
         self.assertEqual(order_maps["purchase_order"], {33: 303})
         self.assertEqual(order_maps["purchase_line"], {44: 404})
+
+    def test_compute_on_hand_deltas_skips_unchanged_products(self) -> None:
+        importer_model = self.env["fishbowl.importer"]
+
+        delta_quantities = importer_model._compute_on_hand_deltas({1: 5.0, 2: 3.0, 3: 0.0}, {1: 5.0, 2: 1.0, 3: 4.0, 9: 8.0})
+
+        self.assertEqual(delta_quantities, {2: 2.0, 3: -4.0})
+
+    def test_import_on_hand_reconciles_reported_and_missing_parts(self) -> None:
+        importer_model = self.env["fishbowl.importer"]
+        product_model = self.env["product.product"]
+        reported_product, missing_product = product_model.create(
+            [
+                {"name": "Reported Part", "type": "consu", "is_storable": True},
+                {"name": "Missing Part", "type": "consu", "is_storable": True},
+            ]
+        )
+        stock_location = importer_model._get_location("internal")
+        quant_model = self.env["stock.quant"].sudo()
+        quant_model._update_available_quantity(reported_product, stock_location, 2.0)
+        quant_model._update_available_quantity(missing_product, stock_location, 3.0)
+        client = _FetchAllClientStub([[{"partId": 7, "qtyOnHand": 5}]])
+
+        with common.patch.object(type(importer_model), "_commit_and_clear", autospec=True):
+            importer_model._import_on_hand(
+                cast(FishbowlClient, cast(object, client)),
+                {"part": {7: reported_product.id, 8: missing_product.id}},
+            )
+
+        self.assertEqual(reported_product.with_context(location=stock_location.id).qty_available, 5.0)
+        self.assertEqual(missing_product.with_context(location=stock_location.id).qty_available, 0.0)
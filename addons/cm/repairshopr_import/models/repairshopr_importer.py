@@ -3,8 +3,9 @@ import logging
 import os
 import re
 import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import TypedDict, cast
+from typing import NamedTuple, TypedDict, cast
 
 from odoo import api, fields, models
 from odoo.addons.transaction_utilities.models.cron_budget_mixin import CronRuntimeBudgetExceeded
@@ -36,6 +37,7 @@ DEFAULT_SERVICE_PRODUCT_CODE = "REPAIRSHOPR-SERVICE"
 REPAIRSHOPR_TRANSACTION_CUTOFF = datetime(2022, 1, 1)
 REPAIRSHOPR_RESUME_STATE_VERSION = 1
 REPAIRSHOPR_RESUME_STATE_PARAM = "repairshopr.resume_state"
+REPAIRSHOPR_TRANSPORT_BACKFILL_AT_PARAM = "repairshopr.transport_backfill_at"
 REPAIRSHOPR_PHASE_CUSTOMERS = "customers"
 REPAIRSHOPR_PHASE_PRODUCTS = "products"
 REPAIRSHOPR_PHASE_TICKETS = "tickets"
@@ -102,6 +104,12 @@ class TransportOrderInfo(TypedDict):
     note_device_ids: set[int]
 
 
+# One client's transport orders sorted by date, with the dates kept alongside for bisecting.
+class PartnerTransportOrders(NamedTuple):
+    dates: list[datetime]
+    orders: list[TransportOrderInfo]
+
+
 class RepairshoprImporter(models.Model):
     _name = "repairshopr.importer"
     _description = "RepairShopr Importer"
@@ -166,7 +174,10 @@ class RepairshoprImporter(models.Model):
                                 resume_after_updated_at=resume_state.get("invoice_after_updated_at"),
                             )
                         elif phase_name == REPAIRSHOPR_PHASE_TRANSPORT_BACKFILL:
-                            self._backfill_transport_order_devices()
+                            self._backfill_transport_order_devices(
+                                since=self._get_transport_backfill_at() if update_last_sync else None,
+                            )
+                            self._set_transport_backfill_at(sync_started_at)
                         else:
                             raise ValueError(f"Unsupported RepairShopr phase: {phase_name}")
                         resume_state = self._advance_resume_state(phase_name)
@@ -466,6 +477,20 @@ class RepairshoprImporter(models.Model):
     def _set_last_sync_at(self, value: datetime) -> None:
         self.env["ir.config_parameter"].sudo().set_param("repairshopr.last_sync_at", fields.Datetime.to_string(value))
 
+    def _get_transport_backfill_at(self) -> datetime | None:
+        parameter_model = self.env["ir.config_parameter"].sudo()
+        value = parameter_model.get_param(REPAIRSHOPR_TRANSPORT_BACKFILL_AT_PARAM)
+        if not value:
+            return None
+        try:
+            return fields.Datetime.from_string(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _set_transport_backfill_at(self, value: datetime) -> None:
+        parameter_model = self.env["ir.config_parameter"].sudo()
+        parameter_model.set_param(REPAIRSHOPR_TRANSPORT_BACKFILL_AT_PARAM, fields.Datetime.to_string(value))
+
     def _record_last_run(self, status: str, message: str) -> None:
         parameter_model = self.env["ir.config_parameter"].sudo()
         parameter_model.set_param("repairshopr.last_run_status", status)
@@ -499,7 +524,7 @@ class RepairshoprImporter(models.Model):
         _logger.info("RepairShopr import: committed %s %s records", processed_count, label)
         return True
 
-    def _backfill_transport_order_devices(self) -> None:
+    def _backfill_transport_order_devices(self, *, since: datetime | None = None) -> None:
         if "service.transport.order" not in self.env:
             _logger.info("Transport device backfill skipped; service.transport.order not installed.")
             return
@@ -526,45 +551,68 @@ class RepairshoprImporter(models.Model):
         if not cm_system:
             _logger.info("Transport device backfill skipped; CM data external system not found.")
             return
-        transport_order_ids = self._get_external_ids_for_model(
-            cm_system.id,
-            "delivery_log",
-            "service.transport.order",
-        )
-        if not transport_order_ids:
-            _logger.info("Transport device backfill skipped; no imported transport orders found.")
-            return
-        transport_orders = (
-            transport_order_model.browse(transport_order_ids)
-            .exists()
-            .sorted(key=lambda record: (record.arrival_date or record.scheduled_date or record.create_date, record.id))
-        )
-        if not transport_orders:
-            _logger.info("Transport device backfill skipped; no transport orders found.")
-            return
-
         repairshopr_system = self._get_external_system_by_code(EXTERNAL_SYSTEM_CODE)
         if not repairshopr_system:
             _logger.info("Transport device backfill skipped; RepairShopr system not found.")
             return
+
+        # Incremental runs only revisit transport orders changed since the watermark, plus the
+        # unlinked intake orders that changed or belong to a client with a changed transport order.
+        changed_transport_order_ids: list[int] | None = None
+        ticket_domain = fields.Domain(
+            [
+                ("intake_order_id", "!=", False),
+                ("intake_order_id.transport_order", "=", False),
+            ]
+        )
+        if since:
+            changed_transport_orders = transport_order_model.search([("write_date", ">=", since)])
+            changed_transport_order_ids = self._get_external_ids_for_model(
+                cm_system.id,
+                "delivery_log",
+                "service.transport.order",
+                res_ids=changed_transport_orders.ids,
+            )
+            changed_partner_ids = transport_order_model.browse(changed_transport_order_ids).mapped("client").ids
+            ticket_domain &= fields.Domain.OR(
+                [
+                    [("write_date", ">=", since)],
+                    [("intake_order_id.write_date", ">=", since)],
+                    [("intake_order_id.client", "in", changed_partner_ids)],
+                ]
+            )
+
+        candidate_tickets = ticket_model.search(ticket_domain)
         imported_ticket_ids = self._get_external_ids_for_model(
             repairshopr_system.id,
             RESOURCE_TICKET,
             "helpdesk.ticket",
+            res_ids=candidate_tickets.ids,
         )
-        if not imported_ticket_ids:
-            _logger.info("Transport device backfill skipped; no imported tickets found.")
-            return
-        ticket_records = ticket_model.browse(imported_ticket_ids).exists()
-        ticket_records = ticket_records.filtered(lambda record: record.intake_order_id)
-        if not ticket_records:
-            _logger.info("Transport device backfill skipped; no intake orders linked to imported tickets.")
+        ticket_records = ticket_model.browse(imported_ticket_ids)
+        intake_orders = ticket_records.mapped("intake_order_id")
+        intake_order_ids = self._get_intake_orders_with_devices(intake_device_model, intake_orders.ids)
+        intake_orders = intake_orders.filtered(lambda order: order.id in set(intake_order_ids))
+        intake_partner_ids = intake_orders.mapped("client").ids
+        if not intake_orders and not changed_transport_order_ids:
+            _logger.info("Transport device backfill skipped; no intake orders need transport links.")
             return
 
-        intake_orders = ticket_records.mapped("intake_order_id").filtered(lambda order: not order.transport_order)
-        if not intake_orders:
-            _logger.info("Transport device backfill skipped; no intake orders need transport links.")
+        transport_order_domain = fields.Domain([("client", "in", intake_partner_ids)])
+        if changed_transport_order_ids is None:
+            transport_order_domain = fields.Domain([("client", "!=", False)])
+        elif changed_transport_order_ids:
+            transport_order_domain |= fields.Domain([("id", "in", changed_transport_order_ids)])
+        transport_order_ids = self._get_external_ids_for_model(
+            cm_system.id,
+            "delivery_log",
+            "service.transport.order",
+            res_ids=transport_order_model.search(transport_order_domain).ids,
+        )
+        if not transport_order_ids:
+            _logger.info("Transport device backfill skipped; no imported transport orders found.")
             return
+        transport_orders = transport_order_model.browse(transport_order_ids)
 
         device_counts: dict[int, int] = {}
         grouped_counts = transport_device_model._read_group(
@@ -579,42 +627,31 @@ class RepairshoprImporter(models.Model):
         alias_map = self._build_cm_location_alias_map(cm_system)
 
         transport_order_info: list[TransportOrderInfo] = []
-        orders_by_partner: dict[int, list[TransportOrderInfo]] = {}
         for transport_order in transport_orders:
             partner_id = transport_order.client.id if transport_order.client else None
             if not partner_id:
                 continue
-            order_date = self._resolve_transport_order_date(transport_order)
             location_key = self._normalize_location_key(transport_order.cm_data_location_name)
-            location_option_id = alias_map.get(location_key)
-            capacity = int(transport_order.cm_data_units or transport_order.quantity_in_counted or 0)
-            used_count = device_counts.get(transport_order.id, 0)
             note_identifiers = self._extract_transport_order_identifiers(transport_order)
             note_device_ids = self._resolve_devices_from_identifiers(
                 note_identifiers,
                 partner_id=partner_id,
             )
-            info: TransportOrderInfo = {
-                "id": transport_order.id,
-                "partner_id": partner_id,
-                "date": order_date,
-                "location_key": location_key,
-                "location_option_id": location_option_id,
-                "capacity": capacity,
-                "used": used_count,
-                "note_device_ids": note_device_ids,
-            }
-            transport_order_info.append(info)
-            orders_by_partner.setdefault(partner_id, []).append(info)
-
-        intake_order_ids = self._get_intake_orders_with_devices(intake_device_model, intake_orders.ids)
-        if not intake_order_ids:
-            _logger.info("Transport device backfill skipped; no intake devices found.")
-            return
+            transport_order_info.append(
+                {
+                    "id": transport_order.id,
+                    "partner_id": partner_id,
+                    "date": self._resolve_transport_order_date(transport_order),
+                    "location_key": location_key,
+                    "location_option_id": alias_map.get(location_key),
+                    "capacity": int(transport_order.cm_data_units or transport_order.quantity_in_counted or 0),
+                    "used": device_counts.get(transport_order.id, 0),
+                    "note_device_ids": note_device_ids,
+                }
+            )
+        orders_by_partner = self._index_transport_orders_by_partner(transport_order_info)
 
-        intake_orders = intake_orders.filtered(lambda order: order.id in set(intake_order_ids))
         intake_orders = intake_orders.sorted(key=lambda record: (record.finish_date or datetime.min, record.id))
-
         intake_info_by_id: dict[int, dict[str, object]] = {}
         for intake_order in intake_orders:
             partner_id = intake_order.client.id if intake_order.client else None
@@ -628,9 +665,6 @@ class RepairshoprImporter(models.Model):
 
         tickets_by_intake_id = self._build_ticket_location_map(ticket_records)
         devices_by_intake_id = self._build_intake_device_map(intake_device_model, list(intake_info_by_id))
-        for intake_id, device_ids in devices_by_intake_id.items():
-            if intake_id in intake_info_by_id:
-                intake_info_by_id[intake_id]["device_ids"] = device_ids
 
         commit_interval = self._get_commit_interval()
         processed_count = 0
@@ -647,7 +681,7 @@ class RepairshoprImporter(models.Model):
             partner_id = int(str(partner_id_value)) if partner_id_value else None
             if not partner_id:
                 continue
-            candidate_orders = orders_by_partner.get(partner_id, [])
+            candidate_orders = orders_by_partner.get(partner_id)
             if not candidate_orders:
                 skipped_missing_match += 1
                 continue
@@ -694,6 +728,10 @@ class RepairshoprImporter(models.Model):
             skipped_missing_match,
         )
 
+        # Notes of unchanged transport orders were already turned into device lines on an earlier run.
+        if changed_transport_order_ids is not None:
+            changed_ids = set(changed_transport_order_ids)
+            transport_order_info = [order_info for order_info in transport_order_info if order_info["id"] in changed_ids]
         note_device_created = self._create_transport_devices_from_notes(
             transport_device_model,
             transport_order_info,
@@ -701,6 +739,24 @@ class RepairshoprImporter(models.Model):
         if note_device_created:
             _logger.info("Transport device backfill: created %s note-derived device lines", note_device_created)
 
+    @staticmethod
+    def _index_transport_orders_by_partner(
+        transport_order_info: list[TransportOrderInfo],
+    ) -> dict[int, PartnerTransportOrders]:
+        # Orders without a date can never fall inside a matching window, so they are left out.
+        orders_by_partner: dict[int, list[TransportOrderInfo]] = {}
+        for order_info in transport_order_info:
+            if order_info["date"]:
+                orders_by_partner.setdefault(order_info["partner_id"], []).append(order_info)
+        indexed_orders: dict[int, PartnerTransportOrders] = {}
+        for partner_id, partner_orders in orders_by_partner.items():
+            partner_orders.sort(key=lambda order_info: (order_info["date"], order_info["id"]))
+            indexed_orders[partner_id] = PartnerTransportOrders(
+                dates=[order_info["date"] for order_info in partner_orders],
+                orders=partner_orders,
+            )
+        return indexed_orders
+
     @staticmethod
     def _normalize_location_key(value: str | None) -> str:
         if not value:
@@ -805,7 +861,7 @@ class RepairshoprImporter(models.Model):
         self,
         intake_info: dict[str, object],
         ticket_info: dict[str, object] | None,
-        candidate_orders: list[TransportOrderInfo],
+        candidate_orders: PartnerTransportOrders,
         device_ids: list[int],
     ) -> TransportOrderInfo | None:
         finish_date: datetime | None = intake_info.get("finish_date")
@@ -825,18 +881,11 @@ class RepairshoprImporter(models.Model):
                 return order_location_key in ticket_keys
             return False
 
-        def is_within_window(
-            order_info: TransportOrderInfo,
-            candidate_window_days: int,
-        ) -> bool:
-            order_date = order_info.get("date")
-            if not order_date:
-                return False
-            window = timedelta(days=candidate_window_days)
-            return abs(order_date - finish_date) <= window
-
         for window_days in (2, 7):
-            window_candidates = [order_info for order_info in candidate_orders if is_within_window(order_info, window_days)]
+            window = timedelta(days=window_days)
+            first_index = bisect_left(candidate_orders.dates, finish_date - window)
+            last_index = bisect_right(candidate_orders.dates, finish_date + window)
+            window_candidates = candidate_orders.orders[first_index:last_index]
             if not window_candidates:
                 continue
             if ticket_info:
@@ -869,16 +918,23 @@ class RepairshoprImporter(models.Model):
         system_id: int,
         resource: str,
         model_name: str,
+        *,
+        res_ids: list[int] | None = None,
     ) -> list[int]:
-        external_id_model = self.env["external.id"].sudo().with_context(active_test=False)
-        records = external_id_model.search(
+        domain = fields.Domain(
             [
                 ("system_id", "=", system_id),
                 ("resource", "=", resource),
                 ("res_model", "=", model_name),
             ]
         )
-        return [record.res_id for record in records if record.res_id]
+        if res_ids is not None:
+            if not res_ids:
+                return []
+            domain &= fields.Domain([("res_id", "in", res_ids)])
+        external_id_model = self.env["external.id"].sudo().with_context(active_test=False)
+        records = external_id_model.search_fetch(domain, ["res_id"])
+        return list(dict.fromkeys(record.res_id for record in records if record.res_id))
 
     def _extract_transport_order_identifiers(
         self,
@@ -920,61 +976,9 @@ class RepairshoprImporter(models.Model):
     ) -> set[int]:
         if not identifiers:
             return set()
-        identifier_model = self.env["identifier.index"].sudo().with_context(active_test=False)
         device_model = self.env["service.device"].sudo().with_context(active_test=False)
-        resolved_ids: set[int] = set()
-
-        for identifier_type, identifier_values in identifiers.items():
-            for identifier_value in identifier_values:
-                normalized_value = self._normalize_identifier_value(identifier_value)
-                if not normalized_value:
-                    continue
-                preferred_ids: set[int] = set()
-                index_matches = identifier_model.search(
-                    [
-                        ("identifier_type", "=", identifier_type),
-                        ("identifier_normalized", "=", normalized_value),
-                        ("res_model", "=", "service.device"),
-                    ]
-                )
-                for index_match in index_matches:
-                    device_record = device_model.browse(index_match.res_id)
-                    if not device_record.exists():
-                        continue
-                    if partner_id and device_record.owner and device_record.owner.id != partner_id:
-                        continue
-                    preferred_ids.add(device_record.id)
-
-                if not preferred_ids:
-                    search_domain = self._build_device_search_domain(identifier_value)
-                    if partner_id:
-                        owner_domain = fields.Domain([("owner", "=", partner_id)])
-                        search_domain = owner_domain + search_domain
-                    matches = device_model.search(search_domain, limit=5)
-                    if not matches and partner_id:
-                        matches = device_model.search(self._build_device_search_domain(identifier_value), limit=5)
-                    if matches:
-                        preferred_ids.update(matches.ids)
-
-                if preferred_ids:
-                    resolved_ids.update(preferred_ids)
-
-        return resolved_ids
-
-    @staticmethod
-    def _build_device_search_domain(identifier_value: str) -> fields.Domain:
-        value = identifier_value.strip()
-        return fields.Domain(
-            [
-                "|",
-                "|",
-                "|",
-                ("serial_number", "ilike", value),
-                ("asset_tag", "ilike", value),
-                ("asset_tag_secondary", "ilike", value),
-                ("imei", "ilike", value),
-            ]
-        )
+        matches = device_model.resolve_devices(identifiers, partner_id, fuzzy=True)
+        return {device_id for devices in matches.values() for device_id in devices.ids}
 
     def _create_transport_devices_from_notes(
         self,
@@ -1178,46 +1182,50 @@ class RepairshoprImporter(models.Model):
             stale_map[external_id_value] = record
         return existing_map, stale_map, blocked, last_sync_map, record_map
 
-    def _sync_identifier_index(
+    def _flush_identifier_index(self, identifier_entries: list[tuple[str, int, dict[str, set[str]]]]) -> None:
+        if not identifier_entries:
+            return
+        self._sync_identifier_index_many(identifier_entries, source_system=EXTERNAL_SYSTEM_CODE)
+        identifier_entries.clear()
+
+    def _sync_identifier_index_many(
         self,
-        res_model: str,
-        res_id: int,
-        identifiers: dict[str, set[str]],
+        identifier_entries: list[tuple[str, int, dict[str, set[str]]]],
         *,
         source_system: str,
     ) -> None:
-        if not identifiers:
+        # One search covers the whole batch; rows are then grouped into a write per distinct
+        # update and a single create, instead of a search plus write/create per identifier.
+        identifier_value_by_key: dict[tuple[str, str, str, int], str] = {}
+        for res_model, res_id, identifiers in identifier_entries:
+            for identifier_type, identifier_values in identifiers.items():
+                for identifier_value in identifier_values:
+                    normalized_value = self._normalize_identifier_value(identifier_value)
+                    if not normalized_value:
+                        continue
+                    identifier_value_by_key[(identifier_type, normalized_value, res_model, res_id)] = identifier_value.strip()
+        if not identifier_value_by_key:
             return
-        identifier_model = self.env["identifier.index"].sudo().with_context(IMPORT_CONTEXT)
-        for identifier_type, identifier_values in identifiers.items():
-            if not identifier_values:
-                continue
-            for identifier_value in identifier_values:
-                normalized_value = self._normalize_identifier_value(identifier_value)
-                if not normalized_value:
-                    continue
-                identifier_value_clean = identifier_value.strip()
-                existing = identifier_model.with_context(active_test=False).search(
-                    [
-                        ("identifier_type", "=", identifier_type),
-                        ("identifier_normalized", "=", normalized_value),
-                        ("res_model", "=", res_model),
-                        ("res_id", "=", res_id),
-                    ],
-                    limit=1,
-                )
-                if existing:
-                    update_values: dict[str, object] = {}
-                    if not existing.active:
-                        update_values["active"] = True
-                    if existing.identifier_value != identifier_value_clean:
-                        update_values["identifier_value"] = identifier_value_clean
-                    if existing.source_system != source_system:
-                        update_values["source_system"] = source_system
-                    if update_values:
-                        existing.write(update_values)
-                    continue
-                identifier_model.create(
+        identifier_model = self.env["identifier.index"].sudo().with_context(IMPORT_CONTEXT, active_test=False)
+        candidate_records = identifier_model.search(
+            [
+                ("identifier_type", "in", list({key[0] for key in identifier_value_by_key})),
+                ("identifier_normalized", "in", list({key[1] for key in identifier_value_by_key})),
+                ("res_model", "in", list({key[2] for key in identifier_value_by_key})),
+                ("res_id", "in", list({key[3] for key in identifier_value_by_key})),
+            ]
+        )
+        existing_by_key = {
+            (record.identifier_type, record.identifier_normalized, record.res_model, record.res_id): record
+            for record in candidate_records
+        }
+        update_ids_by_values: dict[tuple[tuple[str, object], ...], list[int]] = {}
+        create_values: list["odoo.values.identifier_index"] = []
+        for key, identifier_value_clean in identifier_value_by_key.items():
+            existing = existing_by_key.get(key)
+            if not existing:
+                identifier_type, normalized_value, res_model, res_id = key
+                create_values.append(
                     {
                         "identifier_type": identifier_type,
                         "identifier_value": identifier_value_clean,
@@ -1228,6 +1236,20 @@ class RepairshoprImporter(models.Model):
                         "active": True,
                     }
                 )
+                continue
+            update_values: dict[str, object] = {}
+            if not existing.active:
+                update_values["active"] = True
+            if existing.identifier_value != identifier_value_clean:
+                update_values["identifier_value"] = identifier_value_clean
+            if existing.source_system != source_system:
+                update_values["source_system"] = source_system
+            if update_values:
+                update_ids_by_values.setdefault(tuple(sorted(update_values.items())), []).append(existing.id)
+        for update_items, record_ids in update_ids_by_values.items():
+            identifier_model.browse(record_ids).write(dict(update_items))
+        if create_values:
+            identifier_model.create(create_values)
 
     @staticmethod
     def _normalize_identifier_value(identifier_value: str | None) -> str | None:
@@ -273,24 +273,27 @@ class RepairshoprImporter(models.Model):
     ) -> "odoo.model.service_device":
         device_model = self.env["service.device"].sudo().with_context(IMPORT_CONTEXT)
         model_model = self.env["service.device.model"].sudo().with_context(IMPORT_CONTEXT)
-        device_record = None
-        if serial_number:
-            device_record = device_model.search([("serial_number", "=", serial_number)], limit=1)
-        if not device_record and asset_tag:
-            asset_domain = [("asset_tag", "=", asset_tag)]
-            if partner:
-                asset_domain.append(("owner", "=", partner.id))
-            device_record = device_model.search(asset_domain, limit=1)
-        if not device_record and asset_tag_secondary:
-            asset_secondary_domain = [("asset_tag_secondary", "=", asset_tag_secondary)]
-            if partner:
-                asset_secondary_domain.append(("owner", "=", partner.id))
-            device_record = device_model.search(asset_secondary_domain, limit=1)
-        if not device_record and imei:
-            imei_domain = [("imei", "=", imei)]
+        identifier_matches = device_model.resolve_devices(
+            {
+                "serial": [serial_number],
+                "asset_tag": [asset_tag],
+                "asset_tag_secondary": [asset_tag_secondary],
+                "imei": [imei],
+            }
+        )
+        # A serial matches any owner; the other identifiers only match the partner's own devices.
+        device_record = identifier_matches.get(("serial", serial_number), device_model.browse())[:1]
+        for identifier_type, identifier_value in (
+            ("asset_tag", asset_tag),
+            ("asset_tag_secondary", asset_tag_secondary),
+            ("imei", imei),
+        ):
+            if device_record:
+                break
+            candidate_devices = identifier_matches.get((identifier_type, identifier_value), device_model.browse())
             if partner:
-                imei_domain.append(("owner", "=", partner.id))
-            device_record = device_model.search(imei_domain, limit=1)
+                candidate_devices = candidate_devices.filtered(lambda device: device.owner == partner)
+            device_record = candidate_devices[:1]
 
         device_model_record = None
         if model_label:
@@ -812,6 +815,7 @@ class RepairshoprImporter(models.Model):
         source_ticket_by_external_id: dict[str, int] = {}
         sync_timestamps: dict[str, datetime] = {}
         identifiers_by_external_id: dict[str, dict[str, set[str]]] = {}
+        identifier_entries: list[tuple[str, int, dict[str, set[str]]]] = []
         pending_commit = False
         identifier_pairs_by_external_id: dict[str, set[tuple[str, str]]] = {}
 
@@ -821,6 +825,7 @@ class RepairshoprImporter(models.Model):
         def flush_creates() -> None:
             nonlocal create_values, create_external_ids
             if not create_values:
+                self._flush_identifier_index(identifier_entries)
                 return
             created_records = order_model.create(create_values)
             external_id_payloads: list["odoo.values.external_id"] = []
@@ -852,14 +857,10 @@ class RepairshoprImporter(models.Model):
                     )
                 record_identifiers = identifiers_by_external_id.get(created_external_id) or {}
                 if record_identifiers:
-                    self._sync_identifier_index(
-                        "sale.order",
-                        created_order.id,
-                        record_identifiers,
-                        source_system=EXTERNAL_SYSTEM_CODE,
-                    )
+                    identifier_entries.append(("sale.order", created_order.id, record_identifiers))
             if external_id_payloads:
                 self.env["external.id"].sudo().create(external_id_payloads)
+            self._flush_identifier_index(identifier_entries)
             create_values = []
             create_external_ids = []
             source_ticket_by_external_id.clear()
@@ -992,12 +993,7 @@ class RepairshoprImporter(models.Model):
                 if record:
                     record.write({"last_sync": sync_timestamps[external_id_value]})
                 if identifiers:
-                    self._sync_identifier_index(
-                        "sale.order",
-                        order_record.id,
-                        identifiers,
-                        source_system=EXTERNAL_SYSTEM_CODE,
-                    )
+                    identifier_entries.append(("sale.order", order_record.id, identifiers))
                 processed_count += 1
                 if should_commit():
                     flush_creates()
@@ -1134,6 +1130,7 @@ class RepairshoprImporter(models.Model):
         create_external_ids: list[str] = []
         sync_timestamps: dict[str, datetime] = {}
         identifiers_by_external_id: dict[str, dict[str, set[str]]] = {}
+        identifier_entries: list[tuple[str, int, dict[str, set[str]]]] = []
         pending_commit = False
 
         def should_commit() -> bool:
@@ -1142,6 +1139,7 @@ class RepairshoprImporter(models.Model):
         def flush_creates() -> None:
             nonlocal create_values, create_external_ids
             if not create_values:
+                self._flush_identifier_index(identifier_entries)
                 return
             created_records = move_model.create(create_values)
             external_id_payloads: list["odoo.values.external_id"] = []
@@ -1171,14 +1169,10 @@ class RepairshoprImporter(models.Model):
                     )
                 record_identifiers = identifiers_by_external_id.get(created_external_id) or {}
                 if record_identifiers:
-                    self._sync_identifier_index(
-                        "account.move",
-                        created_move.id,
-                        record_identifiers,
-                        source_system=EXTERNAL_SYSTEM_CODE,
-                    )
+                    identifier_entries.append(("account.move", created_move.id, record_identifiers))
             if external_id_payloads:
                 self.env["external.id"].sudo().create(external_id_payloads)
+            self._flush_identifier_index(identifier_entries)
             create_values = []
             create_external_ids = []
 
@@ -1265,12 +1259,7 @@ class RepairshoprImporter(models.Model):
                 if record:
                     record.write({"last_sync": sync_timestamps[external_id_value]})
                 if identifiers:
-                    self._sync_identifier_index(
-                        "account.move",
-                        move_record.id,
-                        identifiers,
-                        source_system=EXTERNAL_SYSTEM_CODE,
-                    )
+                    identifier_entries.append(("account.move", move_record.id, identifiers))
                 processed_count += 1
                 if should_commit():
                     flush_creates()
@@ -222,6 +222,7 @@ class RepairshoprImporter(models.Model):
         create_external_ids: list[str] = []
         sync_timestamps: dict[str, datetime] = {}
         identifiers_by_external_id: dict[str, dict[str, set[str]]] = {}
+        identifier_entries: list[tuple[str, int, dict[str, set[str]]]] = []
         pending_commit = False
 
         def should_commit() -> bool:
@@ -230,6 +231,7 @@ class RepairshoprImporter(models.Model):
         def flush_creates() -> None:
             nonlocal create_values, create_external_ids
             if not create_values:
+                self._flush_identifier_index(identifier_entries)
                 return
             created_records = ticket_model.create(create_values)
             external_id_payloads: list["odoo.values.external_id"] = []
@@ -259,14 +261,10 @@ class RepairshoprImporter(models.Model):
                     )
                 record_identifiers = identifiers_by_external_id.get(created_external_id) or {}
                 if record_identifiers:
-                    self._sync_identifier_index(
-                        "helpdesk.ticket",
-                        created_ticket.id,
-                        record_identifiers,
-                        source_system=EXTERNAL_SYSTEM_CODE,
-                    )
+                    identifier_entries.append(("helpdesk.ticket", created_ticket.id, record_identifiers))
             if external_id_payloads:
                 self.env["external.id"].sudo().create(external_id_payloads)
+            self._flush_identifier_index(identifier_entries)
             create_values = []
             create_external_ids = []
 
@@ -309,12 +307,7 @@ class RepairshoprImporter(models.Model):
                 if record:
                     record.write({"last_sync": sync_timestamps[external_id_value]})
                 if identifiers:
-                    self._sync_identifier_index(
-                        "helpdesk.ticket",
-                        ticket_record.id,
-                        identifiers,
-                        source_system=EXTERNAL_SYSTEM_CODE,
-                    )
+                    identifier_entries.append(("helpdesk.ticket", ticket_record.id, identifiers))
                 processed_count += 1
                 if should_commit():
                     flush_creates()
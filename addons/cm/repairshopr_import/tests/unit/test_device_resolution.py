@@ -0,0 +1,67 @@
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestDeviceResolution(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.importer = self.RepairshoprImporter
+        self.device_model = self.env["service.device"].sudo()
+        self.device_model_record = self.env["service.device.model"].sudo().create({"number": "RESOLVE-1"})
+        self.school, self.other_school = self.Partner.create([{"name": "Resolve School"}, {"name": "Other School"}])
+
+    def _device(self, partner: "odoo.model.res_partner", **values: object) -> "odoo.model.service_device":
+        return self.device_model.create({"model": self.device_model_record.id, "owner": partner.id, "payer": partner.id, **values})
+
+    def test_normalized_identifiers_are_cleaned_and_case_folded(self) -> None:
+        device = self._device(self.school, serial_number="  Abc  123 ", imei="35-1234-5678-9012")
+
+        self.assertEqual(device.serial_number_normalized, "abc 123")
+        self.assertEqual(device.imei_normalized, "35123456789012")
+        self.assertFalse(device.asset_tag_normalized)
+
+    def test_resolve_devices_matches_exactly_and_prefers_partner_devices(self) -> None:
+        owned_device = self._device(self.school, asset_tag="TAG-77")
+        self._device(self.other_school, asset_tag="tag-77")
+
+        matches = self.device_model.resolve_devices({"asset_tag": {"Tag-77"}, "serial": {"missing"}}, self.school.id)
+
+        self.assertEqual(matches, {("asset_tag", "Tag-77"): owned_device})
+
+    def test_find_or_create_device_reuses_normalized_serial_match(self) -> None:
+        device = self._device(self.other_school, serial_number="SN-500")
+
+        found_device = self.importer._find_or_create_device(
+            partner=self.school,
+            model_label="RESOLVE-1",
+            serial_number="sn-500",
+            asset_tag="TAG-1",
+            asset_tag_secondary=None,
+            imei=None,
+        )
+
+        self.assertEqual(found_device, device)
+        self.assertEqual(found_device.asset_tag, "TAG-1")
+
+    def test_find_or_create_device_keeps_asset_tags_scoped_to_partner(self) -> None:
+        other_device = self._device(self.other_school, asset_tag="TAG-9")
+
+        created_device = self.importer._find_or_create_device(
+            partner=self.school,
+            model_label="RESOLVE-1",
+            serial_number=None,
+            asset_tag="TAG-9",
+            asset_tag_secondary=None,
+            imei=None,
+        )
+
+        self.assertNotEqual(created_device, other_device)
+        self.assertEqual(created_device.owner, self.school)
+
+    def test_resolve_devices_from_identifiers_falls_back_to_fuzzy_match(self) -> None:
+        device = self._device(self.school, serial_number="C02XK1ABCD12")
+
+        resolved_ids = self.importer._resolve_devices_from_identifiers({"asset_tag": {"k1abcd"}}, partner_id=self.school.id)
+
+        self.assertEqual(resolved_ids, {device.id})
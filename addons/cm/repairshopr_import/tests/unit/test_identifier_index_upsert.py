@@ -0,0 +1,59 @@
+from ...models.repairshopr_importer import EXTERNAL_SYSTEM_CODE
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestIdentifierIndexUpsert(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.importer = self.RepairshoprImporter
+        self.identifier_model = self.env["identifier.index"].sudo().with_context(active_test=False)
+        self.partners = self.env["res.partner"].create([{"name": "Identifier A"}, {"name": "Identifier B"}])
+
+    def _identifiers_for(self, res_id: int) -> "odoo.model.identifier_index":
+        return self.identifier_model.search([("res_model", "=", "res.partner"), ("res_id", "=", res_id)])
+
+    def test_sync_identifier_index_many_updates_existing_and_creates_missing(self) -> None:
+        existing = self.identifier_model.create(
+            {
+                "identifier_type": "serial",
+                "identifier_value": "sn 100",
+                "identifier_normalized": "sn 100",
+                "source_system": "legacy",
+                "res_model": "res.partner",
+                "res_id": self.partners[0].id,
+                "active": False,
+            }
+        )
+
+        self.importer._sync_identifier_index_many(
+            [
+                ("res.partner", self.partners[0].id, {"serial": {" SN  100 "}, "po": {"PO-1"}}),
+                ("res.partner", self.partners[1].id, {"serial": {"SN 100"}, "claim": {"  "}}),
+            ],
+            source_system=EXTERNAL_SYSTEM_CODE,
+        )
+
+        self.assertTrue(existing.active)
+        self.assertEqual(existing.identifier_value, "SN  100")
+        self.assertEqual(existing.source_system, EXTERNAL_SYSTEM_CODE)
+        self.assertEqual(
+            sorted(self._identifiers_for(self.partners[0].id).mapped("identifier_normalized")),
+            ["po-1", "sn 100"],
+        )
+        self.assertEqual(self._identifiers_for(self.partners[1].id).mapped("identifier_normalized"), ["sn 100"])
+
+    def test_flush_identifier_index_is_idempotent_and_clears_entries(self) -> None:
+        identifier_entries = [("res.partner", self.partners[0].id, {"ticket": {"T-1"}})]
+
+        self.importer._flush_identifier_index(identifier_entries)
+        self.importer._sync_identifier_index_many(
+            [("res.partner", self.partners[0].id, {"ticket": {"t-1"}})],
+            source_system=EXTERNAL_SYSTEM_CODE,
+        )
+
+        self.assertEqual(identifier_entries, [])
+        identifiers = self._identifiers_for(self.partners[0].id)
+        self.assertEqual(len(identifiers), 1)
+        self.assertEqual(identifiers.identifier_value, "t-1")
@@ -98,6 +98,7 @@ class TestRepairshoprResumeState(UnitTestCase):
         import_estimates.assert_called_once()
         import_invoices.assert_called_once()
         transport_backfill.assert_called_once()
+        self.assertIsNone(transport_backfill.call_args.kwargs["since"])
 
         self.assertEqual(import_estimates.call_args.kwargs["resume_after_id"], 654)
         self.assertEqual(import_estimates.call_args.kwargs["resume_after_updated_at"], "2026-01-02T08:00:00")
@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from odoo import fields
+
+from ...models.repairshopr_importer import REPAIRSHOPR_TRANSPORT_BACKFILL_AT_PARAM, RESOURCE_TICKET, TransportOrderInfo
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+
+def _order_info(order_id: int, order_date: datetime | None, *, partner_id: int = 1, capacity: int = 0) -> TransportOrderInfo:
+    return {
+        "id": order_id,
+        "partner_id": partner_id,
+        "date": order_date,
+        "location_key": "",
+        "location_option_id": None,
+        "capacity": capacity,
+        "used": 0,
+        "note_device_ids": set(),
+    }
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestTransportBackfillIndex(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.importer = self.RepairshoprImporter
+
+    def test_index_sorts_orders_per_partner_and_drops_undated_orders(self) -> None:
+        orders_by_partner = self.importer._index_transport_orders_by_partner(
+            [
+                _order_info(3, datetime(2026, 3, 5)),
+                _order_info(1, datetime(2026, 3, 1)),
+                _order_info(2, None),
+                _order_info(4, datetime(2026, 3, 2), partner_id=2),
+            ]
+        )
+
+        self.assertEqual([order_info["id"] for order_info in orders_by_partner[1].orders], [1, 3])
+        self.assertEqual(orders_by_partner[1].dates, [datetime(2026, 3, 1), datetime(2026, 3, 5)])
+        self.assertEqual([order_info["id"] for order_info in orders_by_partner[2].orders], [4])
+
+    def test_select_transport_order_prefers_the_narrow_window(self) -> None:
+        orders_by_partner = self.importer._index_transport_orders_by_partner(
+            [
+                _order_info(1, datetime(2026, 3, 1)),
+                _order_info(2, datetime(2026, 3, 9)),
+                _order_info(3, datetime(2026, 3, 11, 12)),
+                _order_info(4, datetime(2026, 3, 20)),
+            ]
+        )
+
+        selected_order = self.importer._select_transport_order_for_intake(
+            {"finish_date": datetime(2026, 3, 10)}, None, orders_by_partner[1], [101]
+        )
+
+        self.assertEqual(selected_order["id"], 2)
+
+    def test_select_transport_order_returns_none_outside_the_wide_window(self) -> None:
+        orders_by_partner = self.importer._index_transport_orders_by_partner([_order_info(1, datetime(2026, 3, 1))])
+
+        selected_order = self.importer._select_transport_order_for_intake(
+            {"finish_date": datetime(2026, 3, 8, 1)}, None, orders_by_partner[1], [101]
+        )
+
+        self.assertIsNone(selected_order)
+
+    def test_backfill_watermark_round_trips_through_config_parameter(self) -> None:
+        self.importer._set_transport_backfill_at(datetime(2026, 3, 10, 8, 30))
+
+        self.assertEqual(
+            self.env["ir.config_parameter"].sudo().get_param(REPAIRSHOPR_TRANSPORT_BACKFILL_AT_PARAM),
+            "2026-03-10 08:30:00",
+        )
+        self.assertEqual(self.importer._get_transport_backfill_at(), datetime(2026, 3, 10, 8, 30))
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestIncrementalTransportBackfill(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.importer = self.RepairshoprImporter
+        self.cm_system = self.env["external.system"].ensure_system(code="cm_data", name="CM Data")
+        self.repairshopr_system = self.importer._get_repairshopr_system()
+        self.device_model_record = self.env["service.device.model"].sudo().create({"number": "BACKFILL-1"})
+        self.helpdesk_team = self.env["helpdesk.team"].create({"name": "Backfill Support"})
+        self.since = fields.Datetime.now() - timedelta(hours=1)
+
+        self.stale_school, self.changed_school = self.Partner.create([{"name": "Stale School"}, {"name": "Changed School"}])
+        self.stale_transport_order = self._transport_order(self.stale_school)
+        self.changed_transport_order = self._transport_order(self.changed_school)
+        self.stale_intake_order = self._intake_order(self.stale_school)
+        self.changed_school_intake_order = self._intake_order(self.changed_school)
+
+        # Everything except the changed school's transport order predates the watermark.
+        stale_date = self.since - timedelta(days=30)
+        for table_name, record_ids in (
+            ("service_transport_order", [self.stale_transport_order.id]),
+            ("service_intake_order", [self.stale_intake_order.id, self.changed_school_intake_order.id]),
+            ("helpdesk_ticket", self.env["helpdesk.ticket"].search([("intake_order_id", "!=", False)]).ids),
+        ):
+            self.env.cr.execute(f"UPDATE {table_name} SET write_date = %s WHERE id = ANY(%s)", [stale_date, record_ids])
+        self.env.invalidate_all()
+
+    def _transport_order(self, school: "odoo.model.res_partner") -> "odoo.model.service_transport_order":
+        transport_order = (
+            self.env["service.transport.order"]
+            .sudo()
+            .create({"client": school.id, "contact": school.id, "arrival_date": datetime(2026, 3, 9)})
+        )
+        self._external_id(self.cm_system, "delivery_log", transport_order)
+        return transport_order
+
+    def _intake_order(self, school: "odoo.model.res_partner") -> "odoo.model.service_intake_order":
+        intake_order = self.env["service.intake.order"].sudo().create({"client": school.id, "finish_date": datetime(2026, 3, 10)})
+        device = (
+            self.env["service.device"]
+            .sudo()
+            .create({"model": self.device_model_record.id, "owner": school.id, "payer": school.id})
+        )
+        self.env["service.intake.order.device"].sudo().create({"intake_order": intake_order.id, "device": device.id})
+        ticket = self.env["helpdesk.ticket"].create(
+            {
+                "name": f"{school.name} intake",
+                "team_id": self.helpdesk_team.id,
+                "partner_id": school.id,
+                "intake_order_id": intake_order.id,
+            }
+        )
+        self._external_id(self.repairshopr_system, RESOURCE_TICKET, ticket)
+        return intake_order
+
+    def _external_id(self, system: "odoo.model.external_system", resource: str, record: "odoo.model.base") -> None:
+        self.env["external.id"].sudo().create(
+            {
+                "res_model": record._name,
+                "res_id": record.id,
+                "system_id": system.id,
+                "resource": resource,
+                "external_id": f"{resource}-{record.id}",
+                "active": True,
+            }
+        )
+
+    def test_backfill_since_watermark_only_revisits_changed_transport_orders(self) -> None:
+        importer_class = type(self.importer)
+        with (
+            patch.object(
+                importer_class,
+                "_index_transport_orders_by_partner",
+                wraps=importer_class._index_transport_orders_by_partner,
+            ) as index_orders,
+            patch.object(
+                importer_class,
+                "_create_transport_devices_from_notes",
+                autospec=True,
+                return_value=0,
+            ) as create_note_devices,
+        ):
+            self.importer._backfill_transport_order_devices(since=self.since)
+
+        loaded_order_ids = {order_info["id"] for order_info in index_orders.call_args.args[0]}
+        self.assertIn(self.changed_transport_order.id, loaded_order_ids)
+        self.assertNotIn(self.stale_transport_order.id, loaded_order_ids)
+
+        self.assertEqual(self.changed_school_intake_order.transport_order, self.changed_transport_order)
+        self.assertFalse(self.stale_intake_order.transport_order)
+
+        note_order_ids = [order_info["id"] for order_info in create_note_devices.call_args.args[2]]
+        self.assertEqual(note_order_ids, [self.changed_transport_order.id])
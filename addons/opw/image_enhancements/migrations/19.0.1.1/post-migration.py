@@ -78,15 +78,7 @@ def _cleanup_legacy_columns(cursor: Cursor) -> None:
 
 
 def _recompute_product_image_metadata(env: api.Environment) -> None:
-    image_model = env["product.image"].with_context(active_test=False)
-    image_ids = image_model.search([]).ids
-    batch_size = 200
-    for offset in range(0, len(image_ids), batch_size):
-        batch_ids = image_ids[offset : offset + batch_size]
-        batch_records = image_model.browse(batch_ids)
-        compute_image_metadata = getattr(batch_records, "_compute_image_metadata", None)
-        if compute_image_metadata:
-            compute_image_metadata()
+    env["product.image"].backfill_image_metadata(commit=False)
 
 
 def migrate(cr: Cursor, version: str) -> None:
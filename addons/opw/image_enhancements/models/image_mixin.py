@@ -1,12 +1,21 @@
 import base64
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
 from odoo import api, fields, models
 from PIL import Image, UnidentifiedImageError
 
+from ..utils import probe_image_size
+
 _logger = logging.getLogger(__name__)
 
+IMAGE_METADATA_FIELD_NAMES = ("image_1920_file_size", "image_1920_width", "image_1920_height")
+PROBE_THREAD_POOL_THRESHOLD = 64
+PROBE_MAX_WORKERS = 8
+BACKFILL_BATCH_SIZE = 500
+
 
 class ImageMetadataMixin(models.AbstractModel):
     _name = "image.metadata.mixin"
@@ -22,6 +31,7 @@ class ImageMetadataMixin(models.AbstractModel):
     @api.depends("image_1920")
     def _compute_image_metadata(self) -> None:
         attachments_by_record = self._fetch_image_attachments()
+        dimensions_by_attachment = self._probe_attachment_dimensions(list(attachments_by_record.values()))
         for record in self:
             if not record.id:
                 self._clear_image_metadata(record)
@@ -33,7 +43,7 @@ class ImageMetadataMixin(models.AbstractModel):
                 continue
 
             record.image_1920_file_size = attachment.file_size or False
-            width, height = self._extract_image_dimensions(attachment)
+            width, height = dimensions_by_attachment.get(attachment.id, (False, False))
             record.image_1920_width = width
             record.image_1920_height = height
 
@@ -62,12 +72,13 @@ class ImageMetadataMixin(models.AbstractModel):
         attachments = (
             self.env["ir.attachment"]
             .sudo()
-            .search(
+            .search_fetch(
                 [
                     ("res_model", "=", self._name),
                     ("res_id", "in", record_ids),
                     ("res_field", "=", "image_1920"),
                 ],
+                ["res_id", "store_fname", "mimetype", "file_size"],
                 order="id desc",
             )
         )
@@ -77,27 +88,62 @@ class ImageMetadataMixin(models.AbstractModel):
                 attachments_by_record[attachment.res_id] = attachment
         return attachments_by_record
 
-    def _extract_image_dimensions(self, attachment: "odoo.model.ir_attachment") -> tuple[int | bool, int | bool]:
-        if attachment.mimetype and "svg" in attachment.mimetype:
-            _logger.info("Image attachment %s is SVG; skipping dimension probe.", attachment.id)
-            return False, False
-        image_bytes = self._read_attachment_bytes(attachment)
-        if not image_bytes:
-            return False, False
+    def _probe_attachment_dimensions(
+        self, attachments: list["odoo.model.ir_attachment"]
+    ) -> dict[int, tuple[int | bool, int | bool]]:
+        # Only image headers are read. Filestore files are opened in place; large recomputes
+        # spread that I/O over a thread pool, which never touches the ORM or the cursor.
+        dimensions_by_attachment: dict[int, tuple[int | bool, int | bool]] = {}
+        file_paths_by_attachment: dict[int, str] = {}
+        for attachment in attachments:
+            if attachment.mimetype and "svg" in attachment.mimetype:
+                _logger.info("Image attachment %s is SVG; skipping dimension probe.", attachment.id)
+                continue
+            if attachment.store_fname:
+                file_paths_by_attachment[attachment.id] = attachment._full_path(attachment.store_fname)
+                continue
+            image_bytes = self._read_attachment_bytes(attachment)
+            if image_bytes:
+                dimensions_by_attachment[attachment.id] = self._probe_image_stream(attachment.id, io.BytesIO(image_bytes))
+
+        attachment_ids = list(file_paths_by_attachment)
+        file_paths = list(file_paths_by_attachment.values())
+        if len(file_paths) >= PROBE_THREAD_POOL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=PROBE_MAX_WORKERS) as executor:
+                probed_dimensions = list(executor.map(self._probe_image_file, attachment_ids, file_paths))
+        else:
+            probed_dimensions = list(map(self._probe_image_file, attachment_ids, file_paths))
+        dimensions_by_attachment.update(zip(attachment_ids, probed_dimensions, strict=True))
+        return dimensions_by_attachment
+
+    @classmethod
+    def _probe_image_file(cls, attachment_id: int, file_path: str) -> tuple[int | bool, int | bool]:
         try:
-            with Image.open(io.BytesIO(image_bytes)) as image_object:
+            with open(file_path, "rb") as image_file:
+                return cls._probe_image_stream(attachment_id, image_file)
+        except OSError as error:
+            _logger.warning("Failed to read image attachment %s: %s", attachment_id, error)
+        return False, False
+
+    @staticmethod
+    def _probe_image_stream(attachment_id: int, image_stream: BinaryIO) -> tuple[int | bool, int | bool]:
+        image_size = probe_image_size(image_stream)
+        if image_size:
+            return image_size
+        # Other formats go through PIL, which also stops after the header when given a stream.
+        image_stream.seek(0)
+        try:
+            with Image.open(image_stream) as image_object:
                 width, height = image_object.size
             return width, height
         except UnidentifiedImageError:
-            _logger.warning("Image attachment %s is not a supported image format.", attachment.id)
+            _logger.warning("Image attachment %s is not a supported image format.", attachment_id)
         except Exception as error:  # pragma: no cover - defensive logging
-            _logger.warning("Failed to read image attachment %s: %s", attachment.id, error)
+            _logger.warning("Failed to read image attachment %s: %s", attachment_id, error)
         return False, False
 
     @staticmethod
     def _read_attachment_bytes(attachment: "odoo.model.ir_attachment") -> bytes:
-        if attachment.store_fname:
-            return attachment._file_read(attachment.store_fname) or b""
         if attachment.db_datas:
             db_datas = attachment.db_datas
             try:
@@ -113,6 +159,29 @@ class ImageMetadataMixin(models.AbstractModel):
         record.image_1920_width = False
         record.image_1920_height = False
 
+    @api.model
+    def backfill_image_metadata(self, *, batch_size: int = BACKFILL_BATCH_SIZE, commit: bool = True) -> int:
+        # Recomputes stored metadata in id-ordered chunks, committing each chunk when asked to,
+        # e.g. env["product.image"].backfill_image_metadata() from an Odoo shell.
+        metadata_fields = [self._fields[field_name] for field_name in IMAGE_METADATA_FIELD_NAMES]
+        record_model = self.with_context(active_test=False)
+        last_id = 0
+        processed_count = 0
+        while True:
+            records = record_model.search([("id", ">", last_id)], order="id", limit=batch_size)
+            if not records:
+                break
+            for field in metadata_fields:
+                self.env.add_to_compute(field, records)
+            records.flush_recordset(list(IMAGE_METADATA_FIELD_NAMES))
+            processed_count += len(records)
+            last_id = records[-1].id
+            if commit:
+                self.env.cr.commit()
+                self.env.invalidate_all()
+            _logger.info("Image metadata backfill for %s: %s records processed", self._name, processed_count)
+        return processed_count
+
     @api.model
     def remove_missing_images(self) -> None:
         images_to_remove = self.search([("image_1920", "=", False)])
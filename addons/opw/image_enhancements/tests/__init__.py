@@ -0,0 +1 @@
+from .unit import test_image_header
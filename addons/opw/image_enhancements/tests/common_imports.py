@@ -0,0 +1,6 @@
+# noinspection PyUnresolvedReferences
+from test_support.tests import build_common_imports
+
+common = build_common_imports(__package__)
+
+__all__ = ["common"]
@@ -0,0 +1,3 @@
+from .base import UnitTestCase
+
+__all__ = ["UnitTestCase"]
@@ -0,0 +1,8 @@
+from test_support.tests.fixtures.unit_case import AdminContextUnitTestCase
+
+from ..common_imports import common
+
+
+@common.tagged(*common.UNIT_TAGS)
+class UnitTestCase(AdminContextUnitTestCase):
+    default_test_context = common.DEFAULT_TEST_CONTEXT
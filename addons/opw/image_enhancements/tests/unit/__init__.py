@@ -0,0 +1,3 @@
+from . import test_image_header
+
+__all__ = ["test_image_header"]
@@ -0,0 +1,117 @@
+import io
+import struct
+
+from ...utils.image_header import PNG_SIGNATURE, probe_image_size
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+
+def _png_header(width: int, height: int) -> bytes:
+    return PNG_SIGNATURE + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", width, height) + b"\x08\x06\x00\x00\x00"
+
+
+def _gif_header(width: int, height: int) -> bytes:
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00\x00\x00"
+
+
+def _webp_header(chunk_type: bytes, payload: bytes) -> bytes:
+    return b"RIFF" + struct.pack("<I", 4 + 8 + len(payload)) + b"WEBP" + chunk_type + struct.pack("<I", len(payload)) + payload
+
+
+def _webp_lossy_header(width: int, height: int) -> bytes:
+    # Frame tag (3 bytes), start code, then 14-bit dimensions with the scale bits set to show they are masked off.
+    return _webp_header(b"VP8 ", b"\x00\x00\x00\x9d\x01\x2a" + struct.pack("<HH", width | 0x4000, height | 0x8000))
+
+
+def _webp_lossless_header(width: int, height: int) -> bytes:
+    bits = (width - 1) | ((height - 1) << 14)
+    return _webp_header(b"VP8L", b"\x2f" + bits.to_bytes(4, "little"))
+
+
+def _webp_extended_header(width: int, height: int) -> bytes:
+    return _webp_header(b"VP8X", b"\x10\x00\x00\x00" + (width - 1).to_bytes(3, "little") + (height - 1).to_bytes(3, "little"))
+
+
+def _jpeg_segment(marker: int, payload: bytes) -> bytes:
+    return bytes((0xFF, marker)) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _jpeg_header(width: int, height: int, *, frame_marker: int = 0xC0) -> bytes:
+    return (
+        b"\xff\xd8"
+        + _jpeg_segment(0xE0, b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00")
+        + _jpeg_segment(0xE1, b"Exif\x00\x00" + b"\x00" * 300)
+        + _jpeg_segment(0xED, b"Photoshop 3.0\x00" + b"\x00" * 40)
+        + _jpeg_segment(0xDB, b"\x00" + b"\x01" * 64)
+        + _jpeg_segment(0xC4, b"\x00" + b"\x00" * 16)
+        + _jpeg_segment(frame_marker, b"\x08" + struct.pack(">HH", height, width) + b"\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01")
+        + _jpeg_segment(0xDA, b"\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00")
+        + b"\xff\xd9"
+    )
+
+
+def _probe(data: bytes) -> tuple[int, int] | None:
+    return probe_image_size(io.BytesIO(data))
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestProbeImageSize(UnitTestCase):
+    def test_reads_dimensions_from_each_supported_header(self) -> None:
+        headers = {
+            "png": _png_header(1920, 1080),
+            "gif": _gif_header(640, 480),
+            "webp lossy": _webp_lossy_header(1000, 750),
+            "webp lossless": _webp_lossless_header(1001, 751),
+            "webp extended": _webp_extended_header(4000, 3000),
+            "jpeg baseline": _jpeg_header(1600, 1200),
+            "jpeg progressive": _jpeg_header(800, 600, frame_marker=0xC2),
+        }
+        expected_sizes = {
+            "png": (1920, 1080),
+            "gif": (640, 480),
+            "webp lossy": (1000, 750),
+            "webp lossless": (1001, 751),
+            "webp extended": (4000, 3000),
+            "jpeg baseline": (1600, 1200),
+            "jpeg progressive": (800, 600),
+        }
+        for image_format, header in headers.items():
+            with self.subTest(image_format=image_format):
+                self.assertEqual(_probe(header), expected_sizes[image_format])
+
+    def test_jpeg_skips_app_segments_and_stops_before_scan_data(self) -> None:
+        image_stream = io.BytesIO(_jpeg_header(320, 240) + b"\x00" * 10000)
+
+        self.assertEqual(probe_image_size(image_stream), (320, 240))
+        self.assertLess(image_stream.tell(), 600)
+
+    def test_jpeg_without_frame_header_returns_none(self) -> None:
+        self.assertIsNone(_probe(b"\xff\xd8" + _jpeg_segment(0xE0, b"JFIF\x00") + _jpeg_segment(0xDA, b"\x00") + b"\xff\xd9"))
+
+    def test_truncated_headers_return_none(self) -> None:
+        headers = {
+            "png": _png_header(10, 10),
+            "gif": _gif_header(10, 10),
+            "webp lossy": _webp_lossy_header(10, 10),
+            "webp lossless": _webp_lossless_header(10, 10),
+            "webp extended": _webp_extended_header(10, 10),
+            "jpeg": _jpeg_header(10, 10),
+        }
+        cut_points = {"png": 20, "gif": 8, "webp lossy": 27, "webp lossless": 20, "webp extended": 26, "jpeg": 30}
+        for image_format, header in headers.items():
+            with self.subTest(image_format=image_format):
+                self.assertIsNone(_probe(header[: cut_points[image_format]]))
+
+    def test_jpeg_with_invalid_segment_length_returns_none(self) -> None:
+        self.assertIsNone(_probe(b"\xff\xd8\xff\xe0\x00\x01JFIF"))
+
+    def test_unrecognised_data_returns_none(self) -> None:
+        self.assertIsNone(_probe(b"<svg xmlns='http://www.w3.org/2000/svg'/>"))
+        self.assertIsNone(_probe(b""))
+
+    def test_mixin_leaves_truncated_images_empty_instead_of_raising(self) -> None:
+        mixin_model = self.env["image.metadata.mixin"]
+
+        dimensions = mixin_model._probe_image_stream(1, io.BytesIO(_png_header(10, 10)[:20]))
+
+        self.assertEqual(dimensions, (False, False))
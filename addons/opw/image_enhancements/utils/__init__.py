@@ -0,0 +1,3 @@
+from .image_header import probe_image_size
+
+__all__ = ["probe_image_size"]
@@ -0,0 +1,71 @@
+import struct
+from typing import BinaryIO
+
+# Start-of-frame markers carry the frame size; DHT (C4), JPG (C8) and DAC (CC) share the range but do not.
+JPEG_SOF_MARKERS = frozenset({0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF})
+JPEG_STANDALONE_MARKERS = frozenset({0x00, 0x01, *range(0xD0, 0xD9)})
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+HEADER_PREFIX_SIZE = 30
+
+
+def probe_image_size(stream: BinaryIO) -> tuple[int, int] | None:
+    # Reads only as far as the dimensions: a fixed prefix for PNG/GIF/WebP, the segment headers
+    # up to the first frame for JPEG. Returns None for anything it does not recognise or that is
+    # truncated before the dimensions, so callers can fall back to PIL.
+    header = stream.read(HEADER_PREFIX_SIZE)
+    if header.startswith(PNG_SIGNATURE) and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24]) if len(header) >= 24 else None
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", header[6:10]) if len(header) >= 10 else None
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return _webp_size(header)
+    if header[:2] == b"\xff\xd8":
+        stream.seek(2)
+        return _jpeg_size(stream)
+    return None
+
+
+def _webp_size(header: bytes) -> tuple[int, int] | None:
+    chunk_type = header[12:16]
+    if chunk_type == b"VP8 " and header[23:26] == b"\x9d\x01\x2a" and len(header) >= 30:
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk_type == b"VP8L" and header[20:21] == b"\x2f" and len(header) >= 25:
+        bits = int.from_bytes(header[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk_type == b"VP8X" and len(header) >= 30:
+        return int.from_bytes(header[24:27], "little") + 1, int.from_bytes(header[27:30], "little") + 1
+    return None
+
+
+def _jpeg_size(stream: BinaryIO) -> tuple[int, int] | None:
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+        marker = stream.read(1)
+        while marker == b"\xff":
+            marker = stream.read(1)
+        if not marker:
+            return None
+        marker_code = marker[0]
+        if marker_code in JPEG_STANDALONE_MARKERS:
+            continue
+        if marker_code in (0xD9, 0xDA):
+            # Frame headers always precede the scan data; reaching SOS or EOI means there is none.
+            return None
+        length_bytes = stream.read(2)
+        if len(length_bytes) < 2:
+            return None
+        segment_length = struct.unpack(">H", length_bytes)[0]
+        if segment_length < 2:
+            return None
+        if marker_code in JPEG_SOF_MARKERS:
+            frame_header = stream.read(5)
+            if len(frame_header) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame_header[1:5])
+            return width, height
+        stream.seek(segment_length - 2, 1)
@@ -1,5 +1,6 @@
+from . import controllers
 from . import mixins
 from . import models
 from .hooks import post_init_hook, pre_init_hook
 
-__all__ = ["mixins", "models", "post_init_hook", "pre_init_hook"]
+__all__ = ["controllers", "mixins", "models", "post_init_hook", "pre_init_hook"]
@@ -0,0 +1 @@
+from . import motor_image_download
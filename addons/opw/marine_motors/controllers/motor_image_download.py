@@ -0,0 +1,128 @@
+import io
+import logging
+import mimetypes
+import zipfile
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+from odoo import http
+from odoo.http import Response, content_disposition, request
+
+_logger = logging.getLogger(__name__)
+
+ZIP_CHUNK_SIZE = 1024 * 1024
+
+
+class _ZipChunkBuffer(io.RawIOBase):
+    # Unseekable sink: zipfile falls back to data descriptors and everything written is handed to the
+    # response as soon as it is produced, so memory stays at roughly one chunk per request.
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip_chunks(entries: list[tuple[str, Path | bytes]]) -> Iterator[bytes]:
+    buffer = _ZipChunkBuffer()
+    # Photos are already compressed; storing them keeps the CPU cost to a copy.
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zip_file:
+        for archive_name, source in entries:
+            if isinstance(source, bytes):
+                with zip_file.open(archive_name, "w") as member:
+                    member.write(source)
+                yield buffer.drain()
+                continue
+            # Headers are already sent, so a file that vanished or fails to read is skipped rather than
+            # aborting the stream; the archive is still closed with a valid central directory.
+            try:
+                source_file = source.open("rb")
+            except OSError as error:
+                _logger.warning(f"Skipping {archive_name} in motor image zip: {error}")
+                continue
+            with source_file, zip_file.open(archive_name, "w") as member:
+                try:
+                    while chunk := source_file.read(ZIP_CHUNK_SIZE):
+                        member.write(chunk)
+                        yield buffer.drain()
+                except OSError as error:
+                    _logger.warning(f"Truncated {archive_name} in motor image zip: {error}")
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+class MotorImageDownload(http.Controller):
+    @http.route("/marine_motors/motor_images.zip", type="http", auth="user", methods=["GET"])
+    def download_motor_images(self, motor_ids: str = "", **_kwargs: str) -> Response:
+        ids = [int(motor_id) for motor_id in motor_ids.split(",") if motor_id.strip().isdigit()]
+        motors = request.env["motor"].browse(ids).exists()
+        if not motors:
+            return request.not_found()
+        motors.check_access("read")
+
+        entries = self._collect_zip_entries(motors)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H-%M")
+        zip_name = f"{motors.motor_number} {timestamp}.zip" if len(motors) == 1 else f"Motor Images {timestamp}.zip"
+        # The body is generated after the cursor is released, so every entry is resolved to a filestore path up front.
+        return Response(
+            iter_zip_chunks(entries),
+            headers=[("Content-Type", "application/zip"), ("Content-Disposition", content_disposition(zip_name))],
+            direct_passthrough=True,
+        )
+
+    @staticmethod
+    def _collect_zip_entries(motors: "odoo.model.motor") -> list[tuple[str, Path | bytes]]:
+        images = motors.images
+        attachments = (
+            request.env["ir.attachment"]
+            .sudo()
+            .search_fetch(
+                [
+                    ("res_model", "=", "motor.image"),
+                    ("res_field", "=", "image_1920"),
+                    ("res_id", "in", images.ids),
+                    ("file_size", ">", 0),
+                ],
+                ["res_id", "store_fname", "mimetype"],
+            )
+        )
+        attachments_by_image_id = {attachment.res_id: attachment for attachment in attachments}
+
+        entries: list[tuple[str, Path | bytes]] = []
+        used_names: set[str] = set()
+        for motor in motors:
+            for image in motor.images:
+                attachment = attachments_by_image_id.get(image.id)
+                if not attachment:
+                    continue
+                source: Path | bytes
+                if attachment.store_fname:
+                    source = Path(attachment._full_path(attachment.store_fname))
+                    if not source.is_file():
+                        _logger.warning(f"Skipping image {image.id} of motor {motor.motor_number}: missing file {source}")
+                        continue
+                else:
+                    source = attachment.raw
+                    if not source:
+                        continue
+                extension = mimetypes.guess_extension(attachment.mimetype or "") or ".jpg"
+                base_name = f"{motor.motor_number} {image.name}"
+                archive_name = f"{base_name}{extension}"
+                duplicate_index = 1
+                while archive_name in used_names:
+                    duplicate_index += 1
+                    archive_name = f"{base_name} ({duplicate_index}){extension}"
+                used_names.add(archive_name)
+                entries.append((archive_name, source))
+        return entries
@@ -3,6 +3,7 @@ from . import motor_part
 from . import motor_product
 from . import motor_stat
 from . import motor_test
+from . import product_mpn_token
 from . import product_product
 from . import printnode_interface
 from . import product_template
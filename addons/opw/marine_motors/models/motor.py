@@ -1,18 +1,15 @@
 import base64
 import re
-import shutil
-import tempfile
-import zipfile
-from datetime import datetime
 from io import BytesIO
-from pathlib import Path
 from typing import Self
+from urllib.parse import urlencode
 
 import qrcode
 from odoo import api, fields, models
 from odoo.exceptions import UserError, ValidationError
 
 from ..utils import constants
+from ..utils.motor_product_rules import MotorProductRuleIndex
 
 
 class MotorStage(models.Model):
@@ -439,17 +436,11 @@ class Motor(models.Model):
                 return True
         return False
 
-    @staticmethod
-    def _should_exclude_product(motor: "odoo.model.motor", product_template: "odoo.model.motor_product_template") -> bool:
-        return motor._check_product_conditions(motor, product_template.excluded_by_tests)
-
     @staticmethod
     def _should_repair_product(motor: "odoo.model.motor", product_template: "odoo.model.motor_product_template") -> bool:
         return motor._check_product_conditions(motor, product_template.repair_by_tests)
 
     def create_motor_products(self) -> None:
-        product_templates = self.env["motor.product.template"].search([])
-
         for motor in self:
             missing_fields = []
             if not motor.cost:
@@ -464,56 +455,49 @@ class Motor(models.Model):
             if missing_fields:
                 raise UserError(self.env._(f"Motor is missing required fields: {', '.join(missing_fields)}"))
 
-            current_product_ids = set(motor.products.ids)
-
-            for product_template in product_templates:
-                if product_template.strokes and motor.stroke not in product_template.strokes:
-                    continue
-                if product_template.configurations and motor.configuration not in product_template.configurations:
-                    continue
-                if product_template.manufacturers and motor.manufacturer not in product_template.manufacturers:
-                    continue
-
-                if motor.year:
-                    if product_template.year_from and int(motor.year) < product_template.year_from:
-                        continue
-                    if product_template.year_to and int(motor.year) > product_template.year_to:
-                        continue
-
-                if any(part.template.id in product_template.excluded_by_parts.ids and part.is_missing for part in motor.parts):
-                    continue
+        product_templates = self.env["motor.product.template"].search([])
+        rule_index = MotorProductRuleIndex(product_templates)
+        condition_id = self.env.ref("product_metadata.product_condition_used").id
+        has_source_field = "source" in self.env["product.template"]._fields
 
-                if self._should_exclude_product(motor, product_template):
+        product_vals_list: list["odoo.values.product_template"] = []
+        stale_product_ids: set[int] = set()
+        for motor in self:
+            products_by_template: dict[int, list[int]] = {}
+            for product in motor.products:
+                products_by_template.setdefault(product.motor_product_template.id, []).append(product.id)
+            stale_product_ids.update(motor.products.ids)
+
+            for template_id in rule_index.match(motor):
+                existing_product_ids = products_by_template.get(template_id)
+                if existing_product_ids:
+                    stale_product_ids.difference_update(existing_product_ids)
                     continue
+                product_template = product_templates.browse(template_id)
+                product_vals = {
+                    "name": product_template.name,
+                    "motor": motor.id,
+                    "motor_product_template": product_template.id,
+                    "initial_quantity": product_template.initial_quantity or 1,
+                    "bin": product_template.bin,
+                    "weight": product_template.weight,
+                    "condition": condition_id,
+                    "manufacturer": motor.manufacturer.id,
+                    "website_description": product_template.website_description,
+                    "is_ready_for_sale": False,
+                    "part_type": product_template.part_type.id,
+                    "type": "consu",
+                    "is_storable": True,
+                    "sequence": product_template.sequence,
+                }
+                if has_source_field:
+                    product_vals["source"] = "motor"
+                product_vals_list.append(product_vals)
 
-                existing_product = motor.products.filtered(lambda p: p.motor_product_template == product_template)
-
-                if existing_product:
-                    current_product_ids.discard(existing_product.id)
-                else:
-                    condition_id = self.env.ref("product_metadata.product_condition_used").id
-                    product_vals = {
-                        "name": product_template.name,
-                        "motor": motor.id,
-                        "motor_product_template": product_template.id,
-                        "initial_quantity": product_template.initial_quantity or 1,
-                        "bin": product_template.bin,
-                        "weight": product_template.weight,
-                        "condition": condition_id,
-                        "manufacturer": motor.manufacturer.id,
-                        "website_description": product_template.website_description,
-                        "is_ready_for_sale": False,
-                        "part_type": product_template.part_type.id,
-                        "type": "consu",
-                        "is_storable": True,
-                        "sequence": product_template.sequence,
-                    }
-                    if "source" in self.env["product.template"]._fields:
-                        product_vals["source"] = "motor"
-                    motor.products.create([product_vals])
-
-            if current_product_ids:
-                motor.products.filtered(lambda p: p.id in current_product_ids).unlink()
+        if product_vals_list:
+            self.env["product.template"].create(product_vals_list)
+        if stale_product_ids:
+            self.env["product.template"].browse(sorted(stale_product_ids)).unlink()
 
     def _get_cylinder_count(self) -> int:
         match = re.search(r"\d+", self.configuration.name)
@@ -557,40 +541,10 @@ class Motor(models.Model):
             )
 
     def download_zip_of_images(self) -> dict[str, str]:
-        temp_path = Path(tempfile.mkdtemp())
-        zip_path = temp_path / f"{self.motor_number} {datetime.now().strftime('%Y-%m-%d %H-%M')}.zip"
-        with zipfile.ZipFile(zip_path, "w") as zip_file:
-            for motor in self:
-                for image in motor.images:
-                    if not image.image_1920:
-                        continue
-                    filename = f"{motor.motor_number} {image.name}.jpg"
-                    file_path = temp_path / filename
-                    with open(file_path, "wb") as image_file:
-                        image_file.write(base64.b64decode(image.image_1920))
-                    zip_file.write(file_path, filename)
-                    file_path.unlink()
-
-        with open(zip_path, "rb") as zip_file:
-            zip_data = base64.b64encode(zip_file.read())
-
-        attachment = self.env["ir.attachment"].create(
-            [
-                {
-                    "name": zip_path.name,
-                    "datas": zip_data,
-                    "type": "binary",
-                    "mimetype": "application/zip",
-                }
-            ]
-        )
-
-        download_url = f"/odoo/binary/download_single?attachment_id={attachment.id}"
-        shutil.rmtree(temp_path)
-
+        # The controller streams the archive from the filestore; nothing is decoded or stored here.
         return {
             "type": "ir.actions.act_url",
-            "url": download_url,
+            "url": f"/marine_motors/motor_images.zip?{urlencode({'motor_ids': ','.join(map(str, self.ids))})}",
             "target": "self",
         }
 
@@ -2,6 +2,8 @@ from odoo import api, fields, models
 
 from ..utils.constants import YES_NO_SELECTION
 
+MOTOR_TEST_RESULT_FIELDS = ("yes_no_result", "numeric_result", "text_result", "selection_result", "file_result")
+
 
 class MotorTestSection(models.Model):
     _name = "motor.test.section"
@@ -142,8 +144,16 @@ class MotorTest(models.Model):
         related="template.conditional_tests",
     )
 
+    @api.model_create_multi
+    def create(self, vals_list: list["odoo.values.motor_test"]) -> "odoo.model.motor_test":
+        tests = super().create(vals_list)
+        tests._recompute_dependent_applicability()
+        return tests
+
     def write(self, vals: "odoo.values.motor_test") -> bool:
         result = super().write(vals)
+        if {"template", "motor", *MOTOR_TEST_RESULT_FIELDS} & set(vals):
+            self._recompute_dependent_applicability()
         if self.motor and not self.env.context.get("tracking_motor_test"):
             message_text = f"Test '{self.name}' updated"
             if "computed_result" in vals or any(key.endswith("_result") for key in vals):
@@ -151,6 +161,23 @@ class MotorTest(models.Model):
             self.motor.message_post(body=message_text, message_type="comment", subtype_xmlid="mail.mt_note")
         return result
 
+    def unlink(self) -> bool:
+        dependents = self._dependent_tests()
+        result = super().unlink()
+        self.env.add_to_compute(self._fields["is_applicable"], dependents.exists())
+        return result
+
+    def _dependent_tests(self) -> "odoo.model.motor_test":
+        # Applicability reads the results of the templates a test is conditioned on, never their
+        # applicability, so a result change only reaches the tests directly conditioned on it.
+        dependent_template_ids = self.template.conditions.conditional_test.ids
+        if not dependent_template_ids:
+            return self.browse()
+        return self.search([("motor", "in", self.motor.ids), ("template", "in", dependent_template_ids)]) - self
+
+    def _recompute_dependent_applicability(self) -> None:
+        self.env.add_to_compute(self._fields["is_applicable"], self._dependent_tests())
+
     @api.depends("yes_no_result", "numeric_result", "text_result", "selection_result", "file_result")
     def _compute_result(self) -> None:
         for test in self:
@@ -170,38 +197,32 @@ class MotorTest(models.Model):
         "motor.manufacturer",
         "motor.parts.is_missing",
         "motor.parts.hidden_tests",
-        "motor.tests.computed_result",
         "configurations",
         "manufacturers",
         "conditional_tests",
     )
     def _compute_is_applicable(self) -> None:
-        for test in self:
-            test.is_applicable = False
-            if test.configurations and test.motor.configuration not in test.configurations:
-                continue
-            if test.manufacturers and test.motor.manufacturer not in test.manufacturers:
-                continue
-
-            if any(part.is_missing and test.template.id in part.hidden_tests.ids for part in test.motor.parts):
-                continue
-
-            motor_id = test.motor.id or test.motor._origin.id
-
-            if test.conditional_tests and not all(
-                conditional_test.is_condition_met(
-                    self.env["motor.test"]
-                    .search(
-                        [
-                            ("template.id", "=", conditional_test.template.id),
-                            ("motor.id", "=", motor_id),
-                        ],
-                        limit=1,
-                    )
-                    .computed_result
-                )
-                for conditional_test in test.conditional_tests
-            ):
-                continue
-
-            test.is_applicable = True
+        # Results of other tests on the motor are not a dependency here: one result change would
+        # invalidate every test on the motor. _recompute_dependent_applicability() marks only the
+        # tests conditioned on the changed template instead.
+        for motor, tests in self.grouped("motor").items():
+            results_by_template: dict[int, str] = {}
+            for motor_test in motor.tests.sorted():
+                results_by_template.setdefault(motor_test.template.id, motor_test.computed_result)
+            hidden_template_ids = set(motor.parts.filtered("is_missing").hidden_tests.ids)
+            for test in tests:
+                test.is_applicable = test._is_applicable_for(motor, results_by_template, hidden_template_ids)
+
+    def _is_applicable_for(
+        self, motor: "odoo.model.motor", results_by_template: dict[int, str], hidden_template_ids: set[int]
+    ) -> bool:
+        self.ensure_one()
+        if self.configurations and motor.configuration not in self.configurations:
+            return False
+        if self.manufacturers and motor.manufacturer not in self.manufacturers:
+            return False
+        if self.template.id in hidden_template_ids:
+            return False
+        return all(
+            condition.is_condition_met(results_by_template.get(condition.template.id, False)) for condition in self.conditional_tests
+        )
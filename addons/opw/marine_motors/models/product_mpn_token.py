@@ -0,0 +1,43 @@
+from odoo import fields, models
+from odoo.tools import SQL, sql
+
+
+class ProductMpnToken(models.Model):
+    _name = "product.mpn.token"
+    _description = "Product MPN Token"
+    _log_access = False
+    _product_mpn_token_unique = models.Constraint(
+        "unique(product_tmpl_id, token)",
+        "MPN tokens must be unique per product.",
+    )
+
+    product_tmpl_id = fields.Many2one("product.template", required=True, ondelete="cascade", index=True)
+    token = fields.Char(required=True)
+
+    def init(self) -> None:
+        # Reference products match MPN substrings (token LIKE '%mpn%'), which only a trigram GIN index serves.
+        if self.env.registry.has_trigram:
+            sql.create_index(
+                self.env.cr,
+                sql.make_index_name(self._table, "token_trgm"),
+                self._table,
+                ["token gin_trgm_ops"],
+                method="gin",
+            )
+        # Backfill templates that have never been tokenized (module install, or rows written before this table existed).
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO %(token_table)s (product_tmpl_id, token)
+                SELECT DISTINCT template.id, lower(btrim(part, E' \\t\\r\\n'))
+                  FROM product_template template,
+                       regexp_split_to_table(template.mpn, '[, ]') AS part
+                 WHERE template.mpn IS NOT NULL
+                   AND btrim(part, E' \\t\\r\\n') <> ''
+                   AND NOT EXISTS (
+                       SELECT 1 FROM %(token_table)s existing WHERE existing.product_tmpl_id = template.id
+                   )
+                """,
+                token_table=SQL.identifier(self._table),
+            )
+        )
@@ -1,9 +1,11 @@
 import logging
 import re
+from collections.abc import Iterable, Mapping
 from datetime import timedelta
 
 from odoo import api, fields, models
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
 
 _logger = logging.getLogger(__name__)
 
@@ -80,6 +82,7 @@ class ProductTemplate(models.Model):
                     vals["is_ready_for_sale"] = False
 
         products = super().create(vals_list)
+        products.filtered("mpn")._sync_mpn_tokens()
         for product in products:
             if product.motor_product_template:
                 product._compute_motor_product_computed_name()
@@ -164,8 +167,22 @@ class ProductTemplate(models.Model):
             if product.motor and any(field in vals_to_write for field in ui_refresh_fields):
                 product.motor.notify_changes()
 
+        if "mpn" in vals:
+            self._sync_mpn_tokens()
+
         return all(write_results)
 
+    def _sync_mpn_tokens(self) -> None:
+        token_model = self.env["product.mpn.token"].sudo()
+        token_model.search([("product_tmpl_id", "in", self.ids)]).unlink()
+        token_model.create(
+            [
+                {"product_tmpl_id": product.id, "token": token}
+                for product in self
+                for token in dict.fromkeys(mpn.lower() for mpn in product.get_list_of_mpns())
+            ]
+        )
+
     def _track_template(self, changes: set[str]) -> dict[str, tuple[str, dict]]:
         self.ensure_one()
         result = super()._track_template(changes)
@@ -187,10 +204,18 @@ class ProductTemplate(models.Model):
 
     @api.depends("repairs.state")
     def _compute_open_repair_count(self) -> None:
-        for product in self:
-            product.open_repair_count = self.env["repair.order"].search_count(
-                [("product_id", "in", product.product_variant_ids.ids), ("state", "not in", ["done", "cancel"])]
+        variant_ids = [variant_id for variant_id in self.product_variant_ids.ids if variant_id]
+        open_repair_counts = dict(
+            self.env["repair.order"]._read_group(
+                [("product_id", "in", variant_ids), ("state", "not in", ["done", "cancel"])],
+                groupby=["product_id"],
+                aggregates=["__count"],
             )
+            if variant_ids
+            else []
+        )
+        for product in self:
+            product.open_repair_count = sum(open_repair_counts.get(variant, 0) for variant in product.product_variant_ids)
 
     @api.depends(
         "motor_product_template.repair_by_tech_results",
@@ -303,16 +328,47 @@ class ProductTemplate(models.Model):
 
     @api.depends("mpn")
     def _compute_reference_product(self) -> None:
-        for product in self:
-            source_value = getattr(product, "source", None)
-            if source_value == "standard" or not product.mpn:
-                product.reference_product = False
-                continue
-            products = self.env["product.template"].search([("mpn", "!=", False), ("image_256", "!=", False)])
-            product_mpns = product.get_list_of_mpns()
-            matching_products = products.filtered(lambda p: any(mpn.lower() in p.mpn.lower() for mpn in product_mpns))
-            latest_product = max(matching_products, key=lambda p: p.create_date, default=None)
-            product.reference_product = latest_product
+        mpns_by_position = {
+            position: product.get_list_of_mpns()
+            for position, product in enumerate(self)
+            if getattr(product, "source", None) != "standard" and product.mpn
+        }
+        reference_ids = self._resolve_reference_product_ids(mpns_by_position)
+        for position, product in enumerate(self):
+            product.reference_product = reference_ids.get(position, False)
+
+    @api.model
+    def _resolve_reference_product_ids(self, mpns_by_key: Mapping[int, Iterable[str]]) -> dict[int, int]:
+        # The newest pictured product with an MPN containing any of the given MPNs, for every key in one
+        # query. A separator-free MPN can only occur inside a single token, so matching against the token
+        # index is equivalent to the substring match on the full MPN field.
+        keys: list[int] = []
+        patterns: list[str] = []
+        for key, mpns in mpns_by_key.items():
+            for mpn in dict.fromkeys(mpn.lower() for mpn in mpns if mpn):
+                escaped_mpn = mpn.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                keys.append(key)
+                patterns.append(f"%{escaped_mpn}%")
+        if not keys:
+            return {}
+        self.env["product.mpn.token"].flush_model()
+        candidates = self.env["product.template"]._search([("mpn", "!=", False), ("image_256", "!=", False)])
+        rows = self.env.execute_query(
+            SQL(
+                """
+                SELECT DISTINCT ON (wanted.key) wanted.key, candidate.id
+                  FROM unnest(%s::int[], %s::text[]) AS wanted(key, pattern)
+                  JOIN product_mpn_token token ON token.token LIKE wanted.pattern
+                  JOIN product_template candidate ON candidate.id = token.product_tmpl_id
+                 WHERE candidate.id IN %s
+                 ORDER BY wanted.key, candidate.create_date DESC, candidate.id DESC
+                """,
+                keys,
+                patterns,
+                candidates.subselect(),
+            )
+        )
+        return dict(rows)
 
     def _compute_name_with_tags_length(self) -> None:
         for product in self:
@@ -342,19 +398,26 @@ class ProductTemplate(models.Model):
 
     @api.depends("images.image_1920")
     def _compute_image_count(self) -> None:
-        for product in self:
-            image_ids = product.images.ids
-            if not image_ids:
-                product.image_count = 0
-                continue
-            product.image_count = self.env["ir.attachment"].search_count(
+        image_ids = [image_id for image_id in self.images.ids if image_id]
+        # One grouped attachment count for every image of the batch instead of one search_count per product.
+        stored_image_counts = dict(
+            self.env["ir.attachment"]
+            .sudo()
+            ._read_group(
                 [
                     ("res_model", "=", "product.image"),
                     ("res_id", "in", image_ids),
                     ("res_field", "=", "image_1920"),
                     ("file_size", ">", 0),
-                ]
+                ],
+                groupby=["res_id"],
+                aggregates=["__count"],
             )
+            if image_ids
+            else []
+        )
+        for product in self:
+            product.image_count = sum(stored_image_counts.get(image_id, 0) for image_id in product.images.ids)
 
     @api.depends("list_price", "standard_price")
     def _compute_is_price_or_cost_missing(self) -> None:
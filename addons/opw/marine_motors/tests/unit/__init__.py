@@ -2,4 +2,7 @@
 from . import test_migration_state_preservation
 from . import test_model_motor
 from . import test_model_motor_product_template
+from . import test_model_motor_test
 from . import test_model_motor_workflow
+from . import test_model_product_template
+from . import test_motor_image_download
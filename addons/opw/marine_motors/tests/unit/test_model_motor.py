@@ -117,6 +117,29 @@ class TestMotor(UnitTestCase):
         self.assertEqual(len(products_2010_with_template), 1, "Motor from 2010 should have the universal product from this template")
         self.assertEqual(len(products_2025_with_template), 1, "Motor from 2025 should have the universal product from this template")
 
+    def test_create_motor_products_applies_stroke_and_missing_part_rules(self) -> None:
+        motor = self._create_test_motor(year=2018, cost=100.0)
+        other_stroke = self.env["motor.stroke"].sudo().create({"name": "2-Stroke", "code": "2"})
+        part_template = self.env["motor.part.template"].create({"name": "Lower Unit"})
+        part_type = self.env["product.type"].create({"name": "Test Type"})
+        universal_template, stroke_template, part_excluded_template = self.env["motor.product.template"].create(
+            [
+                {"name": "Universal Part", "part_type": part_type.id},
+                {"name": "Other Stroke Part", "strokes": [(6, 0, [other_stroke.id])], "part_type": part_type.id},
+                {"name": "Gearcase", "excluded_by_parts": [(6, 0, [part_template.id])], "part_type": part_type.id},
+            ]
+        )
+        self.env["motor.part"].create({"motor": motor.id, "template": part_template.id, "is_missing": True})
+
+        motor.create_motor_products()
+        motor.create_motor_products()
+
+        product_templates = motor.products.motor_product_template
+        self.assertIn(universal_template, product_templates)
+        self.assertNotIn(stroke_template, product_templates)
+        self.assertNotIn(part_excluded_template, product_templates)
+        self.assertEqual(len(motor.products.filtered(lambda p: p.motor_product_template == universal_template)), 1)
+
     def test_create_motor_product_generation(self) -> None:
         product = MotorFactory.create(self.env)
         motor = product.motor
@@ -0,0 +1,51 @@
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+from ..fixtures.factories import MotorFactory
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestMotorTestApplicability(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        section = self.env["motor.test.section"].create({"name": "Applicability"})
+        template_values = {"result_type": "yes_no", "stage": "basic", "section": section.id}
+        self.trigger_template = self.env["motor.test.template"].create({"name": "Runs", **template_values})
+        self.dependent_template = self.env["motor.test.template"].create({"name": "Idle Quality", **template_values})
+        self.unrelated_template = self.env["motor.test.template"].create({"name": "Paint", **template_values})
+        self.env["motor.test.template.condition"].create(
+            {
+                "template": self.trigger_template.id,
+                "conditional_test": self.dependent_template.id,
+                "conditional_operator": "=",
+                "condition_value": "Yes",
+                "action_type": "show",
+            }
+        )
+        self.motor = MotorFactory.create(self.env).motor
+        tests = self.motor.tests
+        self.trigger_test = tests.filtered(lambda test: test.template == self.trigger_template)
+        self.dependent_test = tests.filtered(lambda test: test.template == self.dependent_template)
+        self.unrelated_test = tests.filtered(lambda test: test.template == self.unrelated_template)
+
+    def test_conditional_test_follows_trigger_result(self) -> None:
+        self.assertFalse(self.dependent_test.is_applicable)
+        self.assertTrue(self.unrelated_test.is_applicable)
+
+        self.trigger_test.write({"yes_no_result": "yes"})
+
+        self.assertTrue(self.dependent_test.is_applicable)
+
+        self.trigger_test.write({"yes_no_result": "no"})
+
+        self.assertFalse(self.dependent_test.is_applicable)
+
+    def test_result_change_only_recomputes_dependent_tests(self) -> None:
+        self.env.flush_all()
+        applicability_field = self.env["motor.test"]._fields["is_applicable"]
+
+        self.trigger_test.with_context(tracking_motor_test=True).write({"yes_no_result": "yes"})
+
+        pending = self.env.records_to_compute(applicability_field)
+        self.assertIn(self.dependent_test, pending)
+        self.assertNotIn(self.unrelated_test, pending)
+        self.assertNotIn(self.trigger_test, pending)
@@ -0,0 +1,75 @@
+from test_support.tests.fixtures.factories import ProductFactory
+
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+
+VALID_IMAGE_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+aY6sAAAAASUVORK5CYII="
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestProductTemplateReferenceProduct(UnitTestCase):
+    def _pictured_product(self, mpn: str) -> "odoo.model.product_template":
+        product = ProductFactory.create(self.env, mpn=mpn, source="import")
+        self.env["product.image"].create({"name": "Reference", "image_1920": VALID_IMAGE_BASE64, "product_tmpl_id": product.id})
+        return product
+
+    def test_mpn_tokens_follow_writes(self) -> None:
+        product = ProductFactory.create(self.env, mpn="ABC-1, xyz_2", source="import")
+        token_model = self.env["product.mpn.token"].sudo()
+
+        self.assertEqual(sorted(token_model.search([("product_tmpl_id", "=", product.id)]).mapped("token")), ["abc-1", "xyz_2"])
+
+        product.write({"mpn": "DEF-3"})
+
+        self.assertEqual(token_model.search([("product_tmpl_id", "=", product.id)]).mapped("token"), ["def-3"])
+
+    def test_reference_product_is_newest_pictured_substring_match(self) -> None:
+        older_reference = self._pictured_product("ZZ-1234-00 OTHER")
+        newer_reference = self._pictured_product("ZZ-1234-01")
+        self._pictured_product("ZZX1234")
+        ProductFactory.create(self.env, mpn="ZZ-1234-02", source="import")
+
+        products = ProductFactory.create(self.env, mpn="zz-1234", source="import") | ProductFactory.create(
+            self.env, mpn="OTHER", source="import"
+        )
+        standard_product = ProductFactory.create(self.env, mpn="ZZ-1234", source="standard")
+
+        self.assertEqual(products[0].reference_product, newer_reference)
+        self.assertEqual(products[1].reference_product, older_reference)
+        self.assertFalse(standard_product.reference_product)
+
+    def test_reference_product_escapes_like_wildcards(self) -> None:
+        self._pictured_product("AB1CD")
+
+        product = ProductFactory.create(self.env, mpn="AB_CD", source="import")
+
+        self.assertFalse(product.reference_product)
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestProductTemplateBatchCounts(UnitTestCase):
+    def test_image_count_is_computed_for_the_whole_batch(self) -> None:
+        pictured_product = ProductFactory.create(self.env)
+        unpictured_product = ProductFactory.create(self.env)
+        self.env["product.image"].create(
+            [
+                {"name": f"Image {index}", "image_1920": VALID_IMAGE_BASE64, "product_tmpl_id": pictured_product.id}
+                for index in range(2)
+            ]
+        )
+        products = pictured_product | unpictured_product
+
+        self.env.add_to_compute(products._fields["image_count"], products)
+        products._recompute_recordset(["image_count"])
+
+        self.assertEqual(products.mapped("image_count"), [2, 0])
+
+    def test_open_repair_count_ignores_closed_repairs(self) -> None:
+        product = ProductFactory.create(self.env)
+        other_product = ProductFactory.create(self.env)
+        repairs = self.env["repair.order"].create([{"product_id": product.product_variant_id.id} for _ in range(2)])
+
+        repairs[1].action_repair_cancel()
+
+        self.assertEqual(product.open_repair_count, 1)
+        self.assertEqual(other_product.open_repair_count, 0)
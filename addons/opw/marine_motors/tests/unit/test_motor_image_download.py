@@ -0,0 +1,46 @@
+import io
+import tempfile
+import zipfile
+from pathlib import Path
+
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+from ..fixtures.factories import MotorFactory
+
+from ...controllers.motor_image_download import ZIP_CHUNK_SIZE, iter_zip_chunks
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestMotorImageDownload(UnitTestCase):
+    def test_iter_zip_chunks_streams_files_in_bounded_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as directory_name:
+            image_path = Path(directory_name) / "image.jpg"
+            image_path.write_bytes(b"x" * (ZIP_CHUNK_SIZE * 2 + 1))
+
+            chunks = list(iter_zip_chunks([("M-000001 Port Side.jpg", image_path), ("M-000001 Data Label.jpg", b"label")]))
+
+        self.assertLess(max(len(chunk) for chunk in chunks), ZIP_CHUNK_SIZE * 2)
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+            self.assertEqual(zip_file.namelist(), ["M-000001 Port Side.jpg", "M-000001 Data Label.jpg"])
+            self.assertEqual(len(zip_file.read("M-000001 Port Side.jpg")), ZIP_CHUNK_SIZE * 2 + 1)
+            self.assertEqual(zip_file.read("M-000001 Data Label.jpg"), b"label")
+
+    def test_iter_zip_chunks_skips_missing_files_and_closes_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as directory_name:
+            missing_path = Path(directory_name) / "deleted.jpg"
+            with self.assertLogs("odoo.addons.marine_motors.controllers.motor_image_download", level="WARNING"):
+                archive = b"".join(iter_zip_chunks([("M-000001 Gone.jpg", missing_path), ("M-000001 Data Label.jpg", b"label")]))
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+            self.assertIsNone(zip_file.testzip())
+            self.assertEqual(zip_file.namelist(), ["M-000001 Data Label.jpg"])
+
+    def test_download_zip_of_images_points_to_streaming_endpoint(self) -> None:
+        motors = MotorFactory.create(self.env).motor | MotorFactory.create(self.env).motor
+        attachment_count = self.env["ir.attachment"].search_count([])
+
+        action = motors.download_zip_of_images()
+
+        self.assertEqual(action["type"], "ir.actions.act_url")
+        self.assertIn(f"motor_ids={motors[0].id}%2C{motors[1].id}", action["url"])
+        self.assertEqual(self.env["ir.attachment"].search_count([]), attachment_count)
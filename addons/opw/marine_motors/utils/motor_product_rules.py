@@ -0,0 +1,72 @@
+from collections import defaultdict
+from itertools import product as cartesian_product
+from typing import NamedTuple
+
+# Empty stroke/configuration/manufacturer sets on a motor product template mean "any" and are indexed under None.
+RuleKey = tuple[int | None, int | None, int | None]
+
+
+class MotorProductRule(NamedTuple):
+    position: int
+    template_id: int
+    year_from: int
+    year_to: int
+    excluded_part_template_ids: frozenset[int]
+    exclusion_conditions: tuple["odoo.model.motor_product_template_condition", ...]
+
+
+class MotorProductRuleIndex:
+    # Motor product templates compiled once per create_motor_products() call. Rules are bucketed by every
+    # (stroke, configuration, manufacturer) combination they accept, so a motor only looks at the eight
+    # buckets its own values (or "any") can hit instead of every template.
+    def __init__(self, product_templates: "odoo.model.motor_product_template") -> None:
+        self._rules_by_key: dict[RuleKey, list[MotorProductRule]] = defaultdict(list)
+        for position, product_template in enumerate(product_templates):
+            rule = MotorProductRule(
+                position=position,
+                template_id=product_template.id,
+                year_from=product_template.year_from,
+                year_to=product_template.year_to,
+                excluded_part_template_ids=frozenset(product_template.excluded_by_parts.ids),
+                exclusion_conditions=tuple(product_template.excluded_by_tests),
+            )
+            for key in cartesian_product(
+                product_template.strokes.ids or [None],
+                product_template.configurations.ids or [None],
+                product_template.manufacturers.ids or [None],
+            ):
+                self._rules_by_key[key].append(rule)
+
+    def match(self, motor: "odoo.model.motor") -> list[int]:
+        candidates: dict[int, MotorProductRule] = {}
+        for key in cartesian_product(
+            {motor.stroke.id, None},
+            {motor.configuration.id, None},
+            {motor.manufacturer.id, None},
+        ):
+            for rule in self._rules_by_key.get(key, ()):
+                candidates[rule.position] = rule
+        if not candidates:
+            return []
+
+        year = int(motor.year) if motor.year else None
+        missing_part_template_ids = set(motor.parts.filtered("is_missing").template.ids)
+        results_by_test_template: dict[int, list[str]] = defaultdict(list)
+        for test in motor.tests:
+            results_by_test_template[test.template.id].append(test.computed_result)
+
+        matched_template_ids: list[int] = []
+        for position in sorted(candidates):
+            rule = candidates[position]
+            if year is not None and ((rule.year_from and year < rule.year_from) or (rule.year_to and year > rule.year_to)):
+                continue
+            if rule.excluded_part_template_ids & missing_part_template_ids:
+                continue
+            if any(
+                condition.is_condition_met(result)
+                for condition in rule.exclusion_conditions
+                for result in results_by_test_template.get(condition.conditional_test.id, ())
+            ):
+                continue
+            matched_template_ids.append(rule.template_id)
+        return matched_template_ids
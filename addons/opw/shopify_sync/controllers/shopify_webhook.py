@@ -1,10 +1,10 @@
 import hmac, hashlib, base64, json
 
-from odoo import http
+from odoo import api, http
 from odoo.http import Response
 from werkzeug.exceptions import Unauthorized, BadRequest
 
-from ..services.shopify.helpers import SyncMode, ShopifyApiError
+from ..services.shopify.helpers import WEBHOOK_DEBOUNCE_SECONDS, SyncMode, ShopifyApiError
 
 
 class ShopifyWebhook(http.Controller):
@@ -46,16 +46,42 @@ class ShopifyWebhook(http.Controller):
             payload = json.loads(raw_body)
         except json.JSONDecodeError as decode_error:
             raise BadRequest() from decode_error
-        if not payload.get("id"):
+        # inventory_levels payloads carry no id of their own, only the inventory item they belong to.
+        if topic.startswith(self.INVENTORY_TOPICS):
+            resource_id = payload.get("inventory_item_id") or payload.get("id")
+        else:
+            resource_id = payload.get("id")
+        if not resource_id:
             raise BadRequest()
 
-        if topic.startswith(self.PRODUCT_TOPICS + self.INVENTORY_TOPICS):
-            env["shopify.sync"].create_and_run_async({"mode": SyncMode.IMPORT_THEN_EXPORT_PRODUCTS.value, "user": shopify_user.id})
+        if topic.startswith(self.PRODUCT_TOPICS):
+            self._queue_webhook_import(env, "product", resource_id, topic, SyncMode.IMPORT_WEBHOOK_PRODUCTS, shopify_user)
+
+        elif topic.startswith(self.INVENTORY_TOPICS):
+            # The product sync resolves inventory items to their products before importing.
+            self._queue_webhook_import(env, "inventory_item", resource_id, topic, SyncMode.IMPORT_WEBHOOK_PRODUCTS, shopify_user)
 
         elif topic.startswith(self.ORDER_TOPICS):
-            env["shopify.sync"].create_and_run_async({"mode": SyncMode.IMPORT_CHANGED_ORDERS.value, "user": shopify_user.id})
+            self._queue_webhook_import(env, "order", resource_id, topic, SyncMode.IMPORT_WEBHOOK_ORDERS, shopify_user)
 
         elif topic.startswith(self.CUSTOMER_TOPICS):
-            env["shopify.sync"].create_and_run_async({"mode": SyncMode.IMPORT_CHANGED_CUSTOMERS.value, "user": shopify_user.id})
+            self._queue_webhook_import(env, "customer", resource_id, topic, SyncMode.IMPORT_WEBHOOK_CUSTOMERS, shopify_user)
 
         return http.Response(json.dumps({"status": "ok"}), content_type="application/json")
+
+    @staticmethod
+    def _queue_webhook_import(
+        env: api.Environment,
+        resource_type: str,
+        resource_id: int | str,
+        topic: str,
+        mode: SyncMode,
+        shopify_user: "odoo.model.res_users",
+    ) -> None:
+        # A burst of events records one inbox row each but only creates one queued sync: the
+        # delayed dispatch lets the burst land, and queued duplicates are dropped by create().
+        env["shopify.webhook.event"].sudo().record_event(resource_type, resource_id, topic)
+        env["shopify.sync"].create_and_run_async(
+            {"mode": mode.value, "user": shopify_user.id},
+            delay_seconds=WEBHOOK_DEBOUNCE_SECONDS,
+        )
@@ -8,3 +8,4 @@ from . import res_partner
 from . import sale_order
 from . import sale_order_line
 from . import shopify_sync
+from . import shopify_webhook_event
@@ -7,6 +7,10 @@ class ProductImage(models.Model):
     _name = "product.image"
     _inherit = ["product.image", "external.id.mixin"]
 
+    # Backs the image write-date probes in the Shopify export candidate query.
+    _shopify_export_template_write_date_idx = models.Index("(product_tmpl_id, write_date)")
+    _shopify_export_variant_write_date_idx = models.Index("(product_variant_id, write_date) WHERE product_variant_id IS NOT NULL")
+
     def _mark_for_shopify_product_export(self) -> None:
         products_to_mark: "odoo.model.product_product" = self.env["product.product"]
         products_to_mark |= self.mapped("product_variant_id")
@@ -22,10 +22,12 @@ from ..services.shopify.helpers import (
     ShopifySyncCanceled,
     ShopifyStaleRunTimeout,
     ShopifySyncRunFailed,
+    SyncLane,
     SyncMode,
     format_datetime_for_shopify,
     last_import_config_key,
 )
+from ..services.shopify.sync.base import ShopifyBaseImporter
 
 _logger = logging.getLogger(__name__)
 
@@ -49,6 +51,11 @@ class ShopifySync(models.TransientModel):
     )
 
     LOCK_ID = 87945012
+    LANE_LOCK_IDS = {
+        SyncLane.ORDERS: 87945013,
+        SyncLane.CUSTOMERS: 87945014,
+        SyncLane.PRODUCTS: 87945015,
+    }
     IMPORT_EXPORT_CRON_TIME = 60 * 60
     CRON_IDLE_TIMEOUT_THRESHOLD_SECONDS = 10 * 60
 
@@ -61,6 +68,7 @@ class ShopifySync(models.TransientModel):
     run_time_human = fields.Char(compute="_compute_run_time", string="Run Time")
 
     mode = fields.Selection(SyncMode.choices(), required=True, index=True)
+    lane = fields.Selection(SyncLane.choices(), compute="_compute_lane", store=True, index=True)
     odoo_products_to_sync = fields.Many2many("product.product")
     shopify_product_id_to_sync = fields.Char(string="Shopify Product ID")
     datetime_to_sync = fields.Datetime()
@@ -155,6 +163,11 @@ class ShopifySync(models.TransientModel):
 
         return super().unlink()
 
+    @api.depends("mode")
+    def _compute_lane(self) -> None:
+        for record in self:
+            record.lane = SyncMode(record.mode).lane.value if record.mode else False
+
     @api.depends("updated_count", "total_count")
     def _compute_progress_percent(self) -> None:
         for record in self:
@@ -279,20 +292,49 @@ class ShopifySync(models.TransientModel):
                 run.write(vals)
 
     @api.model
-    def _cron_dispatch_next(self) -> None:
+    def _cron_dispatch_next(self, lane: str | None = None) -> None:
+        # Each lane has its own lock and running slot, so a long product run no longer
+        # delays webhook-driven order imports; the shared cost bucket keeps lanes within budget.
+        for sync_lane in [SyncLane(lane)] if lane else list(SyncLane):
+            self._dispatch_lane(sync_lane)
+
+        if self.search([("lane", "=", SyncLane.PRODUCTS.value), ("state", "in", ["running", "queued"])], limit=1):
+            _logger.debug("Product sync is running; exiting dispatcher.")
+            return
+
+        if self.env["ir.config_parameter"].sudo().get_param("shopify.pause_sync_autoschedule") == "1":
+            _logger.debug("Shopify autoschedule is paused; exiting dispatcher without creating health-check syncs.")
+            return
+
+        now = fields.Datetime.now()
+        cutoff = fields.Datetime.subtract(now, seconds=self.IMPORT_EXPORT_CRON_TIME)
+
+        def _is_healthy(mode: SyncMode) -> bool:
+            in_flight = self.search_count([("mode", "=", mode.value), ("state", "in", ["queued", "running"])])
+            recent = self.search_count([("mode", "=", mode.value), ("state", "=", "success"), ("start_time", ">=", cutoff)])
+            return bool(in_flight or recent)
+
+        healthy_import = _is_healthy(SyncMode.IMPORT_THEN_EXPORT_PRODUCTS)
+        healthy_export = _is_healthy(SyncMode.EXPORT_CHANGED_PRODUCTS)
+
+        if not (healthy_import and healthy_export):
+            self.create({"mode": SyncMode.IMPORT_THEN_EXPORT_PRODUCTS.value})
+
+    @api.model
+    def _dispatch_lane(self, lane: SyncLane) -> None:
         while True:
-            with self._advisory_lock(self.LOCK_ID) as lock_acquired:
+            with self._advisory_lock(self.LANE_LOCK_IDS[lane]) as lock_acquired:
                 if not lock_acquired:
-                    _logger.debug("Another worker already running; skipping.")
+                    _logger.debug(f"Another worker already dispatching the {lane} lane; skipping.")
                     return
 
                 self._fail_stale_runs()
-                if self.search([("state", "=", "running")], limit=1):
-                    _logger.debug("Sync already running; skipping.")
+                if self.search([("lane", "=", lane.value), ("state", "=", "running")], limit=1):
+                    _logger.debug(f"Sync already running in the {lane} lane; skipping.")
                     return
 
                 next_sync = self.search(
-                    [("state", "=", "queued")],
+                    [("lane", "=", lane.value), ("state", "=", "queued")],
                     order="retry_attempts desc, id asc",
                     limit=1,
                 )
@@ -306,8 +348,8 @@ class ShopifySync(models.TransientModel):
             self._safe_commit()
 
             if not next_sync:
-                _logger.debug("No queued syncs found; exiting dispatcher.")
-                break
+                _logger.debug(f"No queued syncs in the {lane} lane.")
+                return
 
             try:
                 next_sync._execute_mode()
@@ -322,29 +364,7 @@ class ShopifySync(models.TransientModel):
                 self._safe_rollback()
                 raise
 
-        if self.search([("state", "in", ["running", "queued"])], limit=1):
-            _logger.debug("Another sync is running; exiting dispatcher.")
-            return
-
-        if self.env["ir.config_parameter"].sudo().get_param("shopify.pause_sync_autoschedule") == "1":
-            _logger.debug("Shopify autoschedule is paused; exiting dispatcher without creating health-check syncs.")
-            return
-
-        now = fields.Datetime.now()
-        cutoff = fields.Datetime.subtract(now, seconds=self.IMPORT_EXPORT_CRON_TIME)
-
-        def _is_healthy(mode: SyncMode) -> bool:
-            in_flight = self.search_count([("mode", "=", mode.value), ("state", "in", ["queued", "running"])])
-            recent = self.search_count([("mode", "=", mode.value), ("state", "=", "success"), ("start_time", ">=", cutoff)])
-            return bool(in_flight or recent)
-
-        healthy_import = _is_healthy(SyncMode.IMPORT_THEN_EXPORT_PRODUCTS)
-        healthy_export = _is_healthy(SyncMode.EXPORT_CHANGED_PRODUCTS)
-
-        if not (healthy_import and healthy_export):
-            self.create({"mode": SyncMode.IMPORT_THEN_EXPORT_PRODUCTS.value})
-
-    def run_async(self) -> None:
+    def run_async(self, delay_seconds: float = 0) -> None:
         if config["stop_after_init"]:
             _logger.debug("Skipping async sync in stop_after_init mode")
             return
@@ -356,23 +376,27 @@ class ShopifySync(models.TransientModel):
         _logger.debug(f"Running async sync for {self}")
 
         def run_in_thread() -> None:
+            if delay_seconds:
+                sleep(delay_seconds)
             with self.env.registry.cursor() as cr:
                 thread_env = self.env(cr)
                 sync_jobs = thread_env["shopify.sync"].sudo().browse(self.ids)
                 for sync_job in sync_jobs:
-                    sync_job._cron_dispatch_next()
+                    sync_job._cron_dispatch_next(lane=sync_job.lane)
 
         threading.Thread(target=run_in_thread, daemon=True).start()
 
     def create_and_run_async(
-        self, vals_list: Union["odoo.values.shopify_sync", list["odoo.values.shopify_sync"]]
+        self,
+        vals_list: Union["odoo.values.shopify_sync", list["odoo.values.shopify_sync"]],
+        delay_seconds: float = 0,
     ) -> "odoo.model.shopify_sync":
         if isinstance(vals_list, dict):
             vals_list = [vals_list]
 
         sync_jobs = self.create(vals_list)
         if sync_jobs:
-            sync_jobs.run_async()
+            sync_jobs.run_async(delay_seconds)
         return sync_jobs
 
     @api.model
@@ -554,8 +578,23 @@ class ShopifySync(models.TransientModel):
         importer = ProductImporter(self.env, self)
         importer.run()
 
+    def _run_import_all_products_bulk(self) -> None:
+        _logger.info("Importing all products from Shopify through a bulk operation")
+        from ..services.shopify import ProductImporter
+
+        self.last_import_start_time = fields.Datetime.now()
+        importer = ProductImporter(self.env, self)
+        importer.run_bulk()
+
     def _run_export_all_products(self) -> None:
         _logger.info("Exporting all products to Shopify")
+        self._export_all_products(bulk=False)
+
+    def _run_export_all_products_bulk(self) -> None:
+        _logger.info("Exporting all products to Shopify through a bulk productSet run")
+        self._export_all_products(bulk=True)
+
+    def _export_all_products(self, *, bulk: bool) -> None:
         from ..services.shopify import ProductExporter
 
         exporter = ProductExporter(self.env, self)
@@ -573,7 +612,10 @@ class ShopifySync(models.TransientModel):
                 }
             )
 
-        exporter.export_products(products_to_export)
+        if bulk:
+            exporter.export_products_bulk(products_to_export)
+        else:
+            exporter.export_products(products_to_export)
 
     def _run_import_then_export_products(self) -> None:
         self._run_import_changed_products()
@@ -609,6 +651,46 @@ class ShopifySync(models.TransientModel):
         exporter = ProductExporter(self.env, self)
         exporter.export_products(self.odoo_products_to_sync)
 
+    def _run_import_webhook_products(self) -> None:
+        _logger.info("Importing webhook products from Shopify")
+        from ..services.shopify import ProductImporter
+
+        importer = ProductImporter(self.env, self)
+        webhook_events = self.env["shopify.webhook.event"]
+        # Inventory webhooks only name the inventory item; resolve them to products and feed them through the product inbox.
+        inventory_events = webhook_events._pending_events("inventory_item")
+        if inventory_events:
+            inventory_item_ids = inventory_events._coalesced_ids(inventory_events)
+            product_ids = importer.product_ids_for_inventory_items(inventory_item_ids)
+            _logger.info(f"Resolved {len(inventory_item_ids)} inventory item(s) to {len(product_ids)} product(s)")
+            for product_id in product_ids:
+                webhook_events.record_event("product", product_id, "inventory_items/resolved")
+            inventory_events.unlink()
+
+        self._import_webhook_events("product", importer, follow_up_resource_types=["inventory_item"])
+        if self.updated_count:
+            self.env["shopify.sync"].create({"mode": SyncMode.EXPORT_CHANGED_PRODUCTS.value, "state": "queued"})
+
+    def _import_webhook_events(
+        self,
+        resource_type: str,
+        importer: ShopifyBaseImporter,
+        *,
+        follow_up_resource_types: list[str] | None = None,
+    ) -> None:
+        webhook_events = self.env["shopify.webhook.event"]
+        events = webhook_events._pending_events(resource_type)
+        shopify_ids = events._coalesced_ids(events)
+        if shopify_ids:
+            _logger.info(f"Importing {len(shopify_ids)} {resource_type}(s) from {len(events)} webhook event(s)")
+            importer.run_by_ids(shopify_ids)
+        events.unlink()
+        # A webhook that landed after the inbox was read may have been deduplicated against this run while it
+        # was still queued. Commit, look again from a fresh snapshot and queue a follow-up for anything left.
+        self._safe_commit()
+        if webhook_events._has_pending_events([resource_type, *(follow_up_resource_types or [])]):
+            self.env["shopify.sync"].create({"mode": self.mode, "user": self.user.id})
+
     def _run_import_products_since_date(self) -> None:
         _logger.info("Importing products from Shopify since a specific date")
         from ..services.shopify import ProductImporter
@@ -637,6 +719,14 @@ class ShopifySync(models.TransientModel):
         importer = OrderImporter(self.env, self)
         importer.run()
 
+    def _run_import_all_orders_bulk(self) -> None:
+        _logger.info("Importing all orders from Shopify through a bulk operation")
+        from ..services.shopify import OrderImporter
+
+        self.last_import_start_time = fields.Datetime.now()
+        importer = OrderImporter(self.env, self)
+        importer.run_bulk()
+
     def _run_import_changed_orders(self) -> None:
         _logger.info("Importing changed orders from Shopify")
         from ..services.shopify import OrderImporter
@@ -652,6 +742,12 @@ class ShopifySync(models.TransientModel):
         importer = OrderImporter(self.env, self)
         importer.run_by_id(self.shopify_product_id_to_sync)
 
+    def _run_import_webhook_orders(self) -> None:
+        _logger.info("Importing webhook orders from Shopify")
+        from ..services.shopify import OrderImporter
+
+        self._import_webhook_events("order", OrderImporter(self.env, self))
+
     def _run_import_all_customers(self) -> None:
         _logger.info("Importing all customers from Shopify")
         from ..services.shopify import CustomerImporter
@@ -660,6 +756,14 @@ class ShopifySync(models.TransientModel):
         importer = CustomerImporter(self.env, self)
         importer.run()
 
+    def _run_import_all_customers_bulk(self) -> None:
+        _logger.info("Importing all customers from Shopify through a bulk operation")
+        from ..services.shopify import CustomerImporter
+
+        self.last_import_start_time = fields.Datetime.now()
+        importer = CustomerImporter(self.env, self)
+        importer.run_bulk()
+
     def _run_import_changed_customers(self) -> None:
         _logger.info("Importing changed customers from Shopify")
         from ..services.shopify import CustomerImporter
@@ -674,3 +778,9 @@ class ShopifySync(models.TransientModel):
 
         importer = CustomerImporter(self.env, self)
         importer.run_by_id(self.shopify_product_id_to_sync)
+
+    def _run_import_webhook_customers(self) -> None:
+        _logger.info("Importing webhook customers from Shopify")
+        from ..services.shopify import CustomerImporter
+
+        self._import_webhook_events("customer", CustomerImporter(self.env, self))
@@ -0,0 +1,36 @@
+from odoo import api, fields, models
+
+
+class ShopifyWebhookEvent(models.Model):
+    # A regular model: events are only removed once a sync has imported them, never by the transient vacuum.
+    _name = "shopify.webhook.event"
+    _description = "Shopify Webhook Event"
+
+    resource_type = fields.Selection(
+        selection=[
+            ("product", "Product"),
+            ("order", "Order"),
+            ("customer", "Customer"),
+            ("inventory_item", "Inventory Item"),
+        ],
+        required=True,
+        index=True,
+    )
+    shopify_id = fields.Char(string="Shopify ID", required=True)
+    topic = fields.Char()
+
+    @api.model
+    def record_event(self, resource_type: str, shopify_id: int | str, topic: str) -> "odoo.model.shopify_webhook_event":
+        return self.create({"resource_type": resource_type, "shopify_id": str(shopify_id), "topic": topic})
+
+    @api.model
+    def _pending_events(self, resource_type: str) -> "odoo.model.shopify_webhook_event":
+        return self.search([("resource_type", "=", resource_type)], order="id")
+
+    @api.model
+    def _has_pending_events(self, resource_types: list[str]) -> bool:
+        return bool(self.search_count([("resource_type", "in", resource_types)], limit=1))
+
+    @staticmethod
+    def _coalesced_ids(events: "odoo.model.shopify_webhook_event") -> list[str]:
+        return list(dict.fromkeys(events.mapped("shopify_id")))
@@ -0,0 +1,54 @@
+import threading
+from collections.abc import Mapping
+from time import monotonic
+
+_buckets: dict[str, "ShopifyCostBucket"] = {}
+_buckets_lock = threading.Lock()
+
+
+# Local mirror of Shopify's GraphQL cost bucket, shared by every lane talking to one shop.
+# Responses reset it to Shopify's throttleStatus; between responses it refills at restoreRate
+# and in-flight requests reserve their cost, so parallel lanes queue instead of overspending.
+class ShopifyCostBucket:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._available: float | None = None
+        self._maximum: float | None = None
+        self._restore_rate = 1.0
+        self._updated_at = 0.0
+
+    def observe(self, throttle_status: Mapping[str, object]) -> None:
+        available = throttle_status.get("currentlyAvailable")
+        if not isinstance(available, int | float):
+            return
+        maximum = throttle_status.get("maximumAvailable")
+        restore_rate = throttle_status.get("restoreRate")
+        with self._lock:
+            self._available = float(available)
+            self._maximum = float(maximum) if isinstance(maximum, int | float) else None
+            self._restore_rate = float(restore_rate) if isinstance(restore_rate, int | float) and restore_rate > 0 else 1.0
+            self._updated_at = monotonic()
+
+    def acquire(self, cost: float, floor: float, max_wait: float) -> float:
+        # Returns how long the caller should sleep before sending; the cost is reserved
+        # immediately so the next lane's wait already accounts for this request.
+        with self._lock:
+            if self._available is None:
+                return 0.0
+            now = monotonic()
+            available = self._available + (now - self._updated_at) * self._restore_rate
+            if self._maximum is not None:
+                available = min(available, self._maximum)
+            self._available = available - cost
+            self._updated_at = now
+            if available >= floor:
+                return 0.0
+            return min(max_wait, (floor - available) / self._restore_rate)
+
+
+def shared_cost_bucket(shop_key: str) -> ShopifyCostBucket:
+    with _buckets_lock:
+        bucket = _buckets.get(shop_key)
+        if bucket is None:
+            bucket = _buckets[shop_key] = ShopifyCostBucket()
+        return bucket
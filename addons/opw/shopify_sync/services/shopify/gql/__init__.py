@@ -2,6 +2,12 @@
 
 from .base_client import BaseClient
 from .base_model import BaseModel, Upload
+from .bulk_operation_run_query import (
+    BulkOperationRunQuery,
+    BulkOperationRunQueryBulkOperationRunQuery,
+    BulkOperationRunQueryBulkOperationRunQueryBulkOperation,
+    BulkOperationRunQueryBulkOperationRunQueryUserErrors,
+)
 from .client import Client
 from .current_bulk_operation import (
     CurrentBulkOperation,
@@ -14,7 +20,10 @@ from .delete_product import (
     DeleteProductProductDeleteUserErrors,
 )
 from .enums import (
+    BulkMutationErrorCode,
+    BulkOperationErrorCode,
     BulkOperationStatus,
+    BulkOperationUserErrorCode,
     CombinedListingsRole,
     CountryCode,
     CurrencyCode,
@@ -105,12 +114,21 @@ from .fragments import (
     VariantFieldsInventoryItemMeasurementWeight,
     VariantFieldsInventoryItemUnitCost,
 )
+from .get_bulk_operation import GetBulkOperation, GetBulkOperationBulkOperation
 from .get_customers import (
     GetCustomers,
     GetCustomersCustomers,
     GetCustomersCustomersNodes,
     GetCustomersCustomersPageInfo,
 )
+from .get_inventory_item_products import (
+    GetInventoryItemProducts,
+    GetInventoryItemProductsInventoryItems,
+    GetInventoryItemProductsInventoryItemsNodes,
+    GetInventoryItemProductsInventoryItemsNodesVariants,
+    GetInventoryItemProductsInventoryItemsNodesVariantsNodes,
+    GetInventoryItemProductsInventoryItemsNodesVariantsNodesProduct,
+)
 from .get_locations import (
     GetLocations,
     GetLocationsLocations,
@@ -165,9 +183,12 @@ from .input_types import (
     WeightInput,
 )
 from .operations import (
+    BULK_OPERATION_RUN_QUERY_GQL,
     CURRENT_BULK_OPERATION_GQL,
     DELETE_PRODUCT_GQL,
+    GET_BULK_OPERATION_GQL,
     GET_CUSTOMERS_GQL,
+    GET_INVENTORY_ITEM_PRODUCTS_GQL,
     GET_LOCATIONS_GQL,
     GET_ORDER_IDS_GQL,
     GET_ORDERS_GQL,
@@ -222,9 +243,17 @@ from .update_publications import (
 
 __all__ = [
     "AddressFields",
+    "BULK_OPERATION_RUN_QUERY_GQL",
     "BaseClient",
     "BaseModel",
+    "BulkMutationErrorCode",
+    "BulkOperationErrorCode",
+    "BulkOperationRunQuery",
+    "BulkOperationRunQueryBulkOperationRunQuery",
+    "BulkOperationRunQueryBulkOperationRunQueryBulkOperation",
+    "BulkOperationRunQueryBulkOperationRunQueryUserErrors",
     "BulkOperationStatus",
+    "BulkOperationUserErrorCode",
     "CURRENT_BULK_OPERATION_GQL",
     "Client",
     "CombinedListingsRole",
@@ -251,16 +280,26 @@ __all__ = [
     "FileCreateInputDuplicateResolutionMode",
     "FileSetInput",
     "FulfillmentTrackingInfoFields",
+    "GET_BULK_OPERATION_GQL",
     "GET_CUSTOMERS_GQL",
+    "GET_INVENTORY_ITEM_PRODUCTS_GQL",
     "GET_LOCATIONS_GQL",
     "GET_ORDERS_GQL",
     "GET_ORDER_IDS_GQL",
     "GET_PRODUCTS_GQL",
     "GET_PRODUCT_IDS_GQL",
+    "GetBulkOperation",
+    "GetBulkOperationBulkOperation",
     "GetCustomers",
     "GetCustomersCustomers",
     "GetCustomersCustomersNodes",
     "GetCustomersCustomersPageInfo",
+    "GetInventoryItemProducts",
+    "GetInventoryItemProductsInventoryItems",
+    "GetInventoryItemProductsInventoryItemsNodes",
+    "GetInventoryItemProductsInventoryItemsNodesVariants",
+    "GetInventoryItemProductsInventoryItemsNodesVariantsNodes",
+    "GetInventoryItemProductsInventoryItemsNodesVariantsNodesProduct",
     "GetLocations",
     "GetLocationsLocations",
     "GetLocationsLocationsNodes",
@@ -5,12 +5,21 @@ from typing import Any, Optional, Union
 
 from .base_client import BaseClient
 from .base_model import UNSET, UnsetType
+from .bulk_operation_run_query import (
+    BulkOperationRunQuery,
+    BulkOperationRunQueryBulkOperationRunQuery,
+)
 from .current_bulk_operation import (
     CurrentBulkOperation,
     CurrentBulkOperationBulkOperations,
 )
 from .delete_product import DeleteProduct, DeleteProductProductDelete
+from .get_bulk_operation import GetBulkOperation, GetBulkOperationBulkOperation
 from .get_customers import GetCustomers, GetCustomersCustomers
+from .get_inventory_item_products import (
+    GetInventoryItemProducts,
+    GetInventoryItemProductsInventoryItems,
+)
 from .get_locations import GetLocations, GetLocationsLocations
 from .get_order_ids import GetOrderIds, GetOrderIdsOrders
 from .get_orders import GetOrders, GetOrdersOrders
@@ -25,9 +34,12 @@ from .input_types import (
     StagedUploadInput,
 )
 from .operations import (
+    BULK_OPERATION_RUN_QUERY_GQL,
     CURRENT_BULK_OPERATION_GQL,
     DELETE_PRODUCT_GQL,
+    GET_BULK_OPERATION_GQL,
     GET_CUSTOMERS_GQL,
+    GET_INVENTORY_ITEM_PRODUCTS_GQL,
     GET_LOCATIONS_GQL,
     GET_ORDER_IDS_GQL,
     GET_ORDERS_GQL,
@@ -105,6 +117,32 @@ class Client(BaseClient):
         data = self.get_data(response)
         return CurrentBulkOperation.model_validate(data).bulk_operations
 
+    def bulk_operation_run_query(
+        self, query: str, **kwargs: Any
+    ) -> Optional[BulkOperationRunQueryBulkOperationRunQuery]:
+        variables: dict[str, object] = {"query": query}
+        response = self.execute(
+            query=BULK_OPERATION_RUN_QUERY_GQL,
+            operation_name="BulkOperationRunQuery",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return BulkOperationRunQuery.model_validate(data).bulk_operation_run_query
+
+    def get_bulk_operation(
+        self, id: str, **kwargs: Any
+    ) -> Optional[GetBulkOperationBulkOperation]:
+        variables: dict[str, object] = {"id": id}
+        response = self.execute(
+            query=GET_BULK_OPERATION_GQL,
+            operation_name="GetBulkOperation",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetBulkOperation.model_validate(data).bulk_operation
+
     def get_customers(
         self,
         limit: int,
@@ -221,6 +259,22 @@ class Client(BaseClient):
         data = self.get_data(response)
         return GetLocations.model_validate(data).locations
 
+    def get_inventory_item_products(
+        self,
+        limit: int,
+        query: Union[Optional[str], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetInventoryItemProductsInventoryItems:
+        variables: dict[str, object] = {"limit": limit, "query": query}
+        response = self.execute(
+            query=GET_INVENTORY_ITEM_PRODUCTS_GQL,
+            operation_name="GetInventoryItemProducts",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetInventoryItemProducts.model_validate(data).inventory_items
+
     def product_set(
         self,
         input: ProductSetInput,
@@ -4,6 +4,21 @@
 from enum import Enum
 
 
+class BulkMutationErrorCode(str, Enum):
+    OPERATION_IN_PROGRESS = "OPERATION_IN_PROGRESS"
+    INVALID_MUTATION = "INVALID_MUTATION"
+    INVALID_STAGED_UPLOAD_FILE = "INVALID_STAGED_UPLOAD_FILE"
+    NO_SUCH_FILE = "NO_SUCH_FILE"
+    INTERNAL_FILE_SERVER_ERROR = "INTERNAL_FILE_SERVER_ERROR"
+    LIMIT_REACHED = "LIMIT_REACHED"
+
+
+class BulkOperationErrorCode(str, Enum):
+    ACCESS_DENIED = "ACCESS_DENIED"
+    INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
+    TIMEOUT = "TIMEOUT"
+
+
 class BulkOperationStatus(str, Enum):
     CANCELED = "CANCELED"
     CANCELING = "CANCELING"
@@ -14,6 +29,12 @@ class BulkOperationStatus(str, Enum):
     RUNNING = "RUNNING"
 
 
+class BulkOperationUserErrorCode(str, Enum):
+    OPERATION_IN_PROGRESS = "OPERATION_IN_PROGRESS"
+    INVALID = "INVALID"
+    LIMIT_REACHED = "LIMIT_REACHED"
+
+
 class CombinedListingsRole(str, Enum):
     PARENT = "PARENT"
     CHILD = "CHILD"
@@ -0,0 +1,28 @@
+# Generated by ariadne-codegen
+# Source: /Users/cbusillo/Developer/odoo-ai/addons/shopify_sync/graphql/shopify
+
+from typing import Optional
+
+from pydantic import AnyUrl, Field
+
+from .base_model import BaseModel
+from .enums import BulkOperationErrorCode, BulkOperationStatus
+
+
+class GetBulkOperation(BaseModel):
+    bulk_operation: Optional["GetBulkOperationBulkOperation"] = Field(
+        alias="bulkOperation"
+    )
+
+
+class GetBulkOperationBulkOperation(BaseModel):
+    id: str
+    status: BulkOperationStatus
+    error_code: Optional[BulkOperationErrorCode] = Field(alias="errorCode")
+    object_count: int = Field(alias="objectCount")
+    root_object_count: int = Field(alias="rootObjectCount")
+    url: Optional[AnyUrl]
+    partial_data_url: Optional[AnyUrl] = Field(alias="partialDataUrl")
+
+
+GetBulkOperation.model_rebuild()
@@ -0,0 +1,42 @@
+# Generated by ariadne-codegen
+# Source: /Users/cbusillo/Developer/odoo-ai/addons/shopify_sync/graphql/shopify
+
+from typing import Optional
+
+from pydantic import Field
+
+from .base_model import BaseModel
+
+
+class GetInventoryItemProducts(BaseModel):
+    inventory_items: "GetInventoryItemProductsInventoryItems" = Field(
+        alias="inventoryItems"
+    )
+
+
+class GetInventoryItemProductsInventoryItems(BaseModel):
+    nodes: list["GetInventoryItemProductsInventoryItemsNodes"]
+
+
+class GetInventoryItemProductsInventoryItemsNodes(BaseModel):
+    id: str
+    variants: Optional["GetInventoryItemProductsInventoryItemsNodesVariants"]
+
+
+class GetInventoryItemProductsInventoryItemsNodesVariants(BaseModel):
+    nodes: list["GetInventoryItemProductsInventoryItemsNodesVariantsNodes"]
+
+
+class GetInventoryItemProductsInventoryItemsNodesVariantsNodes(BaseModel):
+    product: "GetInventoryItemProductsInventoryItemsNodesVariantsNodesProduct"
+
+
+class GetInventoryItemProductsInventoryItemsNodesVariantsNodesProduct(BaseModel):
+    id: str
+
+
+GetInventoryItemProducts.model_rebuild()
+GetInventoryItemProductsInventoryItems.model_rebuild()
+GetInventoryItemProductsInventoryItemsNodes.model_rebuild()
+GetInventoryItemProductsInventoryItemsNodesVariants.model_rebuild()
+GetInventoryItemProductsInventoryItemsNodesVariantsNodes.model_rebuild()
@@ -2,9 +2,12 @@
 # Source: /Users/cbusillo/Developer/odoo-ai/addons/shopify_sync/graphql/shopify
 
 __all__ = [
+    "BULK_OPERATION_RUN_QUERY_GQL",
     "CURRENT_BULK_OPERATION_GQL",
     "DELETE_PRODUCT_GQL",
+    "GET_BULK_OPERATION_GQL",
     "GET_CUSTOMERS_GQL",
+    "GET_INVENTORY_ITEM_PRODUCTS_GQL",
     "GET_LOCATIONS_GQL",
     "GET_ORDERS_GQL",
     "GET_ORDER_IDS_GQL",
@@ -49,6 +52,7 @@ mutation ProductSetBulkRun($mutation: String!, $stagedUploadPath: String!) {
     userErrors {
       field
       message
+      code
     }
   }
 }
@@ -68,6 +72,36 @@ query CurrentBulkOperation {
 }
 """
 
+BULK_OPERATION_RUN_QUERY_GQL = """
+mutation BulkOperationRunQuery($query: String!) {
+  bulkOperationRunQuery(query: $query, groupObjects: true) {
+    bulkOperation {
+      id
+      status
+    }
+    userErrors {
+      field
+      message
+      code
+    }
+  }
+}
+"""
+
+GET_BULK_OPERATION_GQL = """
+query GetBulkOperation($id: ID!) {
+  bulkOperation(id: $id) {
+    id
+    status
+    errorCode
+    objectCount
+    rootObjectCount
+    url
+    partialDataUrl
+  }
+}
+"""
+
 GET_CUSTOMERS_GQL = """
 query GetCustomers($cursor: String, $limit: Int!, $query: String) {
   customers(first: $limit, after: $cursor, query: $query, sortKey: UPDATED_AT) {
@@ -452,6 +486,23 @@ query GetLocations {
 }
 """
 
+GET_INVENTORY_ITEM_PRODUCTS_GQL = """
+query GetInventoryItemProducts($limit: Int!, $query: String) {
+  inventoryItems(first: $limit, query: $query) {
+    nodes {
+      id
+      variants(first: 10) {
+        nodes {
+          product {
+            id
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 PRODUCT_SET_GQL = """
 mutation ProductSet($identifier: ProductSetIdentifiers, $input: ProductSetInput!) {
   productSet(identifier: $identifier, input: $input) {
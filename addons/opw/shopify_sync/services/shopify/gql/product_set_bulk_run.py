@@ -6,7 +6,7 @@ from typing import Optional
 from pydantic import Field
 
 from .base_model import BaseModel
-from .enums import BulkOperationStatus
+from .enums import BulkMutationErrorCode, BulkOperationStatus
 
 
 class ProductSetBulkRun(BaseModel):
@@ -32,6 +32,7 @@ class ProductSetBulkRunBulkOperationRunMutationBulkOperation(BaseModel):
 class ProductSetBulkRunBulkOperationRunMutationUserErrors(BaseModel):
     field: Optional[list[str]]
     message: str
+    code: Optional[BulkMutationErrorCode]
 
 
 ProductSetBulkRun.model_rebuild()
@@ -22,6 +22,12 @@ class OdooRecordInfo(Protocol):
 _logger = logging.getLogger(__name__)
 
 HEARTBEAT_SECONDS = 30
+BULK_OPERATION_POLL_SECONDS = 10
+BULK_OPERATION_DOWNLOAD_TIMEOUT_SECONDS = 300
+BULK_MUTATION_BATCH_SIZE = 2000
+EXPORT_CANDIDATE_BATCH_SIZE = 1000
+WEBHOOK_DEBOUNCE_SECONDS = 5
+WEBHOOK_ID_QUERY_BATCH_SIZE = 50
 DEFAULT_DATETIME = datetime(2000, 1, 1)
 SHOPIFY_PAGE_SIZE = 250
 COMMIT_SIZE = SHOPIFY_PAGE_SIZE // 10
@@ -91,30 +97,49 @@ def last_import_config_key(resource_type: str) -> str:
     return f"shopify.last_{resource_type}_import_time"
 
 
+class SyncLane(StrEnum):
+    # Declaration order is dispatch priority: orders are latency sensitive, products are bulk work.
+    ORDERS = "orders"
+    CUSTOMERS = "customers"
+    PRODUCTS = "products"
+
+    @classmethod
+    def choices(cls) -> list[tuple[str, str]]:
+        return [(lane.value, lane.value.title()) for lane in cls]
+
+
 class SyncMode(StrEnum):
-    def __new__(cls, value: str, resource_type: str | None = None) -> Self:
+    def __new__(cls, value: str, resource_type: str | None = None, lane: SyncLane = SyncLane.PRODUCTS) -> Self:
         obj = str.__new__(cls, value)
         obj._value_ = value
         obj._resource_type = resource_type
+        obj._lane = lane
         return obj
 
     IMPORT_THEN_EXPORT_PRODUCTS = ("import_then_export_products", "product")
     IMPORT_CHANGED_PRODUCTS = ("import_changed_products", "product")
     EXPORT_CHANGED_PRODUCTS = ("export_changed_products", "product")
     IMPORT_ALL_PRODUCTS = ("import_all_products", "product")
+    IMPORT_ALL_PRODUCTS_BULK = ("import_all_products_bulk", "product")
     EXPORT_ALL_PRODUCTS = ("export_all_products", "product")
+    EXPORT_ALL_PRODUCTS_BULK = ("export_all_products_bulk", "product")
     IMPORT_PRODUCTS_SINCE_DATE = ("import_products_since_date", "product")
     EXPORT_PRODUCTS_SINCE_DATE = ("export_products_since_date", "product")
     IMPORT_ONE_PRODUCT = ("import_one_product", None)
     EXPORT_BATCH_PRODUCTS = ("export_batch_products", None)
+    IMPORT_WEBHOOK_PRODUCTS = ("import_webhook_products", None)
 
-    IMPORT_ALL_ORDERS = ("import_all_orders", "order")
-    IMPORT_CHANGED_ORDERS = ("import_changed_orders", "order")
-    IMPORT_ONE_ORDER = ("import_one_order", None)
+    IMPORT_ALL_ORDERS = ("import_all_orders", "order", SyncLane.ORDERS)
+    IMPORT_ALL_ORDERS_BULK = ("import_all_orders_bulk", "order", SyncLane.ORDERS)
+    IMPORT_CHANGED_ORDERS = ("import_changed_orders", "order", SyncLane.ORDERS)
+    IMPORT_ONE_ORDER = ("import_one_order", None, SyncLane.ORDERS)
+    IMPORT_WEBHOOK_ORDERS = ("import_webhook_orders", None, SyncLane.ORDERS)
 
-    IMPORT_ALL_CUSTOMERS = ("import_all_customers", "customer")
-    IMPORT_CHANGED_CUSTOMERS = ("import_changed_customers", "customer")
-    IMPORT_ONE_CUSTOMER = ("import_one_customer", None)
+    IMPORT_ALL_CUSTOMERS = ("import_all_customers", "customer", SyncLane.CUSTOMERS)
+    IMPORT_ALL_CUSTOMERS_BULK = ("import_all_customers_bulk", "customer", SyncLane.CUSTOMERS)
+    IMPORT_CHANGED_CUSTOMERS = ("import_changed_customers", "customer", SyncLane.CUSTOMERS)
+    IMPORT_ONE_CUSTOMER = ("import_one_customer", None, SyncLane.CUSTOMERS)
+    IMPORT_WEBHOOK_CUSTOMERS = ("import_webhook_customers", None, SyncLane.CUSTOMERS)
 
     RESET_SHOPIFY = ("reset_shopify", None)
 
@@ -126,6 +151,10 @@ class SyncMode(StrEnum):
     def resource_type(self) -> str | None:
         return self._resource_type
 
+    @property
+    def lane(self) -> SyncLane:
+        return self._lane
+
     @classmethod
     def choices(cls) -> list[tuple[str, str]]:
         return [(m.value, m.display_name) for m in cls]
@@ -4,6 +4,7 @@ from time import sleep
 from httpx import Client, Timeout, Limits, Request, Response, RequestError
 from odoo.api import Environment
 
+from .cost_bucket import ShopifyCostBucket, shared_cost_bucket
 from .helpers import ShopifyApiError
 from .gql import Client as ShopifyClient
 
@@ -24,6 +25,8 @@ class ShopifyService:
         self._client: ShopifyClient | None = None
         self.sync_record = sync_record
         self.first_location_gid: str | None = None
+        self.cost_bucket = ShopifyCostBucket()
+        self._query_cost_estimate = 0.0
 
     @property
     def client(self) -> ShopifyClient:
@@ -56,6 +59,7 @@ class ShopifyService:
             )
 
         endpoint = f"https://{shop_url_key}.myshopify.com/admin/api/{api_version}/graphql.json"
+        self.cost_bucket = shared_cost_bucket(shop_url_key)
         http_client = self._create_http_client(api_token)
         client = ShopifyClient(http_client=http_client, url=endpoint)
         first_location_gid = self.get_first_location_gid(client)
@@ -80,7 +84,11 @@ class ShopifyService:
             data = response.json()
 
             if "extensions" in data:
-                throttle_status = data.get("extensions", {}).get("cost", {}).get("throttleStatus", {})
+                cost = data.get("extensions", {}).get("cost", {})
+                throttle_status = cost.get("throttleStatus", {})
+                self.cost_bucket.observe(throttle_status)
+                if isinstance(requested_cost := cost.get("requestedQueryCost"), int | float):
+                    self._query_cost_estimate = float(requested_cost)
                 currently_available = throttle_status.get("currentlyAvailable", 0)
                 restore_rate = throttle_status.get("restoreRate", 1) or 1
                 _logger.debug(f"Shopify API rate limit status: {throttle_status}")
@@ -122,6 +130,10 @@ class ShopifyService:
             transient = THROTTLE_TRANSIENT_STATUS
 
             for attempt in range(self.MAX_RETRY_ATTEMPTS + 1):
+                reserve_wait = self.cost_bucket.acquire(self._query_cost_estimate, self.MIN_API_POINTS, self.MAX_SLEEP_TIME)
+                if reserve_wait > 0:
+                    _logger.info(f"Shared Shopify cost budget low – sync {self.sync_record.id} waiting {reserve_wait:.2f}s")
+                    sleep(reserve_wait)
                 try:
                     response = original_send(request, **kwargs)
                 except RequestError as error:
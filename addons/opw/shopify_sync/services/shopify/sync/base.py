@@ -1,25 +1,43 @@
 import logging, time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import timedelta
-from typing import Generic, TypeVar, Sequence, Callable, Protocol
+from pathlib import Path
+from typing import ClassVar, Generic, TypeVar, Sequence, Callable, Protocol
 
+from httpx import Client as HttpClient, HTTPError, Timeout
 from psycopg2.errors import SerializationFailure
 from odoo.api import Environment
-
-from ..gql import Client
+from pydantic import AnyUrl, ValidationError
+
+from ..gql import (
+    BulkMutationErrorCode,
+    BulkOperationStatus,
+    BulkOperationUserErrorCode,
+    Client,
+    GetBulkOperationBulkOperation,
+    StagedUploadHttpMethodType,
+    StagedUploadInput,
+    StagedUploadTargetGenerateUploadResource,
+)
+from ..gql.base_model import BaseModel
 from ..service import ShopifyService
 from ..helpers import (
     OdooDataError,
     ShopifyDataError,
     COMMIT_SIZE,
     SHOPIFY_PAGE_SIZE,
+    WEBHOOK_ID_QUERY_BATCH_SIZE,
     HEARTBEAT_SECONDS,
+    BULK_OPERATION_POLL_SECONDS,
+    BULK_OPERATION_DOWNLOAD_TIMEOUT_SECONDS,
     DEFAULT_DATETIME,
     ShopifyApiError,
     parse_shopify_datetime_to_utc,
     format_datetime_for_shopify,
     last_import_config_key,
 )
+from .bulk import build_bulk_query, group_bulk_result_lines
 
 _logger = logging.getLogger(__name__)
 
@@ -36,6 +54,23 @@ class ShopifyPage(Protocol[T]):
     page_info: _PageInfo
 
 
+class _BulkOperationUserError(Protocol):
+    message: str
+    code: str | None
+
+
+class _BulkOperationReference(Protocol):
+    id: str
+
+
+class _BulkOperationStart(Protocol):
+    bulk_operation: _BulkOperationReference | None
+    user_errors: Sequence[_BulkOperationUserError]
+
+
+BULK_OPERATION_IN_PROGRESS_CODES = (BulkOperationUserErrorCode.OPERATION_IN_PROGRESS, BulkMutationErrorCode.OPERATION_IN_PROGRESS)
+
+
 class ShopifyBase(ABC, Generic[T]):
     def __init__(self, env: Environment, sync_record: "odoo.model.shopify_sync") -> None:
         self.env = env
@@ -56,14 +91,29 @@ class ShopifyBase(ABC, Generic[T]):
                 _logger.warning(f"Commit at {processed_count} records skipped due to concurrent access")
                 self.sync_record._safe_rollback()
                 raise
-        if time.monotonic() - self._last_heartbeat > HEARTBEAT_SECONDS:
-            try:
-                self.sync_record.write({})
-                self.sync_record._safe_commit()
-            except SerializationFailure:
-                _logger.warning("Heartbeat update skipped due to concurrent access")
-                self.sync_record._safe_rollback()
-            self._last_heartbeat = time.monotonic()
+        self._maybe_heartbeat()
+
+    def _maybe_heartbeat(self) -> None:
+        if time.monotonic() - self._last_heartbeat <= HEARTBEAT_SECONDS:
+            return
+        try:
+            self.sync_record.write({})
+            self.sync_record._safe_commit()
+        except SerializationFailure:
+            _logger.warning("Heartbeat update skipped due to concurrent access")
+            self.sync_record._safe_rollback()
+        self._last_heartbeat = time.monotonic()
+
+    def _process_node(self, node: T, process_one: Callable[[T], bool], processed_count: int) -> None:
+        self.sync_record.ensure_not_canceled()
+        try:
+            if process_one(node):
+                self.sync_record.updated_count += 1
+        except (OdooDataError, ShopifyDataError):
+            raise
+        except Exception as error:
+            raise ShopifyDataError("unexpected error", shopify_record=node) from error
+        self._maybe_commit(processed_count)
 
     def _iterate_pages(
         self,
@@ -84,29 +134,141 @@ class ShopifyBase(ABC, Generic[T]):
             self.sync_record.total_count += len(nodes)
 
             for node in nodes:
-                self.sync_record.ensure_not_canceled()
                 total_processed += 1
-
-                try:
-                    if process_one(node):
-                        self.sync_record.updated_count += 1
-                except (OdooDataError, ShopifyDataError):
-                    raise
-                except Exception as error:
-                    raise ShopifyDataError("unexpected error", shopify_record=node) from error
-                self._maybe_commit(total_processed)
+                self._process_node(node, process_one, total_processed)
 
             cursor = page.page_info.end_cursor
             has_next = page.page_info.has_next_page
 
+    def _start_bulk_query(self, bulk_query: str) -> str:
+        return self._start_bulk_operation("query", lambda: self.service.client.bulk_operation_run_query(bulk_query))
+
+    def _start_bulk_mutation(self, mutation: str, staged_upload_path: str) -> str:
+        return self._start_bulk_operation("mutation", lambda: self.service.client.product_set_bulk_run(mutation, staged_upload_path))
+
+    def _start_bulk_operation(self, operation_type: str, start_operation: Callable[[], _BulkOperationStart | None]) -> str:
+        while True:
+            self.sync_record.ensure_not_canceled()
+            result = start_operation()
+            if result is None:
+                raise ShopifyApiError(f"Bulk {operation_type} returned no result")
+            if result.bulk_operation and not result.user_errors:
+                _logger.info(f"Started Shopify bulk {operation_type} {result.bulk_operation.id}")
+                return result.bulk_operation.id
+            if any(error.code in BULK_OPERATION_IN_PROGRESS_CODES for error in result.user_errors):
+                self._wait_for_running_bulk_operations()
+                continue
+            messages = "; ".join(error.message for error in result.user_errors)
+            raise ShopifyApiError(f"Failed to start bulk {operation_type}: {messages}")
+
+    def _stage_bulk_mutation_variables(self, variables_path: Path) -> str:
+        staged_upload = self.service.client.staged_uploads_create(
+            [
+                StagedUploadInput(
+                    resource=StagedUploadTargetGenerateUploadResource.BULK_MUTATION_VARIABLES,
+                    filename=variables_path.name,
+                    mimeType="text/jsonl",
+                    httpMethod=StagedUploadHttpMethodType.POST,
+                )
+            ]
+        )
+        if not staged_upload or staged_upload.user_errors or not staged_upload.staged_targets:
+            messages = "; ".join(error.message for error in staged_upload.user_errors) if staged_upload else ""
+            raise ShopifyApiError(f"Failed to create staged upload for bulk mutation: {messages}")
+
+        target = staged_upload.staged_targets[0]
+        parameters = {parameter.name: parameter.value for parameter in target.parameters}
+        staged_upload_path = parameters.get("key")
+        if not target.url or not staged_upload_path:
+            raise ShopifyApiError("Staged upload target is missing its URL or key")
+
+        try:
+            with HttpClient(timeout=Timeout(BULK_OPERATION_DOWNLOAD_TIMEOUT_SECONDS, connect=10.0)) as http_client:
+                with variables_path.open("rb") as variables_file:
+                    response = http_client.post(
+                        str(target.url),
+                        data=parameters,
+                        files={"file": (variables_path.name, variables_file, "text/jsonl")},
+                    )
+                response.raise_for_status()
+        except HTTPError as error:
+            raise ShopifyApiError(f"Failed to upload bulk mutation variables to {target.url}") from error
+        return staged_upload_path
+
+    def _wait_for_running_bulk_operations(self) -> None:
+        client = self.service.client
+        while running := client.current_bulk_operation().nodes:
+            _logger.info(f"Waiting for Shopify bulk operation {running[0].id} to finish before starting a new one")
+            self._sleep_while_bulk_operation_runs()
+
+    def _wait_for_bulk_operation(self, operation_id: str) -> GetBulkOperationBulkOperation:
+        client = self.service.client
+        while True:
+            self.sync_record.ensure_not_canceled()
+            operation = client.get_bulk_operation(operation_id)
+            if operation is None:
+                raise ShopifyApiError(f"Bulk operation {operation_id} not found")
+            if operation.status == BulkOperationStatus.COMPLETED:
+                _logger.info(f"Shopify bulk operation {operation_id} completed with {operation.object_count} object(s)")
+                return operation
+            if operation.status not in {BulkOperationStatus.CREATED, BulkOperationStatus.RUNNING}:
+                raise ShopifyApiError(f"Bulk operation {operation_id} ended with status {operation.status} ({operation.error_code})")
+            self._sleep_while_bulk_operation_runs()
+
+    def _sleep_while_bulk_operation_runs(self) -> None:
+        time.sleep(BULK_OPERATION_POLL_SECONDS)
+        self._maybe_heartbeat()
+
+    @staticmethod
+    def _iter_bulk_result_lines(url: AnyUrl) -> Iterator[str]:
+        # Result files live on signed storage URLs; the Shopify client would send the
+        # access token there and its rate-limit hook would buffer the JSONL body.
+        try:
+            with HttpClient(timeout=Timeout(BULK_OPERATION_DOWNLOAD_TIMEOUT_SECONDS, connect=10.0)) as http_client:
+                with http_client.stream("GET", str(url), follow_redirects=True) as response:
+                    response.raise_for_status()
+                    yield from response.iter_lines()
+        except HTTPError as error:
+            raise ShopifyApiError(f"Failed to download bulk operation result from {url}") from error
+
 
 class ShopifyBaseImporter(ShopifyBase[T]):
+    bulk_query_document: ClassVar[str | None] = None
+    bulk_node_model: ClassVar[type[BaseModel] | None] = None
+    bulk_child_connections: ClassVar[dict[str, str]] = {}
+    bulk_nested_child_connections: ClassVar[dict[str, tuple[str, str]]] = {}
+    bulk_omitted_fields: ClassVar[dict[str, tuple[str, ...]]] = {}
+
     def run(self, *, query: str | None = None) -> None:
         def fetch_page(query_string: str | None, cursor_string: str | None) -> ShopifyPage[T]:
             return self._fetch_page(self.service.client, query_string, cursor_string)
 
         self._iterate_pages(fetch_page, self._import_one, query)
 
+    def run_bulk(self, *, query: str | None = None) -> None:
+        if not self.bulk_query_document or not self.bulk_node_model:
+            raise ShopifyApiError(f"{type(self).__name__} does not support bulk imports")
+
+        bulk_query = build_bulk_query(self.bulk_query_document, query=query, omitted_fields=self.bulk_omitted_fields)
+        operation_id = self._start_bulk_query(bulk_query)
+        operation = self._wait_for_bulk_operation(operation_id)
+        if not operation.url:
+            _logger.info(f"Shopify bulk operation {operation_id} returned no records")
+            return
+
+        self.sync_record.total_count += operation.root_object_count
+        bulk_objects = group_bulk_result_lines(
+            self._iter_bulk_result_lines(operation.url),
+            self.bulk_child_connections,
+            self.bulk_nested_child_connections,
+        )
+        for total_processed, bulk_object in enumerate(bulk_objects, 1):
+            try:
+                node = self.bulk_node_model.model_validate(bulk_object)
+            except ValidationError as error:
+                raise ShopifyDataError(f"Invalid bulk record {bulk_object.get('id')}") from error
+            self._process_node(node, self._import_one, total_processed)
+
     @abstractmethod
     def _fetch_page(self, client: Client, query: str | None, cursor: str | None) -> ShopifyPage[T]: ...
 
@@ -123,6 +285,12 @@ class ShopifyBaseImporter(ShopifyBase[T]):
         self.run(query=filter_query)
         return True
 
+    def run_by_ids(self, resource_ids: Sequence[int | str], *, field: str = "id") -> int:
+        for batch_start in range(0, len(resource_ids), WEBHOOK_ID_QUERY_BATCH_SIZE):
+            batch = resource_ids[batch_start : batch_start + WEBHOOK_ID_QUERY_BATCH_SIZE]
+            self.run(query=" OR ".join(f'{field}:"{resource_id}"' for resource_id in batch))
+        return self.sync_record.updated_count
+
     @abstractmethod
     def _import_one(self, node: T) -> bool: ...
 
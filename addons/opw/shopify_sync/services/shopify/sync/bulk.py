@@ -0,0 +1,182 @@
+import json
+from collections.abc import Collection, Iterable, Iterator, Mapping
+
+from graphql import (
+    ArgumentNode,
+    DefinitionNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    StringValueNode,
+    VariableNode,
+    parse,
+    print_ast,
+)
+
+from ..helpers import ShopifyApiError
+
+BULK_PARENT_ID_KEY = "__parentId"
+BULK_TYPENAME_KEY = "__typename"
+BULK_MAX_CONNECTIONS = 5
+
+
+def _without_fields(fragment: FragmentDefinitionNode, field_names: Collection[str]) -> FragmentDefinitionNode:
+    if not field_names:
+        return fragment
+    selections = tuple(
+        selection
+        for selection in fragment.selection_set.selections
+        if not (isinstance(selection, FieldNode) and selection.name.value in field_names)
+    )
+    return FragmentDefinitionNode(
+        name=fragment.name,
+        variable_definitions=fragment.variable_definitions,
+        type_condition=fragment.type_condition,
+        directives=fragment.directives,
+        selection_set=SelectionSetNode(selections=selections),
+    )
+
+
+def _count_connections(selection_set: SelectionSetNode | None, fragments: Mapping[str, FragmentDefinitionNode]) -> int:
+    if selection_set is None:
+        return 0
+    count = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FragmentSpreadNode):
+            count += _count_connections(fragments[selection.name.value].selection_set, fragments)
+        elif isinstance(selection, InlineFragmentNode):
+            count += _count_connections(selection.selection_set, fragments)
+        elif isinstance(selection, FieldNode) and selection.selection_set is not None:
+            if any(
+                isinstance(child, FieldNode) and child.name.value in ("nodes", "edges")
+                for child in selection.selection_set.selections
+            ):
+                count += 1
+            count += _count_connections(selection.selection_set, fragments)
+    return count
+
+
+def build_bulk_query(
+    paged_document: str,
+    *,
+    query: str | None = None,
+    omitted_fields: Mapping[str, Collection[str]] | None = None,
+) -> str:
+    # Bulk queries cannot take variables and Shopify pages internally, so the paged
+    # operation keeps its selection and fragments but drops cursor arguments and pageInfo.
+    # omitted_fields maps a fragment name to fields left out of the bulk selection, which
+    # keeps shared fragments usable under Shopify's limit of five connections per bulk query.
+    omitted_fields = omitted_fields or {}
+    document = parse(paged_document)
+    operation = next(definition for definition in document.definitions if isinstance(definition, OperationDefinitionNode))
+    root_field = operation.selection_set.selections[0]
+    if not isinstance(root_field, FieldNode) or root_field.selection_set is None:
+        raise ShopifyApiError(f"Operation {operation.name.value if operation.name else ''} has no root connection")
+
+    arguments = [argument for argument in root_field.arguments if not isinstance(argument.value, VariableNode)]
+    if query:
+        arguments.append(ArgumentNode(name=NameNode(value="query"), value=StringValueNode(value=query)))
+    selections = [
+        selection
+        for selection in root_field.selection_set.selections
+        if not (isinstance(selection, FieldNode) and selection.name.value == "pageInfo")
+    ]
+    bulk_root_field = FieldNode(
+        alias=root_field.alias,
+        name=root_field.name,
+        arguments=tuple(arguments),
+        directives=root_field.directives,
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+    bulk_operation = OperationDefinitionNode(
+        operation=OperationType.QUERY,
+        variable_definitions=(),
+        directives=(),
+        selection_set=SelectionSetNode(selections=(bulk_root_field,)),
+    )
+    fragments: list[DefinitionNode] = [
+        _without_fields(definition, omitted_fields.get(definition.name.value, ()))
+        if isinstance(definition, FragmentDefinitionNode)
+        else definition
+        for definition in document.definitions
+        if definition is not operation
+    ]
+    fragments_by_name = {
+        definition.name.value: definition for definition in fragments if isinstance(definition, FragmentDefinitionNode)
+    }
+    connection_count = _count_connections(bulk_operation.selection_set, fragments_by_name)
+    if connection_count > BULK_MAX_CONNECTIONS:
+        raise ShopifyApiError(
+            f"Bulk query for {root_field.name.value} selects {connection_count} connections; "
+            f"Shopify allows at most {BULK_MAX_CONNECTIONS}"
+        )
+    return print_ast(DocumentNode(definitions=(bulk_operation, *fragments)))
+
+
+def bulk_object_type(bulk_object: Mapping[str, object]) -> str | None:
+    typename = bulk_object.get(BULK_TYPENAME_KEY)
+    if isinstance(typename, str):
+        return typename
+    gid = bulk_object.get("id")
+    if isinstance(gid, str) and gid.startswith("gid://"):
+        return gid.split("/")[3]
+    return None
+
+
+def group_bulk_result_lines(
+    lines: Iterable[str],
+    child_connections: Mapping[str, str],
+    nested_child_connections: Mapping[str, tuple[str, str]] | None = None,
+) -> Iterator[dict[str, object]]:
+    # Bulk queries run with groupObjects, so connection children directly follow their
+    # parent line and only one root object has to be held in memory at a time.
+    # Connections nested under an inline object (an order's customer addresses) come back
+    # as rows too; nested_child_connections maps their type to (owner field, connection)
+    # so they are folded back onto the owner whether Shopify parents them to it or the root.
+    nested_child_connections = nested_child_connections or {}
+    connection_names = set(child_connections.values())
+    current: dict[str, object] | None = None
+    current_connections: dict[str, list[dict[str, object]]] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        bulk_object = json.loads(line)
+        parent_id = bulk_object.pop(BULK_PARENT_ID_KEY, None)
+        if parent_id is None:
+            if current is not None:
+                yield current
+            current = bulk_object
+            current_connections = {connection_name: [] for connection_name in connection_names}
+            for connection_name, nodes in current_connections.items():
+                current[connection_name] = {"nodes": nodes}
+            for owner_field, connection_name in set(nested_child_connections.values()):
+                owner = current.get(owner_field)
+                if isinstance(owner, dict):
+                    owner[connection_name] = {"nodes": []}
+            continue
+
+        if current is None:
+            raise ShopifyApiError(f"Bulk result line for parent {parent_id} is not grouped under its parent")
+        object_type = bulk_object_type(bulk_object) or ""
+        nested_connection = nested_child_connections.get(object_type)
+        if nested_connection is not None:
+            owner_field, connection_name = nested_connection
+            owner = current.get(owner_field)
+            if isinstance(owner, dict) and parent_id in (current.get("id"), owner.get("id")):
+                owner[connection_name]["nodes"].append(bulk_object)
+                continue
+        if current.get("id") != parent_id:
+            raise ShopifyApiError(f"Bulk result line for parent {parent_id} is not grouped under its parent")
+        connection_name = child_connections.get(object_type)
+        if connection_name is None:
+            continue
+        current_connections[connection_name].append(bulk_object)
+
+    if current is not None:
+        yield current
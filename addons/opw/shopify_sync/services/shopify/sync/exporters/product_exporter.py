@@ -1,13 +1,23 @@
+import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from odoo import fields
 from odoo.api import Environment
+from odoo.tools import SQL
 from odoo.tools.misc import str2bool
+from pydantic import ValidationError
+from pydantic_core import to_jsonable_python
 
 from ...gql import (
+    PRODUCT_SET_GQL,
     InventoryItemMeasurementInput,
+    ProductSet,
+    ProductSetProductSet,
     ProductSetProductSetProduct,
     ProductSetProductSetProductResourcePublicationsV2NodesPublication,
     ProductSetProductSetProductResourcePublicationsV2Nodes,
@@ -32,8 +42,11 @@ from ...gql.input_types import (
 )
 from ...metafield_types import ShopifyMetafieldType
 from ...helpers import (
+    BULK_MUTATION_BATCH_SIZE,
+    EXPORT_CANDIDATE_BATCH_SIZE,
     PUBLICATION_CHANNELS,
     ShopifyApiError,
+    SyncMode,
     format_shopify_gid_from_id,
     format_sku_bin_for_shopify,
     get_latest_image_write_date,
@@ -68,7 +81,20 @@ class ProductExporter(ShopifyBaseExporter["odoo.model.product_product"]):
         self.export_products(odoo_products)
 
     def _find_products_to_export(self, cutoff_date: datetime | None = None) -> "odoo.model.product_product":
-        odoo_products = self.env["product.product"].search(
+        product_ids: list[int] = []
+        for batch_ids in self._iter_product_ids_to_export(cutoff_date):
+            product_ids.extend(batch_ids)
+        return self.env["product.product"].browse(product_ids)
+
+    def _iter_product_ids_to_export(
+        self,
+        cutoff_date: datetime | None = None,
+        batch_size: int = EXPORT_CANDIDATE_BATCH_SIZE,
+    ) -> Iterator[list[int]]:
+        # Dirty detection runs in SQL so the hourly export never loads the full catalog;
+        # without a cutoff each product is compared against its own last export time.
+        product_model = self.env["product.product"]
+        eligible_query = product_model._search(
             [
                 ("sale_ok", "=", True),
                 ("is_ready_for_sale", "=", True),
@@ -78,76 +104,201 @@ class ProductExporter(ShopifyBaseExporter["odoo.model.product_product"]):
                 ("type", "=", "consu"),
             ]
         )
+        self.env.flush_all()
         if cutoff_date:
-            odoo_products = odoo_products.filtered(
-                lambda p: p.shopify_next_export is True or (p.write_date > cutoff_date or p.product_tmpl_id.write_date > cutoff_date)
-            )
-
+            threshold = SQL("%s::timestamp", cutoff_date)
         else:
-            odoo_products = odoo_products.filtered(
-                lambda p: (
-                    p.shopify_next_export is True
-                    or (
-                        p.write_date > (p.shopify_last_exported_at or datetime.min)
-                        or p.product_tmpl_id.write_date > (p.shopify_last_exported_at or datetime.min)
-                    )
+            threshold = SQL("COALESCE(pp.shopify_last_exported_at, '-infinity'::timestamp)")
+
+        last_id = 0
+        while True:
+            self.env.cr.execute(
+                SQL(
+                    """
+                    SELECT pp.id
+                      FROM product_product pp
+                      JOIN product_template pt ON pt.id = pp.product_tmpl_id
+                     WHERE pp.id > %(last_id)s
+                       AND pp.id IN %(eligible)s
+                       AND (
+                            pp.shopify_next_export IS TRUE
+                            OR pp.write_date > %(threshold)s
+                            OR pt.write_date > %(threshold)s
+                            OR EXISTS (
+                                SELECT 1
+                                  FROM product_image pi
+                                 WHERE pi.product_tmpl_id = pp.product_tmpl_id
+                                   AND pi.write_date > %(threshold)s
+                            )
+                            OR EXISTS (
+                                SELECT 1
+                                  FROM product_image pi
+                                 WHERE pi.product_variant_id = pp.id
+                                   AND pi.write_date > %(threshold)s
+                            )
+                       )
+                     ORDER BY pp.id
+                     LIMIT %(batch_size)s
+                    """,
+                    last_id=last_id,
+                    eligible=eligible_query.subselect(),
+                    threshold=threshold,
+                    batch_size=batch_size,
                 )
             )
-        return odoo_products
+            batch_ids = [row[0] for row in self.env.cr.fetchall()]
+            if not batch_ids:
+                return
+            yield batch_ids
+            if len(batch_ids) < batch_size:
+                return
+            last_id = batch_ids[-1]
 
     def export_products(self, odoo_products: "odoo.model.product_product") -> None:
         self.run(odoo_products)
 
+    def export_products_bulk(self, odoo_products: "odoo.model.product_product") -> None:
+        if not odoo_products:
+            _logger.info("nothing to export")
+            return
+        self.sync_record.total_count = self.sync_record.total_count or len(odoo_products)
+        processed_count = 0
+        for batch_start in range(0, len(odoo_products), BULK_MUTATION_BATCH_SIZE):
+            batch = odoo_products[batch_start : batch_start + BULK_MUTATION_BATCH_SIZE]
+            processed_count = self._export_batch_bulk(batch, processed_count)
+
+    def _export_batch_bulk(self, odoo_products: "odoo.model.product_product", processed_count: int) -> int:
+        staged_products: list["odoo.model.product_product"] = []
+        with TemporaryDirectory(prefix="shopify_product_set_") as directory:
+            variables_path = Path(directory) / "product_set_variables.jsonl"
+            with variables_path.open("w", encoding="utf-8") as variables_file:
+                for odoo_product in odoo_products:
+                    self.sync_record.ensure_not_canceled()
+                    if self._export_media_order_only(odoo_product):
+                        processed_count = self._count_exported(processed_count)
+                        continue
+                    shopify_product_set_input, identifier = self._build_product_set_request(odoo_product)
+                    variables: dict[str, object] = {"input": shopify_product_set_input.model_dump(by_alias=True, exclude_unset=True)}
+                    if identifier:
+                        variables["identifier"] = identifier.model_dump(by_alias=True, exclude_unset=True)
+                    variables_file.write(json.dumps(variables, default=to_jsonable_python) + "\n")
+                    staged_products.append(odoo_product)
+
+            if not staged_products:
+                return processed_count
+            _logger.info(f"Exporting {len(staged_products)} product(s) through a Shopify bulk productSet run")
+            staged_upload_path = self._stage_bulk_mutation_variables(variables_path)
+
+        operation = self._wait_for_bulk_operation(self._start_bulk_mutation(PRODUCT_SET_GQL, staged_upload_path))
+        result_url = operation.url or operation.partial_data_url
+        if not result_url:
+            raise ShopifyApiError(f"Bulk productSet run {operation.id} finished without a result file")
+
+        for line in self._iter_bulk_result_lines(result_url):
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            odoo_product = staged_products[result["__lineNumber"]]
+            self._apply_bulk_product_set_result(odoo_product, result)
+            processed_count = self._count_exported(processed_count)
+        return processed_count
+
+    def _count_exported(self, processed_count: int) -> int:
+        processed_count += 1
+        self.sync_record.updated_count += 1
+        self._maybe_commit(processed_count)
+        return processed_count
+
+    def _apply_bulk_product_set_result(self, odoo_product: "odoo.model.product_product", result: dict) -> None:
+        if errors := result.get("errors"):
+            _logger.error(f"Bulk productSet failed for Odoo product {odoo_product.id}: {errors}")
+            odoo_product.shopify_next_export = True
+            return
+        try:
+            shopify_response = ProductSet.model_validate(result.get("data") or {}).product_set
+        except ValidationError as error:
+            _logger.error(f"Invalid bulk productSet result for Odoo product {odoo_product.id}: {error}")
+            odoo_product.shopify_next_export = True
+            return
+        try:
+            with self.env.cr.savepoint():
+                self._apply_product_set_response(odoo_product, shopify_response)
+        except ShopifyApiError as error:
+            _logger.error(f"Bulk productSet returned no product for Odoo product {odoo_product.id}: {error}")
+            odoo_product.shopify_next_export = True
+
     def _export_one(self, odoo_product: "odoo.model.product_product") -> None:
+        if self._export_media_order_only(odoo_product):
+            return
+
         client = self.service.client
-        shopify_product_reference = odoo_product.external.shopify
+        shopify_product_set_input, identifier = self._build_product_set_request(odoo_product)
+        try:
+            shopify_response = client.product_set(shopify_product_set_input, identifier)
+        except (ValueError, GraphQLClientGraphQLMultiError) as error:
+            exception = ShopifyApiError("Error exporting product", odoo_record=odoo_product, shopify_input=shopify_product_set_input)
+            _logger.error(exception)
+            raise exception from error
 
-        shopify_product_id = shopify_product_reference.product.id
+        self._apply_product_set_response(odoo_product, shopify_response, shopify_product_set_input)
 
+    @staticmethod
+    def _image_export_state(odoo_product: "odoo.model.product_product") -> tuple[bool, bool]:
         image_records = odoo_product.images
         latest_image_date = get_latest_image_write_date(odoo_product)
         images_need_update = latest_image_date > (odoo_product.shopify_last_exported_at or datetime.min)
         all_images_have_media_id = all(image.external.shopify.media.id for image in image_records) if image_records else False
+        return images_need_update, all_images_have_media_id
+
+    def _export_media_order_only(self, odoo_product: "odoo.model.product_product") -> bool:
+        shopify_product_id = odoo_product.external.shopify.product.id
+        images_need_update, all_images_have_media_id = self._image_export_state(odoo_product)
 
         _logger.info(
             f"Exporting product {odoo_product.id} - images need update: {images_need_update}, "
             f"all have media IDs: {all_images_have_media_id}"
         )
 
-        if images_need_update and all_images_have_media_id and shopify_product_id and not odoo_product.shopify_next_export:
-            ordered_odoo_images = image_records.sorted(key=image_order_key)
-            shopify_product_gid = format_shopify_gid_from_id("Product", shopify_product_id)
-            if not self._verify_shopify_media_for_reorder(
-                odoo_product,
-                shopify_product_id,
-                ordered_odoo_images,
-            ):
-                return
-            self._reorder_shopify_media(odoo_product, shopify_product_gid, ordered_odoo_images)
-            odoo_product.shopify_last_exported_at = fields.Datetime.now()
-            self._mark_export_all_product_complete(odoo_product)
-            return
+        if not (images_need_update and all_images_have_media_id and shopify_product_id and not odoo_product.shopify_next_export):
+            return False
 
-        force_media_upload = bool(image_records) and not all_images_have_media_id
+        ordered_odoo_images = odoo_product.images.sorted(key=image_order_key)
+        shopify_product_gid = format_shopify_gid_from_id("Product", shopify_product_id)
+        if not self._verify_shopify_media_for_reorder(
+            odoo_product,
+            shopify_product_id,
+            ordered_odoo_images,
+        ):
+            return True
+        self._reorder_shopify_media(odoo_product, shopify_product_gid, ordered_odoo_images)
+        odoo_product.shopify_last_exported_at = fields.Datetime.now()
+        self._mark_export_all_product_complete(odoo_product)
+        return True
+
+    def _build_product_set_request(
+        self, odoo_product: "odoo.model.product_product"
+    ) -> tuple[ProductSetInput, ProductSetIdentifiers | None]:
+        shopify_product_id = odoo_product.external.shopify.product.id
+        images_need_update, all_images_have_media_id = self._image_export_state(odoo_product)
+        force_media_upload = bool(odoo_product.images) and not all_images_have_media_id
         shopify_product_set_input = self._map_odoo_product_to_shopify_product_set_input(
             odoo_product,
             images_need_update,
             force_media_upload=force_media_upload,
         )
 
-        shopify_product_gid = format_shopify_gid_from_id("Product", shopify_product_id) if shopify_product_id else None
-        if shopify_product_gid:
-            identifier = ProductSetIdentifiers(id=shopify_product_gid)
+        if shopify_product_id:
+            identifier = ProductSetIdentifiers(id=format_shopify_gid_from_id("Product", shopify_product_id))
         else:
             identifier = None
+        return shopify_product_set_input, identifier
 
-        try:
-            shopify_response = client.product_set(shopify_product_set_input, identifier)
-        except (ValueError, GraphQLClientGraphQLMultiError) as error:
-            exception = ShopifyApiError("Error exporting product", odoo_record=odoo_product, shopify_input=shopify_product_set_input)
-            _logger.error(exception)
-            raise exception from error
-
+    def _apply_product_set_response(
+        self,
+        odoo_product: "odoo.model.product_product",
+        shopify_response: ProductSetProductSet | None,
+        shopify_product_set_input: ProductSetInput | None = None,
+    ) -> None:
         shopify_product = shopify_response.product if shopify_response else None
         if not shopify_product:
             user_error_messages = []
@@ -176,13 +327,13 @@ class ProductExporter(ShopifyBaseExporter["odoo.model.product_product"]):
 
         publication_channels = shopify_product.resource_publications_v_2.nodes
         if not publication_channels or not self.is_published_on_all_channels(publication_channels):
-            self._publish_product(shopify_product_gid or shopify_product.id)
+            self._publish_product(shopify_product.id)
         self._update_odoo_product(odoo_product, shopify_product)
         self._sync_images_after_export(odoo_product, shopify_product)
         self._mark_export_all_product_complete(odoo_product)
 
     def _mark_export_all_product_complete(self, odoo_product: "odoo.model.product_product") -> None:
-        if self.sync_record.mode != "export_all_products":
+        if self.sync_record.mode not in {SyncMode.EXPORT_ALL_PRODUCTS, SyncMode.EXPORT_ALL_PRODUCTS_BULK}:
             return
         if odoo_product not in self.sync_record.odoo_products_to_sync:
             return
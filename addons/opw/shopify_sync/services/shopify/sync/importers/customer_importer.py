@@ -7,9 +7,11 @@ from odoo.exceptions import UserError
 from odoo.addons.phone_validation.tools.phone_validation import phone_format
 
 from ...gql import (
+    GET_CUSTOMERS_GQL,
     Client,
     AddressFields,
     CustomerFields,
+    GetCustomersCustomersNodes,
 )
 from ..base import ShopifyBaseImporter, ShopifyPage
 from ...helpers import (
@@ -31,6 +33,10 @@ AddressType = Literal["delivery", "invoice"]
 
 
 class CustomerImporter(ShopifyBaseImporter[CustomerFields]):
+    bulk_query_document = GET_CUSTOMERS_GQL
+    bulk_node_model = GetCustomersCustomersNodes
+    bulk_child_connections = {"MailingAddress": "addressesV2"}
+
     def __init__(self, env: Environment, sync_record: "odoo.model.shopify_sync") -> None:
         super().__init__(env, sync_record)
 
@@ -8,9 +8,11 @@ from odoo.api import Environment
 from pydantic import BaseModel, field_validator
 
 from ...gql import (
+    GET_ORDERS_GQL,
     AddressFields,
     Client,
     CurrencyCode,
+    GetOrdersOrdersNodes,
     MoneyBagFields,
     OrderFields,
     OrderLineItemFields,
@@ -69,6 +71,22 @@ class EbayOrderData(BaseModel):
 
 
 class OrderImporter(ShopifyBaseImporter[OrderFields]):
+    bulk_query_document = GET_ORDERS_GQL
+    bulk_node_model = GetOrdersOrdersNodes
+    bulk_child_connections = {
+        "LineItem": "lineItems",
+        "ShippingLine": "shippingLines",
+        "AutomaticDiscountApplication": "discountApplications",
+        "DiscountCodeApplication": "discountApplications",
+        "ManualDiscountApplication": "discountApplications",
+        "ScriptDiscountApplication": "discountApplications",
+        "Metafield": "metafields",
+    }
+    # Customer addresses would be a sixth connection, past Shopify's bulk limit of five; the
+    # customer import lane brings them in, and the inline customer gets an empty connection.
+    bulk_omitted_fields = {"CustomerFields": ("addressesV2",)}
+    bulk_nested_child_connections = {"MailingAddress": ("customer", "addressesV2")}
+
     def __init__(self, env: Environment, sync_record: "odoo.model.shopify_sync") -> None:
         super().__init__(env, sync_record)
 
@@ -10,15 +10,18 @@ from odoo.tools.mail import html2plaintext
 from pydantic import AnyUrl
 
 from ...gql import (
+    GET_PRODUCTS_GQL,
     Client,
     MediaStatus,
     GetProductsProducts,
+    GetProductsProductsNodes,
     ProductFields,
     ProductFieldsMediaNodesMediaImage,
 )
 from ..base import ShopifyBaseImporter
 from ..change_detection import changed_values, write_if_changed
 from ...helpers import (
+    WEBHOOK_ID_QUERY_BATCH_SIZE,
     SyncMode,
     ShopifyDataError,
     ShopifyMissingSkuFieldError,
@@ -64,6 +67,14 @@ class ExistingProductEvaluation:
 
 
 class ProductImporter(ShopifyBaseImporter[ProductFields]):
+    bulk_query_document = GET_PRODUCTS_GQL
+    bulk_node_model = GetProductsProductsNodes
+    bulk_child_connections = {
+        "ProductVariant": "variants",
+        "MediaImage": "media",
+        "Metafield": "metafields",
+    }
+
     def __init__(self, env: Environment, sync_record: "odoo.model.shopify_sync") -> None:
         super().__init__(env, sync_record)
 
@@ -73,6 +84,21 @@ class ProductImporter(ShopifyBaseImporter[ProductFields]):
     def import_products_since_last_import(self) -> int:
         return self.run_since_last_import("product")
 
+    def product_ids_for_inventory_items(self, inventory_item_ids: list[str]) -> list[str]:
+        # Inventory webhooks only name the inventory item; one inventoryItems lookup per batch maps them to products.
+        client = self.service.client
+        product_ids: dict[str, None] = {}
+        for batch_start in range(0, len(inventory_item_ids), WEBHOOK_ID_QUERY_BATCH_SIZE):
+            batch = inventory_item_ids[batch_start : batch_start + WEBHOOK_ID_QUERY_BATCH_SIZE]
+            inventory_items = client.get_inventory_item_products(
+                limit=len(batch),
+                query=" OR ".join(f'id:"{inventory_item_id}"' for inventory_item_id in batch),
+            )
+            for inventory_item in inventory_items.nodes:
+                for variant in inventory_item.variants.nodes if inventory_item.variants else []:
+                    product_ids[parse_shopify_id_from_gid(variant.product.id)] = None
+        return list(product_ids)
+
     def _import_one(self, shopify_product: ProductFields) -> bool:
         if not shopify_product.variants or not shopify_product.variants.nodes:
             raise ShopifyDataError(f"No variants found", shopify_record=shopify_product)
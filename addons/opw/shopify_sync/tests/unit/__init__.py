@@ -6,6 +6,10 @@ from . import test_shopify_order_external_id_migration
 from . import test_shopify_cron_migration
 from . import test_shopify_marketplace_identity_migration
 from . import test_shopify_order_external_id_search
+from . import test_shopify_sync_lanes
+from . import test_shopify_webhook_inbox
+from . import test_product_export_candidates
 from . import test_service_product_deleter
+from . import test_service_shopify_bulk
 from . import test_service_shopify_helpers
 from . import test_service_shopify_sync
@@ -47,6 +47,24 @@ class TestExportAllProductsResume(UnitTestCase):
         self.assertEqual(sorted(exported_products.ids), sorted([self.products[1].id, self.products[2].id]))
         self.assertEqual(sync.total_count, len(self.products))
 
+    def test_export_all_products_bulk_uses_bulk_exporter(self) -> None:
+        sync = ShopifySyncFactory.create(
+            self.env,
+            mode="export_all_products_bulk",
+            total_count=len(self.products),
+            odoo_products_to_sync=[(6, 0, [product.id for product in self.products])],
+        )
+
+        with common.patch("odoo.addons.shopify_sync.services.shopify.ProductExporter") as exporter_class:
+            exporter = exporter_class.return_value
+
+            sync._run_export_all_products_bulk()
+
+        exporter.export_products.assert_not_called()
+        exporter.export_products_bulk.assert_called_once()
+        exported_products = exporter.export_products_bulk.call_args.args[0]
+        self.assertEqual(sorted(exported_products.ids), sorted(product.id for product in self.products))
+
     def test_mark_export_all_product_complete_removes_product_from_pending_batch(self) -> None:
         sync = ShopifySyncFactory.create(
             self.env,
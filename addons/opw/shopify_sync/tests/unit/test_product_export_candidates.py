@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from odoo import fields
+
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+from ..fixtures.factories import ProductFactory, ShopifySyncFactory
+
+from ...services.shopify.sync.exporters.product_exporter import ProductExporter
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestProductExportCandidates(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.exported_at = fields.Datetime.now() + timedelta(days=1)
+        self.products = self.env["product.product"].browse(
+            [ProductFactory.create(self.env, is_ready_for_sale=True, is_published=True).product_variant_id.id for _ in range(3)]
+        )
+        self.products.write({"shopify_last_exported_at": self.exported_at, "shopify_next_export": False})
+        self.exporter = ProductExporter(self.env, ShopifySyncFactory.create(self.env, mode="export_changed_products"))
+
+    def _touch(self, table: str, record_id: int) -> None:
+        self.env.flush_all()
+        self.env.cr.execute(
+            f"UPDATE {table} SET write_date = %s WHERE id = %s",
+            (self.exported_at + timedelta(hours=1), record_id),
+        )
+
+    def test_find_products_to_export_skips_products_exported_after_last_write(self) -> None:
+        self.assertFalse(self.exporter._find_products_to_export() & self.products)
+
+    def test_find_products_to_export_detects_template_and_image_writes(self) -> None:
+        image = (
+            self.env["product.image"]
+            .with_context(skip_shopify_sync=True)
+            .create({"name": "Image", "product_tmpl_id": self.products[1].product_tmpl_id.id})
+        )
+        self._touch("product_template", self.products[0].product_tmpl_id.id)
+        self._touch("product_image", image.id)
+
+        result = self.exporter._find_products_to_export()
+
+        self.assertEqual(result & self.products, self.products[:2])
+
+    def test_find_products_to_export_uses_cutoff_over_last_export(self) -> None:
+        result = self.exporter._find_products_to_export(self.exported_at - timedelta(days=2))
+
+        self.assertEqual(result & self.products, self.products)
+
+    def test_iter_product_ids_to_export_pages_by_id(self) -> None:
+        self.products.write({"shopify_next_export": True})
+
+        batches = list(self.exporter._iter_product_ids_to_export(batch_size=1))
+
+        self.assertTrue(all(len(batch_ids) == 1 for batch_ids in batches))
+        exported_ids = [product_id for batch_ids in batches for product_id in batch_ids]
+        self.assertEqual(exported_ids, sorted(exported_ids))
+        self.assertLessEqual(set(self.products.ids), set(exported_ids))
@@ -0,0 +1,335 @@
+import json
+from pathlib import Path
+
+from odoo.api import Environment
+from test_support.tests.shared.sync_doubles import DummySyncRecord
+
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+from ..fixtures.factories import ProductFactory, ShopifySyncFactory
+
+from ...services.shopify.gql import (
+    GET_ORDERS_GQL,
+    GET_PRODUCTS_GQL,
+    PRODUCT_SET_GQL,
+    BulkOperationStatus,
+    BulkOperationUserErrorCode,
+    Client,
+    GetOrdersOrdersNodes,
+    ProductSetInput,
+)
+from ...services.shopify.helpers import ShopifyApiError
+from ...services.shopify.sync.base import ShopifyBaseImporter
+from ...services.shopify.sync.bulk import build_bulk_query, group_bulk_result_lines
+from ...services.shopify.sync.exporters.product_exporter import ProductExporter
+from ...services.shopify.sync.importers.order_importer import OrderImporter
+
+PRODUCT_CHILD_CONNECTIONS = {"ProductVariant": "variants", "MediaImage": "media", "Metafield": "metafields"}
+
+
+class DummyBulkImporter(ShopifyBaseImporter[dict]):
+    bulk_query_document = GET_PRODUCTS_GQL
+    bulk_child_connections = PRODUCT_CHILD_CONNECTIONS
+
+    def __init__(self, env: Environment, sync_record: DummySyncRecord, lines: list[str]) -> None:
+        super().__init__(env, sync_record)
+        self.lines = lines
+        self.imported: list[dict] = []
+        self.service = common.MagicMock()
+        self.bulk_node_model = common.MagicMock()
+        self.bulk_node_model.model_validate.side_effect = lambda bulk_object: bulk_object
+
+    def _fetch_page(self, client: Client, query: str | None, cursor: str | None) -> None:
+        raise AssertionError("bulk imports must not page")
+
+    def _import_one(self, node: dict) -> bool:
+        self.imported.append(node)
+        return True
+
+    def _iter_bulk_result_lines(self, url: str) -> list[str]:
+        return self.lines
+
+
+def _line(**values: object) -> str:
+    return json.dumps(values)
+
+
+def _money_bag(amount: str) -> dict[str, object]:
+    money = {"amount": amount, "currencyCode": "USD"}
+    return {"presentmentMoney": money, "shopMoney": money}
+
+
+def _address(address_id: int, address1: str) -> dict[str, object]:
+    return {
+        "id": f"gid://shopify/MailingAddress/{address_id}?model_name=CustomerAddress",
+        "company": None,
+        "name": "Pat Boater",
+        "address1": address1,
+        "address2": None,
+        "city": "Tampa",
+        "provinceCode": "FL",
+        "province": "Florida",
+        "countryCodeV2": "US",
+        "zip": "33602",
+        "phone": None,
+    }
+
+
+def _order_with_customer_lines(address_parent_id: str) -> list[str]:
+    order_id = "gid://shopify/Order/1"
+    customer = {
+        "id": "gid://shopify/Customer/7",
+        "firstName": "Pat",
+        "lastName": "Boater",
+        "defaultEmailAddress": None,
+        "defaultPhoneNumber": None,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "defaultAddress": _address(71, "1 Dock St"),
+        "tags": [],
+        "taxExempt": False,
+    }
+    order = {
+        "id": order_id,
+        "name": "#1001",
+        "createdAt": "2024-01-03T00:00:00Z",
+        "updatedAt": "2024-01-03T00:00:00Z",
+        "processedAt": "2024-01-03T00:00:00Z",
+        "closedAt": None,
+        "cancelledAt": None,
+        "currencyCode": "USD",
+        "totalPriceSet": _money_bag("110.00"),
+        "subtotalPriceSet": _money_bag("100.00"),
+        "totalShippingPriceSet": _money_bag("10.00"),
+        "customer": customer,
+        "shippingAddress": _address(90, "1 Dock St"),
+        "billingAddress": None,
+        "fulfillments": [],
+        "totalDiscountsSet": None,
+        "taxLines": [],
+        "note": None,
+        "customAttributes": [],
+        "paymentGatewayNames": ["shopify_payments"],
+    }
+    line_item = {
+        "id": "gid://shopify/LineItem/11",
+        "sku": "SKU-1",
+        "quantity": 1,
+        "name": "Prop",
+        "variant": None,
+        "originalUnitPriceSet": _money_bag("100.00"),
+        "customAttributes": [],
+        "discountAllocations": [],
+        "__parentId": order_id,
+    }
+    return [
+        json.dumps(order),
+        json.dumps(line_item),
+        json.dumps({**_address(71, "1 Dock St"), "__parentId": address_parent_id}),
+        json.dumps({**_address(72, "9 Marina Way"), "__parentId": address_parent_id}),
+    ]
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestShopifyBulkQuery(UnitTestCase):
+    def test_build_bulk_query_drops_pagination(self) -> None:
+        bulk_query = build_bulk_query(GET_PRODUCTS_GQL, query="status:active")
+
+        self.assertNotIn("pageInfo", bulk_query)
+        self.assertNotIn("$cursor", bulk_query)
+        self.assertNotIn("$limit", bulk_query)
+        self.assertIn('products(sortKey: UPDATED_AT, query: "status:active")', bulk_query)
+        self.assertIn("fragment ProductFields on Product", bulk_query)
+
+    def test_build_bulk_query_keeps_orders_within_connection_limit(self) -> None:
+        bulk_query = build_bulk_query(GET_ORDERS_GQL, omitted_fields=OrderImporter.bulk_omitted_fields)
+
+        self.assertIn("fragment CustomerFields on Customer", bulk_query)
+        self.assertIn("defaultAddress", bulk_query)
+        self.assertNotIn("addressesV2", bulk_query)
+        self.assertIn("lineItems(first: 250)", bulk_query)
+
+    def test_build_bulk_query_rejects_more_than_five_connections(self) -> None:
+        with self.assertRaises(ShopifyApiError):
+            build_bulk_query(GET_ORDERS_GQL)
+
+    def test_group_bulk_result_lines_nests_children_under_parent(self) -> None:
+        lines = [
+            _line(id="gid://shopify/Product/1", title="Motor"),
+            _line(id="gid://shopify/ProductVariant/11", sku="SKU-1", __parentId="gid://shopify/Product/1"),
+            _line(__typename="MediaImage", id="gid://shopify/MediaImage/12", __parentId="gid://shopify/Product/1"),
+            "",
+            _line(id="gid://shopify/Product/2", title="Prop"),
+        ]
+
+        grouped = list(group_bulk_result_lines(lines, PRODUCT_CHILD_CONNECTIONS))
+
+        self.assertEqual([node["id"] for node in grouped], ["gid://shopify/Product/1", "gid://shopify/Product/2"])
+        self.assertEqual([variant["sku"] for variant in grouped[0]["variants"]["nodes"]], ["SKU-1"])
+        self.assertEqual(len(grouped[0]["media"]["nodes"]), 1)
+        self.assertEqual(grouped[0]["metafields"], {"nodes": []})
+        self.assertEqual(grouped[1]["variants"], {"nodes": []})
+        self.assertNotIn("__parentId", grouped[0]["variants"]["nodes"][0])
+
+    def test_group_bulk_result_lines_folds_customer_addresses_onto_order_customer(self) -> None:
+        # Shopify may parent nested connection rows to the inline customer or to the order itself.
+        for address_parent_id in ("gid://shopify/Customer/7", "gid://shopify/Order/1"):
+            with self.subTest(address_parent_id=address_parent_id):
+                grouped = list(
+                    group_bulk_result_lines(
+                        _order_with_customer_lines(address_parent_id),
+                        OrderImporter.bulk_child_connections,
+                        OrderImporter.bulk_nested_child_connections,
+                    )
+                )
+
+                self.assertEqual(len(grouped), 1)
+                order = GetOrdersOrdersNodes.model_validate(grouped[0])
+                self.assertEqual(
+                    [address.address_1 for address in order.customer.addresses_v_2.nodes],
+                    ["1 Dock St", "9 Marina Way"],
+                )
+                self.assertEqual([line.sku for line in order.line_items.nodes], ["SKU-1"])
+                self.assertEqual(order.shipping_lines.nodes, [])
+
+    def test_group_bulk_result_lines_gives_customer_without_addresses_an_empty_connection(self) -> None:
+        lines = _order_with_customer_lines("gid://shopify/Customer/7")[:2]
+
+        grouped = list(
+            group_bulk_result_lines(lines, OrderImporter.bulk_child_connections, OrderImporter.bulk_nested_child_connections)
+        )
+
+        order = GetOrdersOrdersNodes.model_validate(grouped[0])
+        self.assertEqual(order.customer.addresses_v_2.nodes, [])
+
+    def test_group_bulk_result_lines_rejects_ungrouped_children(self) -> None:
+        lines = [
+            _line(id="gid://shopify/Product/1"),
+            _line(id="gid://shopify/ProductVariant/11", __parentId="gid://shopify/Product/9"),
+        ]
+
+        with self.assertRaises(ShopifyApiError):
+            list(group_bulk_result_lines(lines, PRODUCT_CHILD_CONNECTIONS))
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestShopifyBulkImporter(UnitTestCase):
+    def _importer(self, lines: list[str]) -> DummyBulkImporter:
+        importer = DummyBulkImporter(self.env, DummySyncRecord(), lines)
+        client = importer.service.client
+        client.bulk_operation_run_query.return_value = common.MagicMock(
+            bulk_operation=common.MagicMock(id="gid://shopify/BulkOperation/1"), user_errors=[]
+        )
+        client.get_bulk_operation.return_value = common.MagicMock(
+            status=BulkOperationStatus.COMPLETED, url="https://example.com/result.jsonl", root_object_count=2
+        )
+        return importer
+
+    def test_run_bulk_imports_each_root_node(self) -> None:
+        importer = self._importer(
+            [
+                _line(id="gid://shopify/Product/1"),
+                _line(id="gid://shopify/ProductVariant/11", __parentId="gid://shopify/Product/1"),
+                _line(id="gid://shopify/Product/2"),
+            ]
+        )
+
+        importer.run_bulk()
+
+        self.assertEqual([node["id"] for node in importer.imported], ["gid://shopify/Product/1", "gid://shopify/Product/2"])
+        self.assertEqual(importer.sync_record.total_count, 2)
+        self.assertEqual(importer.sync_record.updated_count, 2)
+
+    def test_run_bulk_waits_for_operation_in_progress(self) -> None:
+        importer = self._importer([])
+        client = importer.service.client
+        busy = common.MagicMock(
+            bulk_operation=None,
+            user_errors=[common.MagicMock(code=BulkOperationUserErrorCode.OPERATION_IN_PROGRESS, message="busy")],
+        )
+        client.bulk_operation_run_query.side_effect = [busy, client.bulk_operation_run_query.return_value]
+        client.current_bulk_operation.side_effect = [
+            common.MagicMock(nodes=[common.MagicMock(id="gid://shopify/BulkOperation/0")]),
+            common.MagicMock(nodes=[]),
+        ]
+
+        with common.patch.object(DummyBulkImporter, "_sleep_while_bulk_operation_runs") as sleep_mock:
+            importer.run_bulk()
+
+        self.assertEqual(client.bulk_operation_run_query.call_count, 2)
+        sleep_mock.assert_called_once()
+
+    def test_run_bulk_raises_when_operation_fails(self) -> None:
+        importer = self._importer([])
+        importer.service.client.get_bulk_operation.return_value = common.MagicMock(status=BulkOperationStatus.FAILED)
+
+        with self.assertRaises(ShopifyApiError):
+            importer.run_bulk()
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestShopifyBulkProductExport(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.products = self.env["product.product"].browse([ProductFactory.create(self.env).product_variant_id.id for _ in range(2)])
+        self.sync = ShopifySyncFactory.create(
+            self.env,
+            mode="export_all_products_bulk",
+            odoo_products_to_sync=[(6, 0, self.products.ids)],
+        )
+        self.exporter = ProductExporter(self.env, self.sync)
+        self.staged_variables: list[dict] = []
+
+    def _stage(self, variables_path: Path) -> str:
+        self.staged_variables = [json.loads(line) for line in variables_path.read_text(encoding="utf-8").splitlines()]
+        return "tmp/product_set_variables.jsonl"
+
+    def test_export_products_bulk_applies_results_by_line_number(self) -> None:
+        product_set_data = {"productSet": {"product": None, "userErrors": []}}
+        result_lines = [
+            _line(data=product_set_data, __lineNumber=1),
+            _line(errors=[{"message": "Throttled"}], __lineNumber=0),
+        ]
+        exporter_class = type(self.exporter)
+        with (
+            common.patch.object(exporter_class, "_export_media_order_only", return_value=False),
+            common.patch.object(
+                exporter_class,
+                "_build_product_set_request",
+                side_effect=lambda product: (ProductSetInput(title=f"Product {product.id}"), None),
+            ),
+            common.patch.object(exporter_class, "_stage_bulk_mutation_variables", side_effect=self._stage),
+            common.patch.object(exporter_class, "_start_bulk_mutation", return_value="gid://shopify/BulkOperation/2") as start_mock,
+            common.patch.object(
+                exporter_class,
+                "_wait_for_bulk_operation",
+                return_value=common.MagicMock(url="https://example.com/result.jsonl"),
+            ),
+            common.patch.object(exporter_class, "_iter_bulk_result_lines", return_value=result_lines),
+            common.patch.object(exporter_class, "_apply_product_set_response") as apply_mock,
+        ):
+            self.exporter.export_products_bulk(self.products)
+
+        start_mock.assert_called_once_with(PRODUCT_SET_GQL, "tmp/product_set_variables.jsonl")
+        self.assertEqual(
+            [variables["input"]["title"] for variables in self.staged_variables],
+            [f"Product {product.id}" for product in self.products],
+        )
+        self.assertNotIn("identifier", self.staged_variables[0])
+        apply_mock.assert_called_once()
+        self.assertEqual(apply_mock.call_args.args[0], self.products[1])
+        self.assertTrue(self.products[0].shopify_next_export)
+        self.assertEqual(self.sync.updated_count, 2)
+
+    def test_export_products_bulk_skips_upload_for_media_reorders(self) -> None:
+        exporter_class = type(self.exporter)
+        with (
+            common.patch.object(exporter_class, "_export_media_order_only", return_value=True),
+            common.patch.object(exporter_class, "_stage_bulk_mutation_variables") as stage_mock,
+            common.patch.object(exporter_class, "_start_bulk_mutation") as start_mock,
+        ):
+            self.exporter.export_products_bulk(self.products)
+
+        stage_mock.assert_not_called()
+        start_mock.assert_not_called()
+        self.assertEqual(self.sync.updated_count, 2)
@@ -2,6 +2,7 @@ from ..common_imports import common
 from odoo.api import Environment
 from test_support.tests.shared.sync_doubles import DummySyncRecord
 
+from ...services.shopify.sync import base as _base_module
 from ...services.shopify.sync.base import ShopifyBaseImporter, ShopifyBaseExporter, ShopifyBaseDeleter
 from ...services.shopify.helpers import format_datetime_for_shopify, parse_shopify_datetime_to_utc
 from ...services.shopify.gql import Client
@@ -96,6 +97,14 @@ class TestShopifySyncItems(UnitTestCase):
         self.assertTrue(importer.run_by_id(42))
         self.assertEqual(importer.run_query, 'id:"42"')
 
+    def test_importer_run_by_ids_batches_or_queries(self) -> None:
+        sync = self._sync()
+        importer = DummyImporter(self.env, sync, make_pages())
+        with common.patch.object(_base_module, "WEBHOOK_ID_QUERY_BATCH_SIZE", 2):
+            importer.run_by_ids(["1", "2", "3"])
+        queries = list(dict.fromkeys(query for query, _cursor in importer.fetch_calls))
+        self.assertEqual(queries, ['id:"1" OR id:"2"', 'id:"3"'])
+
     def test_importer_run_since_last_import(self) -> None:
         sync = self._sync()
         key = "shopify.last_order_import_time"
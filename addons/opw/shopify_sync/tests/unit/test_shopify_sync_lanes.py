@@ -0,0 +1,71 @@
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+from ..fixtures.factories import ShopifySyncFactory
+
+from ...services.shopify import cost_bucket as _cost_bucket_module
+from ...services.shopify.cost_bucket import ShopifyCostBucket
+from ...services.shopify.helpers import SyncLane, SyncMode
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestShopifySyncLanes(UnitTestCase):
+    def test_modes_are_assigned_to_resource_lanes(self) -> None:
+        self.assertEqual(SyncMode.IMPORT_CHANGED_ORDERS.lane, SyncLane.ORDERS)
+        self.assertEqual(SyncMode.IMPORT_ONE_CUSTOMER.lane, SyncLane.CUSTOMERS)
+        self.assertEqual(SyncMode.IMPORT_ALL_PRODUCTS.lane, SyncLane.PRODUCTS)
+        self.assertEqual(SyncMode.RESET_SHOPIFY.lane, SyncLane.PRODUCTS)
+
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_CHANGED_ORDERS.value)
+
+        self.assertEqual(sync.lane, SyncLane.ORDERS.value)
+
+    def test_order_lane_runs_while_product_lane_is_busy(self) -> None:
+        product_sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_ALL_PRODUCTS.value)
+        product_sync.state = "running"
+        order_sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_CHANGED_ORDERS.value)
+        sync_model = self.env["shopify.sync"]
+        executed: list[int] = []
+
+        with common.patch.object(
+            type(sync_model),
+            "_execute_mode",
+            autospec=True,
+            side_effect=lambda sync: executed.append(sync.id) or sync.write({"state": "success"}),
+        ):
+            sync_model._cron_dispatch_next(lane=SyncLane.ORDERS.value)
+
+        self.assertEqual(executed, [order_sync.id])
+        self.assertEqual(product_sync.state, "running")
+
+    def test_product_lane_still_runs_one_sync_at_a_time(self) -> None:
+        ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_ALL_PRODUCTS.value).state = "running"
+        queued_sync = ShopifySyncFactory.create(self.env, mode=SyncMode.EXPORT_CHANGED_PRODUCTS.value)
+        sync_model = self.env["shopify.sync"]
+
+        with common.patch.object(type(sync_model), "_execute_mode", autospec=True) as execute_mock:
+            sync_model._cron_dispatch_next(lane=SyncLane.PRODUCTS.value)
+
+        execute_mock.assert_not_called()
+        self.assertEqual(queued_sync.state, "queued")
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestShopifyCostBucket(UnitTestCase):
+    def test_acquire_is_free_until_first_observation(self) -> None:
+        self.assertEqual(ShopifyCostBucket().acquire(100, 500, 60), 0.0)
+
+    def test_concurrent_reservations_share_the_budget(self) -> None:
+        bucket = ShopifyCostBucket()
+        with common.patch.object(_cost_bucket_module, "monotonic", return_value=10.0):
+            bucket.observe({"currentlyAvailable": 600, "maximumAvailable": 2000, "restoreRate": 50})
+
+            self.assertEqual(bucket.acquire(100, 500, 60), 0.0)
+            self.assertEqual(bucket.acquire(100, 500, 60), 0.0)
+            self.assertEqual(bucket.acquire(100, 500, 60), 2.0)
+
+    def test_acquire_refills_at_restore_rate(self) -> None:
+        bucket = ShopifyCostBucket()
+        with common.patch.object(_cost_bucket_module, "monotonic", return_value=10.0):
+            bucket.observe({"currentlyAvailable": 100, "maximumAvailable": 2000, "restoreRate": 50})
+        with common.patch.object(_cost_bucket_module, "monotonic", return_value=20.0):
+            self.assertEqual(bucket.acquire(100, 500, 60), 0.0)
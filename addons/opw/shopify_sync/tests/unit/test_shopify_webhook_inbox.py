@@ -0,0 +1,124 @@
+from ..common_imports import common
+from ..fixtures.base import UnitTestCase
+from ..fixtures.factories import ShopifySyncFactory
+
+from ...services.shopify.gql import GetInventoryItemProductsInventoryItems
+from ...services.shopify.helpers import SyncMode
+from ...services.shopify.sync.importers.order_importer import OrderImporter
+from ...services.shopify.sync.importers.product_importer import ProductImporter
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestShopifyWebhookInbox(UnitTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.events = self.env["shopify.webhook.event"]
+
+    def test_webhook_order_sync_imports_each_id_once(self) -> None:
+        for shopify_id in (101, 102, 101):
+            self.events.record_event("order", shopify_id, "orders/updated")
+        customer_event = self.events.record_event("customer", 201, "customers/update")
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_ORDERS.value)
+
+        with common.patch.object(OrderImporter, "run_by_ids", autospec=True) as run_by_ids_mock:
+            sync._run_import_webhook_orders()
+
+        run_by_ids_mock.assert_called_once()
+        self.assertEqual(run_by_ids_mock.call_args.args[1], ["101", "102"])
+        self.assertFalse(self.events._pending_events("order"))
+        self.assertTrue(customer_event.exists())
+
+    def test_webhook_product_sync_queues_export_only_after_updates(self) -> None:
+        self.events.record_event("product", 301, "products/update")
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_PRODUCTS.value)
+
+        def import_updates(importer: ProductImporter, _shopify_ids: list[str]) -> int:
+            importer.sync_record.updated_count += 1
+            return importer.sync_record.updated_count
+
+        with common.patch.object(ProductImporter, "run_by_ids", autospec=True, side_effect=import_updates):
+            sync._run_import_webhook_products()
+
+        export_sync = self.env["shopify.sync"].search([("mode", "=", SyncMode.EXPORT_CHANGED_PRODUCTS.value)])
+        self.assertEqual(export_sync.state, "queued")
+
+    def test_webhook_sync_without_events_skips_shopify(self) -> None:
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_PRODUCTS.value)
+
+        with common.patch.object(ProductImporter, "run_by_ids", autospec=True) as run_by_ids_mock:
+            sync._run_import_webhook_products()
+
+        run_by_ids_mock.assert_not_called()
+        self.assertFalse(self.env["shopify.sync"].search([("mode", "=", SyncMode.EXPORT_CHANGED_PRODUCTS.value)]))
+
+    def test_webhook_product_sync_resolves_inventory_items_to_products(self) -> None:
+        self.events.record_event("product", 301, "products/update")
+        for inventory_item_id in (401, 402, 401):
+            self.events.record_event("inventory_item", inventory_item_id, "inventory_levels/update")
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_PRODUCTS.value)
+
+        with (
+            common.patch.object(
+                ProductImporter, "product_ids_for_inventory_items", autospec=True, return_value=["301", "302"]
+            ) as resolve_mock,
+            common.patch.object(ProductImporter, "run_by_ids", autospec=True) as run_by_ids_mock,
+        ):
+            sync._run_import_webhook_products()
+
+        self.assertEqual(resolve_mock.call_args.args[1], ["401", "402"])
+        self.assertEqual(run_by_ids_mock.call_args.args[1], ["301", "302"])
+        self.assertFalse(self.events.search([]))
+
+    def test_product_ids_for_inventory_items_uses_one_lookup_per_batch(self) -> None:
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_PRODUCTS.value)
+        importer = ProductImporter(self.env, sync)
+        importer.service = common.MagicMock()
+        client = importer.service.client
+        client.get_inventory_item_products.return_value = GetInventoryItemProductsInventoryItems.model_validate(
+            {
+                "nodes": [
+                    {
+                        "id": "gid://shopify/InventoryItem/401",
+                        "variants": {"nodes": [{"product": {"id": "gid://shopify/Product/301"}}]},
+                    },
+                    {
+                        "id": "gid://shopify/InventoryItem/402",
+                        "variants": {"nodes": [{"product": {"id": "gid://shopify/Product/301"}}]},
+                    },
+                    {"id": "gid://shopify/InventoryItem/403", "variants": None},
+                ]
+            }
+        )
+
+        product_ids = importer.product_ids_for_inventory_items(["401", "402", "403"])
+
+        self.assertEqual(product_ids, ["301"])
+        client.get_inventory_item_products.assert_called_once_with(limit=3, query='id:"401" OR id:"402" OR id:"403"')
+
+    def test_webhook_sync_queues_follow_up_for_events_received_mid_run(self) -> None:
+        self.events.record_event("order", 101, "orders/updated")
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_ORDERS.value)
+        sync.state = "running"
+
+        def receive_webhook_mid_run(_importer: OrderImporter, _shopify_ids: list[str]) -> int:
+            self.events.record_event("order", 102, "orders/updated")
+            return 0
+
+        with common.patch.object(OrderImporter, "run_by_ids", autospec=True, side_effect=receive_webhook_mid_run):
+            sync._run_import_webhook_orders()
+
+        self.assertEqual(self.events._coalesced_ids(self.events._pending_events("order")), ["102"])
+        follow_up = self.env["shopify.sync"].search([("mode", "=", SyncMode.IMPORT_WEBHOOK_ORDERS.value), ("state", "=", "queued")])
+        self.assertEqual(len(follow_up), 1)
+
+    def test_webhook_sync_without_late_events_queues_no_follow_up(self) -> None:
+        self.events.record_event("order", 101, "orders/updated")
+        sync = ShopifySyncFactory.create(self.env, mode=SyncMode.IMPORT_WEBHOOK_ORDERS.value)
+        sync.state = "running"
+
+        with common.patch.object(OrderImporter, "run_by_ids", autospec=True):
+            sync._run_import_webhook_orders()
+
+        self.assertFalse(
+            self.env["shopify.sync"].search([("mode", "=", SyncMode.IMPORT_WEBHOOK_ORDERS.value), ("state", "=", "queued")])
+        )
@@ -4,6 +4,8 @@ from typing import Any, Self
 
 from odoo import api, fields, models
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
+from odoo.tools.query import Query
 
 _logger = logging.getLogger(__name__)
 
@@ -43,48 +45,6 @@ class ProductTemplate(models.Model):
 
         return defaults
 
-    # noinspection PyShadowingNames
-    @api.model
-    def _read_group(
-        self,
-        domain: fields.Domain,
-        groupby: tuple[str, ...] | list[str] = (),
-        aggregates: tuple[str, ...] | list[str] = (),
-        having: fields.Domain = (),
-        offset: int = 0,
-        limit: int | None = None,
-        order: str | None = None,
-    ) -> list[tuple[object, ...]]:
-        if self.env.context.get("skip_weighted_read_group"):
-            return super()._read_group(
-                domain,
-                groupby,
-                aggregates,
-                having=having,
-                offset=offset,
-                limit=limit,
-                order=order,
-            )
-        groups: list[tuple[object, ...]] = super()._read_group(
-            domain,
-            groupby,
-            aggregates,
-            having=having,
-            offset=offset,
-            limit=limit,
-            order=order,
-        )
-        return self._apply_quantity_sums_to_read_group(
-            groups,
-            groupby,
-            aggregates,
-            base_domain=domain,
-            having=having,
-            offset=offset,
-            limit=limit,
-            order=order,
-        )
-
     # noinspection PyShadowingNames
     @api.model
     def formatted_read_group(
@@ -108,111 +68,37 @@ class ProductTemplate(models.Model):
         )
         return groups
 
-    def _apply_quantity_sums(
-        self,
-        groups: list[dict[str, Any]],
-        field_names: tuple[str, ...] | list[str],
-        base_domain: fields.Domain | None = None,
-    ) -> list[dict[str, Any]]:
-        requested_field_names = set(field_names)
-        weighted_list_price_requested = "list_price" in requested_field_names or "list_price:sum" in requested_field_names
-        weighted_standard_price_requested = (
-            "standard_price" in requested_field_names or "standard_price:sum" in requested_field_names
-        )
-        if not weighted_list_price_requested and not weighted_standard_price_requested:
-            return groups
-        for group in groups:
-            group_domain: fields.Domain | None = group.get("__domain")
-            output_prefix = ""
-            if group_domain is None:
-                extra_domain: fields.Domain | None = group.get("__extra_domain")
-                if extra_domain is None or base_domain is None:
-                    continue
-                group_domain = fields.Domain(extra_domain) & fields.Domain(base_domain)
-                output_prefix = ":sum"
-
-            products = self.search(group_domain)
-            if weighted_list_price_requested:
-                group[f"list_price{output_prefix}"] = sum(product.list_price * product.initial_quantity for product in products)
-
-            if weighted_standard_price_requested:
-                group[f"standard_price{output_prefix}"] = sum(
-                    product.standard_price * product.initial_quantity for product in products
-                )
-
-        return groups
-
-    def _apply_quantity_sums_to_read_group(
-        self,
-        groups: list[tuple[object, ...]],
-        groupby: tuple[str, ...] | list[str],
-        aggregates: tuple[str, ...] | list[str],
-        *,
-        base_domain: fields.Domain,
-        having: fields.Domain,
-        offset: int,
-        limit: int | None,
-        order: str | None,
-    ) -> list[tuple[object, ...]]:
-        aggregate_set = set(aggregates)
-        weighted_fields = {"list_price", "list_price:sum", "standard_price", "standard_price:sum"}
-        if not aggregate_set.intersection(weighted_fields):
-            return groups
-
-        formatted_groups = super(
-            ProductTemplate,
-            self.with_context(skip_weighted_read_group=True),
-        ).formatted_read_group(
-            base_domain,
-            groupby,
-            aggregates,
-            having=having,
-            offset=offset,
-            limit=limit,
-            order=order,
-        )
-        formatted_groups = self._apply_quantity_sums(formatted_groups, aggregates, base_domain=base_domain)
-        groupby_fields = list(groupby)
-        groupby_count = len(groupby_fields)
-
-        weighted_by_key: dict[tuple[object, ...], dict[str, Any]] = {}
-        for formatted_group in formatted_groups:
-            key = tuple(
-                self._normalize_group_value(formatted_group.get(field_name))
-                for field_name in groupby_fields
+    @api.model
+    def _read_group_select(self, aggregate_spec: str, query: Query) -> SQL:
+        # Price sums in grouped views are weighted by initial_quantity, computed inside the grouped query.
+        if aggregate_spec == "list_price:sum":
+            return SQL(
+                "SUM(%s * COALESCE(%s, 0))",
+                self._field_to_sql(self._table, "list_price", query),
+                self._field_to_sql(self._table, "initial_quantity", query),
             )
-            weighted_by_key[key] = formatted_group
-
-        aggregate_indexes = {
-            aggregate_name: groupby_count + index
-            for index, aggregate_name in enumerate(aggregates)
-        }
-        updated_groups: list[tuple[object, ...]] = []
-        for group in groups:
-            group_values = list(group)
-            key = tuple(
-                self._normalize_group_value(value)
-                for value in group_values[:groupby_count]
+        if aggregate_spec == "standard_price:sum":
+            return SQL(
+                "SUM(COALESCE(%s, 0) * COALESCE(%s, 0))",
+                self._single_variant_standard_price_sql(),
+                self._field_to_sql(self._table, "initial_quantity", query),
             )
-            weighted_group = weighted_by_key.get(key)
-            if weighted_group:
-                for field_name in ("list_price", "standard_price"):
-                    for aggregate_key in (field_name, f"{field_name}:sum"):
-                        aggregate_index = aggregate_indexes.get(aggregate_key)
-                        if aggregate_index is None:
-                            continue
-                        if aggregate_key in weighted_group:
-                            group_values[aggregate_index] = weighted_group[aggregate_key]
-            updated_groups.append(tuple(group_values))
-        return updated_groups
-
-    @staticmethod
-    def _normalize_group_value(value: object) -> object:
-        if isinstance(value, models.BaseModel):
-            return value.id
-        if isinstance(value, (list, tuple)) and value:
-            return value[0]
-        return value
+        return super()._read_group_select(aggregate_spec, query)
+
+    def _single_variant_standard_price_sql(self) -> SQL:
+        # The template cost is only defined for single-variant templates; the variant cost is a
+        # company-dependent JSONB column, which the variant model knows how to read for env.company.
+        variant_alias = "weighted_price_variant"
+        variant_model = self.env["product.product"]
+        return SQL(
+            "(SELECT CASE WHEN COUNT(*) = 1 THEN MAX(%s) END FROM %s AS %s WHERE %s = %s AND %s)",
+            variant_model._field_to_sql(variant_alias, "standard_price"),
+            SQL.identifier(variant_model._table),
+            SQL.identifier(variant_alias),
+            SQL.identifier(variant_alias, "product_tmpl_id"),
+            SQL.identifier(self._table, "id"),
+            SQL.identifier(variant_alias, "active"),
+        )
 
     @api.model_create_multi
     def create(self, vals_list: list["odoo.values.product_template"]) -> Self:
@@ -176,3 +176,22 @@ class TestProductTemplate(UnitTestCase):
             test_sku = common.generate_unique_sku()
             self.env["product.template"].create({"default_code": test_sku, "type": "consu"})
         self.assertIn("null value", str(context.exception).lower())
+
+    def test_read_group_weights_price_sums_by_initial_quantity(self) -> None:
+        category = self.env["product.category"].create({"name": "Weighted Price Category"})
+        products = ProductFactory.create(self.env, name="Weighted A", type="consu", categ_id=category.id) | ProductFactory.create(
+            self.env, name="Weighted B", type="consu", categ_id=category.id
+        )
+        products[0].write({"list_price": 10.0, "standard_price": 4.0, "initial_quantity": 3})
+        products[1].write({"list_price": 25.0, "standard_price": 5.0, "initial_quantity": 2})
+
+        groups = self.env["product.template"].formatted_read_group(
+            [("id", "in", products.ids)],
+            ["categ_id"],
+            ["list_price:sum", "standard_price:sum", "__count"],
+        )
+
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0]["__count"], 2)
+        self.assertAlmostEqual(groups[0]["list_price:sum"], 80.0)
+        self.assertAlmostEqual(groups[0]["standard_price:sum"], 22.0)
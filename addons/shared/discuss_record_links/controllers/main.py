@@ -1,7 +1,20 @@
-from odoo import fields, http
+from odoo import http
 from odoo.http import request
+from odoo.tools.lru import LRU
 
-from ..models.config_util import ModelCfg, extract_template_fields, load_config, parse_prefix, render_template
+from ..models.config_util import (
+    ModelCfg,
+    extract_template_fields,
+    load_config,
+    parse_prefix,
+    render_template,
+    search_record_ids,
+)
+
+DEFAULT_TEMPLATE = "{{ display_name }}"
+LABEL_CACHE_SIZE = 8192
+
+_label_cache = LRU(LABEL_CACHE_SIZE)
 
 
 class DiscussRecordLinks(http.Controller):
@@ -13,25 +26,18 @@ class DiscussRecordLinks(http.Controller):
         model_filter, query = parse_prefix(term or "", cfg)
         tokens = [t for t in (query or "").strip().split() if t]
 
-        def build_domain(model_config: ModelCfg) -> fields.Domain:
-            if not tokens:
-                return fields.Domain([])
-            search_fields = model_config.search or ["name"]
-            search_domain: fields.Domain | None = None
-            for token in tokens:
-                or_domain = fields.Domain.OR([[(field, "ilike", token)] for field in search_fields])
-                search_domain = fields.Domain.AND([search_domain, or_domain]) if search_domain is not None else or_domain
-            return search_domain or fields.Domain([])
+        model_cfgs = [model_cfg for model_cfg in cfg.values() if not model_filter or model_cfg.model == model_filter]
+        ids_by_key = search_record_ids(env, model_cfgs, tokens)
 
         suggestions = []
-        for key, model_cfg in cfg.items():
-            if model_filter and model_cfg.model != model_filter:
+        for model_cfg in model_cfgs:
+            record_ids = ids_by_key.get(model_cfg.key)
+            if not record_ids:
                 continue
-            domain = build_domain(model_cfg)
             # fields needed for display template + display_name fallback
             display_fields = {"display_name"}
             display_fields.update(extract_template_fields(model_cfg.display_template))
-            rows = env[model_cfg.model].sudo().search_read(domain, list(display_fields), limit=model_cfg.limit)
+            rows = env[model_cfg.model].sudo().browse(record_ids).read(list(display_fields))
             for r in rows:
                 # render label per model config
                 label = render_template(model_cfg.display_template or "{{ display_name }}", r) or r.get("display_name")
@@ -52,6 +58,7 @@ class DiscussRecordLinks(http.Controller):
         """Return rendered labels for a list of {model, id} using configured templates.
 
         targets example: [{"model": "motor", "id": 42}, ...]
+        The client batches every link of a rendered thread into one call.
         """
         env = request.env
         cfg = load_config(env)
@@ -74,17 +81,65 @@ class DiscussRecordLinks(http.Controller):
 
         for model, idset in by_model.items():
             model_cfg = by_model_cfg.get(model)
-            if not model_cfg:
-                # Fallback to display_name only
-                rows = env[model].sudo().browse(list(idset)).read(["display_name"])
-                for r in rows:
-                    result.append({"model": model, "id": r["id"], "label": r.get("display_name")})
-                continue
-            display_fields = {"display_name"}
-            display_fields.update(extract_template_fields(model_cfg.display_template))
-            rows = env[model].sudo().browse(list(idset)).read(list(display_fields))
-            for r in rows:
-                label = render_template(model_cfg.display_template or "{{ display_name }}", r) or r.get("display_name")
-                result.append({"model": model, "id": r["id"], "label": label})
+            # Unconfigured models fall back to display_name only
+            template = model_cfg.display_template if model_cfg else DEFAULT_TEMPLATE
+            for record_id, label in _read_labels(env[model].sudo(), sorted(idset), template).items():
+                result.append({"model": model, "id": record_id, "label": label})
 
         return result
+
+
+def _read_labels(records_model: "odoo.model.base", record_ids: list[int], template: str) -> dict[int, str | None]:
+    # Rendered labels are cached per record version: a write bumps write_date, so stale entries
+    # are simply never looked up again and age out of the LRU. Labels also render values stored
+    # on linked records (a variant's name lives on its template), so their write_dates join the key.
+    if "write_date" not in records_model._fields:
+        return _render_labels(records_model, record_ids, template)
+    key_prefix = (records_model.env.cr.dbname, records_model._name, records_model.env.lang, template)
+    dependency_fields = _label_dependency_fields(records_model, template)
+    labels: dict[int, str | None] = {}
+    missing_keys: dict[int, tuple[object, ...]] = {}
+    # Links can point at deleted records; skip them like read() did instead of failing the batch.
+    for record in records_model.browse(record_ids).exists():
+        related_versions = tuple(record[field_name].write_date for field_name in dependency_fields)
+        cache_key = (*key_prefix, record.id, record.write_date, related_versions)
+        try:
+            labels[record.id] = _label_cache[cache_key]
+        except KeyError:
+            missing_keys[record.id] = cache_key
+    if missing_keys:
+        rendered_labels = _render_labels(records_model, list(missing_keys), template)
+        for record_id, label in rendered_labels.items():
+            _label_cache[missing_keys[record_id]] = label
+        labels.update(rendered_labels)
+    return labels
+
+
+def _label_dependency_fields(records_model: "odoo.model.base", template: str) -> list[str]:
+    # Many2one fields whose target records hold label values: _inherits parents, rendered
+    # many2ones (their display name), and the first hop of related fields.
+    field_names = {"display_name", records_model._rec_name, *extract_template_fields(template)}
+    dependency_fields = set(records_model._inherits.values())
+    for field_name in field_names:
+        field = records_model._fields.get(field_name or "")
+        if field is None:
+            continue
+        if field.type == "many2one":
+            dependency_fields.add(field_name)
+        elif field.related:
+            dependency_fields.add(field.related.split(".")[0])
+    return sorted(
+        field_name
+        for field_name in dependency_fields
+        if (field := records_model._fields.get(field_name)) is not None
+        and field.type == "many2one"
+        and "write_date" in records_model.env[field.comodel_name]._fields
+    )
+
+
+def _render_labels(records_model: "odoo.model.base", record_ids: list[int], template: str) -> dict[int, str | None]:
+    # fields needed for display template + display_name fallback
+    display_fields = {"display_name"}
+    display_fields.update(extract_template_fields(template))
+    rows = records_model.browse(record_ids).read(list(display_fields))
+    return {r["id"]: render_template(template, r) or r.get("display_name") for r in rows}
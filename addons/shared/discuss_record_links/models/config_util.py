@@ -3,6 +3,10 @@ from dataclasses import dataclass
 
 import json  # noqa: F401
 
+from odoo import fields
+from odoo.api import Environment
+from odoo.tools import SQL
+
 
 @dataclass
 class ModelCfg:
@@ -27,25 +31,33 @@ def load_config(env) -> dict[str, ModelCfg]:
     cfg: dict[str, ModelCfg] = {}
     # Read structured rows only
     try:
-        model = env["discuss.record.link.config"]
-        rows = model.sudo().search([("active", "=", True)])
-        for r in rows:
-            search_fields = [f.name for f in r.search_field_ids]
-            cfg[r.prefix.lower()] = ModelCfg(
-                key=r.prefix.lower(),
-                model=r.model_id.model,
-                label=r.label,
-                search=search_fields,
-                display_template=r.display_template or "{{ display_name }}",
-                image_field=(r.image_field_id.name if r.image_field_id else None),
-                limit=r.limit or 8,
-            )
+        for model_cfg in env["discuss.record.link.config"]._get_cached_config():
+            cfg[model_cfg.key] = model_cfg
     except (KeyError, AttributeError):
         # During module install/update the model might be unavailable briefly.
         pass
     return cfg
 
 
+def search_record_ids(env: Environment, model_cfgs: list[ModelCfg], tokens: list[str]) -> dict[str, list[int]]:
+    # One round trip for every configured model instead of one search per model per keystroke.
+    selects: list[SQL] = []
+    for model_cfg in model_cfgs:
+        search_fields = model_cfg.search or ["name"]
+        domain = fields.Domain.AND(
+            [fields.Domain.OR([[(field_name, "ilike", token)] for field_name in search_fields]) for token in tokens]
+        )
+        query = env[model_cfg.model].sudo()._search(domain, limit=model_cfg.limit)
+        selects.append(SQL("(SELECT %s AS config_key, matched.id FROM (%s) AS matched)", model_cfg.key, query.select()))
+    ids_by_key: dict[str, list[int]] = {model_cfg.key: [] for model_cfg in model_cfgs}
+    if not selects:
+        return ids_by_key
+    env.cr.execute(SQL(" UNION ALL ").join(selects))
+    for config_key, record_id in env.cr.fetchall():
+        ids_by_key[config_key].append(record_id)
+    return ids_by_key
+
+
 VAR_RE = re.compile(r"{{\s*(\w+)\s*}}")
 
 
@@ -1,5 +1,34 @@
-from odoo import api, fields, models
+import logging
+from contextlib import closing, suppress
+from functools import partial
+
+import psycopg2
+from odoo import api, fields, models, sql_db, tools
 from odoo.exceptions import ValidationError
+from odoo.modules.db import FunctionStatus
+from odoo.tools import SQL, sql
+
+from .config_util import ModelCfg
+
+_logger = logging.getLogger(__name__)
+
+TRIGRAM_FIELD_TYPES = ("char", "text")
+
+
+def _create_search_indexes_concurrently(dbname: str, index_definitions: list[tuple[str, SQL]]) -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so the build gets its own autocommit
+    # connection and never holds a write-blocking lock on large tables such as product_template.
+    with closing(sql_db.db_connect(dbname).cursor()) as cr:
+        cr._cnx.autocommit = True
+        for index_name, create_index in index_definitions:
+            _logger.info("Creating trigram index %s for record link search", index_name)
+            try:
+                cr.execute(create_index)
+            except psycopg2.Error as error:
+                _logger.warning("Could not create trigram index %s for record link search: %s", index_name, error)
+                # A failed concurrent build leaves an invalid index that IF NOT EXISTS would keep skipping.
+                with suppress(psycopg2.Error):
+                    cr.execute(SQL("DROP INDEX CONCURRENTLY IF EXISTS %s", SQL.identifier(index_name)))
 
 
 class DiscussRecordLinkConfig(models.Model):
@@ -47,3 +76,86 @@ class DiscussRecordLinkConfig(models.Model):
         for rec in self:
             if rec.image_field_id and rec.image_field_id.model_id != rec.model_id:
                 raise ValidationError("Image field must belong to the selected model.")
+
+    @api.model_create_multi
+    def create(self, vals_list: list["odoo.values.discuss_record_link_config"]) -> "odoo.model.discuss_record_link_config":
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        records._ensure_search_indexes()
+        return records
+
+    def write(self, vals: "odoo.values.discuss_record_link_config") -> bool:
+        result = super().write(vals)
+        self.env.registry.clear_cache()
+        if {"active", "model_id", "search_field_ids"} & set(vals):
+            self._ensure_search_indexes()
+        return result
+
+    def unlink(self) -> bool:
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
+    @api.model
+    @tools.ormcache()
+    def _get_cached_config(self) -> tuple[ModelCfg, ...]:
+        # Read on every composer keystroke; cached per registry and cleared on any config change.
+        return tuple(
+            ModelCfg(
+                key=record.prefix.lower(),
+                model=record.model_id.model,
+                label=record.label,
+                search=[search_field.name for search_field in record.search_field_ids],
+                display_template=record.display_template or "{{ display_name }}",
+                image_field=(record.image_field_id.name if record.image_field_id else None),
+                limit=record.limit or 8,
+            )
+            for record in self.sudo().search([("active", "=", True)])
+        )
+
+    def _ensure_search_indexes(self) -> None:
+        index_definitions = self._missing_search_index_definitions()
+        if index_definitions:
+            self.env.cr.postcommit.add(partial(_create_search_indexes_concurrently, self.env.cr.dbname, index_definitions))
+
+    def _missing_search_index_definitions(self) -> list[tuple[str, SQL]]:
+        # ilike '%token%' can only use a trigram GIN index. Translated columns are skipped: the ORM
+        # only emits its indexable JSONB expression for fields declared with index="trigram".
+        registry = self.env.registry
+        if not registry.has_trigram:
+            return []
+        # Match the expression the ORM searches with, as it does for index="trigram": with unaccent enabled
+        # it compares unaccent(column), which an index on the bare column cannot serve.
+        use_unaccent = registry.has_unaccent == FunctionStatus.INDEXABLE
+        index_definitions: list[tuple[str, SQL]] = []
+        planned_index_names: set[str] = set()
+        for record in self.filtered("active"):
+            if record.model_id.model not in self.env:
+                continue
+            target_model = self.env[record.model_id.model]
+            for search_field in record.search_field_ids:
+                field = target_model._fields.get(search_field.name)
+                if not field or field.type not in TRIGRAM_FIELD_TYPES or not field.store or field.translate:
+                    continue
+                if field.index == "trigram":
+                    continue
+                index_suffix = f"{field.name}_unaccent_trgm" if use_unaccent else f"{field.name}_trgm"
+                index_name = sql.make_index_name(target_model._table, index_suffix)
+                if index_name in planned_index_names or sql.index_exists(self.env.cr, index_name):
+                    continue
+                planned_index_names.add(index_name)
+                indexed_expression = SQL.identifier(field.name)
+                if use_unaccent:
+                    indexed_expression = registry.unaccent(indexed_expression)
+                index_definitions.append(
+                    (
+                        index_name,
+                        SQL(
+                            "CREATE INDEX CONCURRENTLY IF NOT EXISTS %s ON %s USING gin (%s gin_trgm_ops)",
+                            SQL.identifier(index_name),
+                            SQL.identifier(target_model._table),
+                            indexed_expression,
+                        ),
+                    )
+                )
+        return index_definitions
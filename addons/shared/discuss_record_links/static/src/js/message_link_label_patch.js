@@ -101,6 +101,39 @@ function linkifyInternalUrls(root) {
     }
 }
 
+// Every message of a thread renders in the same tick; their link targets are
+// collected here and resolved with a single /labels RPC in a microtask.
+let pendingLabelRequests = []
+
+function flushLabelRequests() {
+    const requests = pendingLabelRequests
+    pendingLabelRequests = []
+    const targetsByKey = new Map()
+    for (const { payload } of requests) {
+        for (const target of payload) {
+            targetsByKey.set(`${target.model}:${target.id}`, target)
+        }
+    }
+    requests[0]
+        .rpc("/discuss_record_links/labels", {
+            targets: Array.from(targetsByKey.values()),
+        })
+        .then((rows) => {
+            if (!rows || !rows.length) throw new Error("empty")
+            for (const { applyLabels } of requests) applyLabels(rows)
+        })
+        .catch(() => {
+            for (const { fallback } of requests) fallback()
+        })
+}
+
+function queueLabelRequest(request) {
+    if (!pendingLabelRequests.length) {
+        queueMicrotask(flushLabelRequests)
+    }
+    pendingLabelRequests.push(request)
+}
+
 /** @type {any} */
 const originalPrepareMessageBody = Message.prototype.prepareMessageBody
 
@@ -168,31 +201,27 @@ const prepareMessageBody = function (bodyEl) {
                 a.removeAttribute("data-drl-pending")
             }
         }
-        rpc("/discuss_record_links/labels", { targets: payload })
-            .then((rows) => {
-                if (!rows || !rows.length) throw new Error("empty")
-                applyLabels(rows)
-            })
-            .catch(() => {
-                // Fallback: display_name
-                if (!orm) {
-                    return
-                }
-                for (const [model, idSet] of byModel.entries()) {
-                    const ids = Array.from(idSet)
-                    orm.call(model, "read", [ids, ["display_name"]], {})
-                        .then((rr) =>
-                            applyLabels(
-                                rr.map((r) => ({
-                                    model,
-                                    id: r.id,
-                                    label: r.display_name,
-                                })),
-                            ),
-                        )
-                        .catch(() => {})
-                }
-            })
+        const fallback = () => {
+            // Fallback: display_name
+            if (!orm) {
+                return
+            }
+            for (const [model, idSet] of byModel.entries()) {
+                const ids = Array.from(idSet)
+                orm.call(model, "read", [ids, ["display_name"]], {})
+                    .then((rr) =>
+                        applyLabels(
+                            rr.map((r) => ({
+                                model,
+                                id: r.id,
+                                label: r.display_name,
+                            })),
+                        ),
+                    )
+                    .catch(() => {})
+            }
+        }
+        queueLabelRequest({ rpc, payload, applyLabels, fallback })
     } catch (e) {
         // swallow to avoid Owl lifecycle crashes
     }
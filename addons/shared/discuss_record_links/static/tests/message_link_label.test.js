@@ -196,4 +196,42 @@ describe("@discuss_record_links Message link label transformer", () => {
         expect(Boolean(a)).toBe(true)
         expect((a?.textContent || "").trim()).toBe("[SKU99] Widget")
     })
+
+    test("batches links from messages rendered together into one RPC", async () => {
+        const containers = [11, 12].map((id) => {
+            const container = document.createElement("div")
+            const a = document.createElement("a")
+            a.setAttribute("href", `/web#id=${id}&model=product.product&view_type=form`)
+            a.textContent = a.getAttribute("href")
+            container.appendChild(a)
+            return container
+        })
+        const calls = []
+
+        const fakeEnv = {
+            services: {
+                rpc: async (route, payload) => {
+                    calls.push(payload.targets)
+                    return payload.targets.map(({ model, id }) => ({ model, id, label: `Product ${id}` }))
+                },
+                orm: {
+                    call: async () => {
+                        throw new Error("no fallback")
+                    }
+                },
+            },
+        }
+
+        for (const container of containers) {
+            Message.prototype.prepareMessageBody.call({ env: fakeEnv }, container)
+        }
+        await sleep(0)
+
+        expect(calls.length).toBe(1)
+        expect(calls[0].length).toBe(2)
+        expect(containers.map((container) => container.querySelector("a").textContent)).toEqual([
+            "Product 11",
+            "Product 12",
+        ])
+    })
 })
@@ -1,8 +1,12 @@
 from unittest.mock import patch
 
+from odoo.modules.db import FunctionStatus
 from odoo.tests import TransactionCase
+from odoo.tools import SQL, sql
 
+from ...controllers import main as controllers_main
 from ...controllers.main import DiscussRecordLinks
+from ...models.config_util import load_config
 from ..common_imports import common
 
 
@@ -58,6 +62,72 @@ class TestLabelsRoute(TransactionCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["label"], partner.display_name)
 
+    def test_labels_skip_deleted_records(self) -> None:
+        product_model = self.env["product.product"].with_context(skip_sku_check=True)
+        deleted_product = product_model.create({"name": "Gone", "default_code": "GONE"})
+        deleted_id = deleted_product.id
+        deleted_product.unlink()
+        ctl = DiscussRecordLinks()
+
+        _req = type("_Req", (), {})()
+        _req.env = self.env
+        with patch("odoo.addons.discuss_record_links.controllers.main.request", _req):
+            rows = ctl.labels(
+                targets=[
+                    {"model": "product.product", "id": deleted_id},
+                    {"model": "product.product", "id": self.product.id},
+                ]
+            )
+
+        self.assertEqual([row["id"] for row in rows], [self.product.id])
+        self.assertEqual(rows[0]["label"], f"[{self.product.default_code}] {self.product.name}")
+
+    def test_labels_are_cached_until_the_record_is_written(self) -> None:
+        ctl = DiscussRecordLinks()
+        targets = [{"model": "product.product", "id": self.product.id}]
+
+        _req = type("_Req", (), {})()
+        _req.env = self.env
+        with (
+            patch("odoo.addons.discuss_record_links.controllers.main.request", _req),
+            patch(
+                "odoo.addons.discuss_record_links.controllers.main._render_labels",
+                wraps=controllers_main._render_labels,
+            ) as render_mock,
+        ):
+            ctl.labels(targets=targets)
+            ctl.labels(targets=targets)
+            self.assertEqual(render_mock.call_count, 1)
+
+            self.product.write({"name": "Widget Y"})
+            self.env.cr.execute(
+                "UPDATE product_product SET write_date = write_date + interval '1 second' WHERE id = %s", [self.product.id]
+            )
+            self.product.invalidate_recordset(["write_date"])
+            rows = ctl.labels(targets=targets)
+
+        self.assertEqual(render_mock.call_count, 2)
+        self.assertEqual(rows[0]["label"], f"[{self.product.default_code}] Widget Y")
+
+    def test_labels_refresh_when_the_product_template_is_renamed(self) -> None:
+        ctl = DiscussRecordLinks()
+        targets = [{"model": "product.product", "id": self.product.id}]
+
+        _req = type("_Req", (), {})()
+        _req.env = self.env
+        with patch("odoo.addons.discuss_record_links.controllers.main.request", _req):
+            ctl.labels(targets=targets)
+
+            self.product.product_tmpl_id.write({"name": "Widget Z"})
+            self.env.cr.execute(
+                "UPDATE product_template SET write_date = write_date + interval '1 second' WHERE id = %s",
+                [self.product.product_tmpl_id.id],
+            )
+            self.product.product_tmpl_id.invalidate_recordset(["write_date"])
+            rows = ctl.labels(targets=targets)
+
+        self.assertEqual(rows[0]["label"], f"[{self.product.default_code}] Widget Z")
+
 
 @common.tagged(*common.UNIT_TAGS)
 class TestSearchRoute(TransactionCase):
@@ -93,3 +163,89 @@ class TestSearchRoute(TransactionCase):
         labels = {s["label"] for s in res["suggestions"]}
         self.assertIn("[A1] Widget Alpha", labels)
         self.assertIn("[B2] Widget Beta", labels)
+
+    def test_search_without_prefix_unions_configured_models(self) -> None:
+        partner = self.env["res.partner"].create({"name": "Widget Partner"})
+        model_partner = self.env.ref("base.model_res_partner")
+        f_partner_name = self.env["ir.model.fields"].search([("model_id", "=", model_partner.id), ("name", "=", "name")], limit=1)
+        self.env["discuss.record.link.config"].create(
+            {
+                "prefix": "tpar",
+                "label": "Partners",
+                "model_id": model_partner.id,
+                "search_field_ids": [(6, 0, [f_partner_name.id])],
+                "limit": 8,
+            }
+        )
+        ctl = DiscussRecordLinks()
+        _req = type("_Req", (), {})()
+        _req.env = self.env
+        with patch("odoo.addons.discuss_record_links.controllers.main.request", _req):
+            res = ctl.search(term="widget")
+
+        matches = {(s["model"], s["id"]) for s in res["suggestions"]}
+        self.assertIn(("product.product", self.p1.id), matches)
+        self.assertIn(("res.partner", partner.id), matches)
+
+
+@common.tagged(*common.UNIT_TAGS)
+class TestRecordLinkConfigCache(TransactionCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.model_partner = self.env.ref("base.model_res_partner")
+        self.f_email = self.env["ir.model.fields"].search(
+            [("model_id", "=", self.model_partner.id), ("name", "=", "email")], limit=1
+        )
+        self.config = self.env["discuss.record.link.config"].create(
+            {
+                "prefix": "tcache",
+                "label": "Partners",
+                "model_id": self.model_partner.id,
+                "search_field_ids": [(6, 0, [self.f_email.id])],
+            }
+        )
+
+    def test_load_config_is_refreshed_after_write(self) -> None:
+        self.assertEqual(load_config(self.env)["tcache"].label, "Partners")
+
+        self.config.write({"label": "Contacts"})
+
+        self.assertEqual(load_config(self.env)["tcache"].label, "Contacts")
+
+        self.config.write({"active": False})
+
+        self.assertNotIn("tcache", load_config(self.env))
+
+    def test_saving_config_defers_concurrent_trigram_index_build(self) -> None:
+        if not self.env.registry.has_trigram:
+            self.skipTest("pg_trgm is not installed")
+        index_suffix = "email_unaccent_trgm" if self.env.registry.has_unaccent == FunctionStatus.INDEXABLE else "email_trgm"
+
+        with (
+            patch.object(self.env.cr.postcommit, "add") as postcommit_add,
+            patch.object(sql, "index_exists", return_value=False),
+        ):
+            self.config.write({"search_field_ids": [(6, 0, [self.f_email.id])]})
+
+        postcommit_add.assert_called_once()
+        index_definitions = postcommit_add.call_args.args[0].args[1]
+        self.assertEqual(
+            [index_name for index_name, _create_index in index_definitions], [sql.make_index_name("res_partner", index_suffix)]
+        )
+        self.assertIn("CREATE INDEX CONCURRENTLY", index_definitions[0][1].code)
+
+    def test_search_index_matches_unaccent_expression_when_indexable(self) -> None:
+        if not self.env.registry.has_trigram:
+            self.skipTest("pg_trgm is not installed")
+        registry = self.env.registry
+
+        with (
+            patch.object(registry, "has_unaccent", FunctionStatus.INDEXABLE),
+            patch.object(registry, "unaccent", lambda expression: SQL("unaccent(%s)", expression)),
+            patch.object(sql, "index_exists", return_value=False),
+        ):
+            index_definitions = self.config._missing_search_index_definitions()
+
+        index_name, create_index = index_definitions[0]
+        self.assertEqual(index_name, sql.make_index_name("res_partner", "email_unaccent_trgm"))
+        self.assertIn('unaccent("email") gin_trgm_ops', create_index.code)
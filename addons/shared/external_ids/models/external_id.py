@@ -4,6 +4,8 @@ from odoo import api, fields, models
 from odoo.exceptions import ValidationError
 from psycopg2 import IntegrityError
 
+INDEX_KEY_FIELDS = frozenset({"res_model", "res_id", "system_id", "resource", "reference"})
+
 
 class ExternalId(models.Model):
     _name = "external.id"
@@ -110,18 +112,43 @@ class ExternalId(models.Model):
                     if record_id:
                         vals["res_id"] = record_id
         try:
-            return super().create(vals_list)
+            records = super().create(vals_list)
         except IntegrityError as exc:
             self._raise_integrity_validation_error(exc)
+        records._invalidate_external_ids_index()
+        return records
 
     def write(self, vals: "odoo.values.external_id") -> bool:
         if "external_id" in vals and isinstance(vals["external_id"], str):
             vals = dict(vals)
             vals["external_id"] = vals["external_id"].strip()
+        moves_mapping = not INDEX_KEY_FIELDS.isdisjoint(vals)
+        if moves_mapping:
+            self._invalidate_external_ids_index()
         try:
-            return super().write(vals)
+            result = super().write(vals)
         except IntegrityError as exc:
             self._raise_integrity_validation_error(exc)
+        if moves_mapping:
+            self._invalidate_external_ids_index()
+        return result
+
+    def unlink(self) -> bool:
+        self._invalidate_external_ids_index()
+        return super().unlink()
+
+    def _invalidate_external_ids_index(self) -> None:
+        record_ids_by_model: dict[str, set[int]] = {}
+        for external_id_record in self:
+            if external_id_record.res_model and external_id_record.res_id:
+                record_ids_by_model.setdefault(external_id_record.res_model, set()).add(external_id_record.res_id)
+        for model_name, record_ids in record_ids_by_model.items():
+            try:
+                model = self.env[model_name]
+            except KeyError:
+                continue
+            if "external_ids_index" in model._fields:
+                model.browse(record_ids).invalidate_recordset(["external_ids_index"])
 
     @staticmethod
     def _raise_integrity_validation_error(exc: IntegrityError) -> None:
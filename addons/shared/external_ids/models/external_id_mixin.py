@@ -1,5 +1,6 @@
 import logging
 from collections import Counter
+from collections.abc import Iterable
 from typing import Any, ClassVar, Self, overload
 
 from lxml import etree
@@ -32,6 +33,7 @@ class ExternalIdMixin(models.AbstractModel):
         domain=lambda self: [("res_model", "=", self._name)],
     )
     external_ids_count = fields.Integer(string="External ID Count", compute="_compute_external_ids_count")
+    external_ids_index = fields.Json(compute="_compute_external_ids_index")
 
     @property
     def external(self) -> ExternalRecordReference | ExternalModelReference:
@@ -179,6 +181,28 @@ class ExternalIdMixin(models.AbstractModel):
         for record in self:
             record.external_ids_count = count_by_res_id.get(record.id, 0)
 
+    def _compute_external_ids_index(self) -> None:
+        # Maps system code -> resource -> external.id id for the whole prefetch batch in one query, so
+        # fluent lookups such as record.external.shopify.product.id stay O(1) per page. The value lives
+        # in the ORM cache (dropped on rollback) and external.id invalidates it when mappings move.
+        index_by_res_id: dict[int, dict[str, dict[str, int]]] = {}
+        record_ids = [record_id for record_id in self.ids if isinstance(record_id, int)]
+        if record_ids:
+            external_id_model = self.env["external.id"].with_context(active_test=False)
+            external_id_records = external_id_model.search_fetch(
+                [
+                    ("res_model", "=", self._name),
+                    ("res_id", "in", record_ids),
+                ],
+                ["res_id", "system_id", "resource", "external_id", "active"],
+            )
+            for external_id_record in external_id_records:
+                system_index = index_by_res_id.setdefault(external_id_record.res_id, {})
+                resource_index = system_index.setdefault(external_id_record.system_id.code, {})
+                resource_index[external_id_record.resource] = external_id_record.id
+        for record in self:
+            record.external_ids_index = index_by_res_id.get(record.id, {})
+
     def _get_external_system(self, system_code: ExternalKeyLike) -> "odoo.model.external_system":
         normalized_system_code = self._normalize_external_key(system_code)
         if not normalized_system_code:
@@ -448,21 +472,19 @@ class ExternalIdMixin(models.AbstractModel):
     ) -> "odoo.model.external_id":
         self.ensure_one()
         system_code, resource = self._resolve_external_binding(system_code, resource)
-        external_id_model = self.env["external.id"]
-        system = self._get_external_system(system_code)
-        if not system:
-            return external_id_model.browse()
+        external_id_model = self.env["external.id"].with_context(active_test=False)
+        normalized_system_code = self._normalize_external_key(system_code)
         resource_key = self._normalize_external_key(resource, default="default")
-        external_id_model = external_id_model.with_context(active_test=False)
-        domain = [
-            ("res_model", "=", self._name),
-            ("res_id", "=", self.id),
-            ("system_id", "=", system.id),
-            ("resource", "=", resource_key),
-        ]
-        if active_only:
-            domain = [*domain, ("active", "=", True)]
-        return external_id_model.search(domain, limit=1)
+        external_ids_index = self.external_ids_index or {}
+        external_id_record_id = external_ids_index.get(normalized_system_code, {}).get(resource_key)
+        if not external_id_record_id:
+            return external_id_model.browse()
+        external_id_record = external_id_model.browse(external_id_record_id)
+        if self.env.context.get("active_test", True) and not external_id_record.system_id.active:
+            return external_id_model.browse()
+        if active_only and not external_id_record.active:
+            return external_id_model.browse()
+        return external_id_record
 
     def get_external_system_id(
         self,
@@ -513,7 +535,7 @@ class ExternalIdMixin(models.AbstractModel):
             ("system_id", "=", system.id),
             ("resource", "=", resource_key),
         ]
-        existing = external_id_model_all.search(record_domain, limit=1)
+        existing = self.get_external_id_record(system_code, resource_key, active_only=False)
 
         if not sanitized:
             if existing:
@@ -739,6 +761,94 @@ class ExternalIdMixin(models.AbstractModel):
         record.set_external_id(system_code, sanitized_external_id, resource)
         return record
 
+    @api.model
+    def get_or_create_by_external_id_many(
+        self,
+        system_code: ExternalIdBinding | ExternalKeyLike,
+        values_by_external_id: Iterable[tuple[str, dict[str, Any]]],
+        resource: ExternalOptionalKeyLike = None,
+    ) -> dict[str, Self]:
+        # Batch counterpart of get_or_create_by_external_id: one mapping query, one create() for
+        # the missing records and one external.id create() for their mappings. Later duplicates win.
+        pending_values: dict[str, dict[str, Any]] = {}
+        for external_id_value, values in values_by_external_id:
+            sanitized_external_id = (external_id_value or "").strip()
+            if sanitized_external_id:
+                pending_values[sanitized_external_id] = values
+        if not pending_values:
+            return {}
+
+        system_code, resource = self._resolve_external_binding(system_code, resource)
+        normalized_system_code = self._normalize_external_key(system_code)
+        system = self._get_external_system(system_code)
+        if not system:
+            raise ValueError(f"External system with code '{normalized_system_code}' not found")
+        resource_key = self._normalize_external_key(resource, default="default")
+
+        external_id_model = self.env["external.id"].with_context(active_test=False)
+        external_id_records = external_id_model.search_fetch(
+            [
+                ("system_id", "=", system.id),
+                ("resource", "=", resource_key),
+                ("external_id", "in", list(pending_values)),
+            ],
+            ["res_model", "res_id", "external_id", "active"],
+        )
+        external_id_record_by_value = {
+            external_id_record.external_id: external_id_record for external_id_record in external_id_records
+        }
+        mapped_record_ids = [
+            external_id_record.res_id for external_id_record in external_id_records if external_id_record.res_model == self._name
+        ]
+        existing_record_ids = set(self.browse(mapped_record_ids).exists().ids)
+
+        records_by_external_id: dict[str, Self] = {}
+        orphaned_mappings: dict[str, "odoo.model.external_id"] = {}
+        for external_id_value, values in pending_values.items():
+            external_id_record = external_id_record_by_value.get(external_id_value)
+            if not external_id_record:
+                continue
+            if external_id_record.res_model and external_id_record.res_model != self._name:
+                raise ValueError(f"External ID '{external_id_value}' already belongs to {external_id_record.res_model}")
+            if external_id_record.res_id not in existing_record_ids:
+                orphaned_mappings[external_id_value] = external_id_record
+                continue
+            if not external_id_record.active:
+                raise ValueError(
+                    f"External ID '{external_id_value}' is archived for {self._name}; reactivate or remove the mapping first"
+                )
+            existing_record = self.browse(external_id_record.res_id)
+            self._write_if_changed(existing_record, values)
+            records_by_external_id[external_id_value] = existing_record
+
+        missing_external_ids = [
+            external_id_value for external_id_value in pending_values if external_id_value not in records_by_external_id
+        ]
+        if not missing_external_ids:
+            return records_by_external_id
+
+        created_records = self.create([pending_values[external_id_value] for external_id_value in missing_external_ids])
+        mapping_values: list["odoo.values.external_id"] = []
+        for external_id_value, record in zip(missing_external_ids, created_records, strict=True):
+            records_by_external_id[external_id_value] = record
+            orphaned_mapping = orphaned_mappings.get(external_id_value)
+            if orphaned_mapping:
+                orphaned_mapping.write({"res_model": self._name, "res_id": record.id, "active": True})
+                continue
+            mapping_values.append(
+                {
+                    "res_model": self._name,
+                    "res_id": record.id,
+                    "system_id": system.id,
+                    "resource": resource_key,
+                    "external_id": external_id_value,
+                    "active": True,
+                }
+            )
+        if mapping_values:
+            external_id_model.create(mapping_values)
+        return records_by_external_id
+
     def get_external_url(
         self,
         system_code: ExternalIdBinding | ExternalKeyLike,
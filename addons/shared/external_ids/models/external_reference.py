@@ -260,6 +260,11 @@ class ExternalModelResourceReference:
     def get_or_create(self, external_id_value: str, values: dict[str, object]) -> "odoo.model.external_id_mixin":
         return self._model.get_or_create_by_external_id(self._system_code, external_id_value, values, self._resource_name)
 
+    def get_or_create_many(
+        self, values_by_external_id: list[tuple[str, dict[str, object]]]
+    ) -> dict[str, "odoo.model.external_id_mixin"]:
+        return self._model.get_or_create_by_external_id_many(self._system_code, values_by_external_id, self._resource_name)
+
     def map(self, external_id_values: list[str]) -> dict[str, "odoo.model.external_id_mixin"]:
         return self._model.map_by_external_id(self._system_code, external_id_values, self._resource_name)
 
@@ -60,6 +60,13 @@ class ExternalSystem(models.Model):
                 seen_names.add(name_value)
         return super().create(vals_list)
 
+    def write(self, vals: "odoo.values.external_system") -> bool:
+        result = super().write(vals)
+        if "code" in vals:
+            # external.id.mixin indexes mappings by system code.
+            self.env.invalidate_all()
+        return result
+
     @api.constrains("code")
     def _check_unique_code(self) -> None:
         for system in self:
@@ -175,6 +175,59 @@ class TestExternalIdMixin(UnitTestCase):
                 {"missing_field": "value"},
             )
 
+    def test_get_or_create_by_external_id_many_creates_missing_in_one_batch(self) -> None:
+        existing_record = self._create_fixture("Existing Batch Record")
+        existing_record.external.discord.default.id = "131313131313131313"
+        fixture_class = type(existing_record)
+
+        with common.patch.object(fixture_class, "create", autospec=True, side_effect=fixture_class.create) as mock_create:
+            records = self.FixtureRecord.external.discord.default.get_or_create_many(
+                [
+                    ("131313131313131313", {"name": "Renamed Batch Record"}),
+                    ("141414141414141414", {"name": "First New Batch Record"}),
+                    (" 151515151515151515 ", {"name": "Second New Batch Record"}),
+                    ("", {"name": "Ignored Batch Record"}),
+                ]
+            )
+
+        mock_create.assert_called_once()
+        self.assertEqual(set(records), {"131313131313131313", "141414141414141414", "151515151515151515"})
+        self.assertEqual(records["131313131313131313"], existing_record)
+        self.assertEqual(existing_record.name, "Renamed Batch Record")
+        self.assertEqual(records["141414141414141414"].name, "First New Batch Record")
+        self.assertEqual(records["151515151515151515"].external.discord.default.id, "151515151515151515")
+
+    def test_get_or_create_by_external_id_many_repoints_orphaned_mapping(self) -> None:
+        external_id_record = self.ExternalId.create(
+            {
+                "res_model": "external.id.fixture",
+                "res_id": self._create_fixture("Orphan Anchor").id + 999999,
+                "system_id": self.discord_system.id,
+                "external_id": "orphan-batch-id",
+                "active": False,
+            }
+        )
+
+        records = self.FixtureRecord.get_or_create_by_external_id_many("discord", [("orphan-batch-id", {"name": "Recovered"})])
+
+        external_id_record.invalidate_recordset()
+        self.assertTrue(external_id_record.active)
+        self.assertEqual(external_id_record.res_id, records["orphan-batch-id"].id)
+
+    def test_get_or_create_by_external_id_many_rejects_foreign_mapping(self) -> None:
+        partner = self.Partner.create({"name": "Foreign Owner"})
+        self.ExternalId.create(
+            {
+                "res_model": "res.partner",
+                "res_id": partner.id,
+                "system_id": self.discord_system.id,
+                "external_id": "161616161616161616",
+            }
+        )
+
+        with self.assertRaisesRegex(ValueError, "already belongs to res.partner"):
+            self.FixtureRecord.get_or_create_by_external_id_many("discord", [("161616161616161616", {"name": "Clash"})])
+
     def test_write_if_changed_supports_many2many_updates(self) -> None:
         partner = self.env["res.partner"].create({"name": "Tagged Partner"})
         category = self.env["res.partner.category"].create({"name": "VIP"})
@@ -352,3 +405,40 @@ class TestExternalIdMixin(UnitTestCase):
         self.assertIn(("res_id", "=", record.id), action["domain"])
         self.assertEqual(action["context"]["default_res_model"], "external.id.fixture")
         self.assertEqual(action["context"]["default_res_id"], record.id)
+
+    def test_fluent_reads_index_whole_recordset_once(self) -> None:
+        records = self.FixtureRecord.browse([self._create_fixture(f"Indexed Record {index}").id for index in range(3)])
+        for index, record in enumerate(records):
+            record.external.shopify.product.id = f"10{index}"
+        records.invalidate_recordset(["external_ids_index"])
+        fixture_class = type(records)
+
+        with common.patch.object(
+            fixture_class,
+            "_compute_external_ids_index",
+            autospec=True,
+            side_effect=fixture_class._compute_external_ids_index,
+        ) as compute_mock:
+            product_ids = [record.external.shopify.product.id for record in records]
+            variant_ids = [record.external.shopify.variant.id for record in records]
+
+        self.assertEqual(product_ids, ["100", "101", "102"])
+        self.assertEqual(variant_ids, [None, None, None])
+        compute_mock.assert_called_once()
+
+    def test_fluent_index_follows_moved_and_removed_mappings(self) -> None:
+        first_record = self._create_fixture("Index Source")
+        second_record = self._create_fixture("Index Target")
+        first_record.external.discord.default.id = "515151515151515151"
+        self.assertIsNone(second_record.external.discord.default.id)
+
+        first_record.external.discord.default.record.write({"res_id": second_record.id})
+
+        self.assertIsNone(first_record.external.discord.default.id)
+        self.assertEqual(second_record.external.discord.default.id, "515151515151515151")
+
+        external_id_record = second_record.external.discord.default.record
+        external_id_record.active = False
+        external_id_record.unlink()
+
+        self.assertFalse(second_record.external.discord.default.record_any)
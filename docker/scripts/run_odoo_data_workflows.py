@@ -318,6 +318,10 @@ class LocalServerSettings(BaseSettings):
     no_sanitize: bool = Field(False, alias="NO_SANITIZE")
     admin_login: str = Field("admin", alias="ODOO_ADMIN_LOGIN")
     admin_password: SecretStr | None = Field(None, alias="ODOO_ADMIN_PASSWORD")
+    fast_restore: bool = Field(False, alias="ODOO_FAST_RESTORE")
+    restore_jobs: int = Field(4, ge=1, alias="ODOO_RESTORE_JOBS")
+    restore_defer_post_data: bool = Field(False, alias="ODOO_RESTORE_DEFER_POST_DATA")
+    restore_maintenance_work_mem: str | None = Field(None, alias="ODOO_RESTORE_MAINTENANCE_WORK_MEM")
 
     @field_validator(
         "filestore_owner",
@@ -328,6 +332,7 @@ class LocalServerSettings(BaseSettings):
         "update_modules",
         "local_addons_dirs",
         "openupgrade_target_version",
+        "restore_maintenance_work_mem",
         mode="before",
     )
     @classmethod
@@ -651,6 +656,9 @@ class OdooDataWorkflowRunner:
         self.run_command(chown_command)
 
     def overwrite_database(self) -> None:
+        if self.local.fast_restore:
+            self._overwrite_database_parallel()
+            return
         upstream = self._require_upstream()
         backup_path = "/tmp/upstream_db_backup.sql.gz"
         local_host = shlex.quote(self.local.host)
@@ -674,6 +682,20 @@ class OdooDataWorkflowRunner:
         )
         self.run_command(dump_cmd)
         _logger.info("Upstream database dump and transfer completed.")
+        self._recreate_local_database()
+        _logger.info("Restoring database into %s", self.local.db_name)
+        restore_cmd = (
+            f"gunzip < {backup_path_quoted} | pg_restore -d {local_db} -h {local_host} "
+            f"-U {local_user} --no-owner --role={local_user}"
+        )
+        self.run_command(restore_cmd)
+        _logger.info("Database restore completed.")
+        self.run_command(f"rm {backup_path_quoted}")
+
+    def _recreate_local_database(self) -> None:
+        local_host = shlex.quote(self.local.host)
+        local_user = shlex.quote(self.local.db_user)
+        local_db = shlex.quote(self.local.db_name)
         self._set_database_allow_connections(False)
         try:
             self.terminate_all_db_connections()
@@ -682,14 +704,69 @@ class OdooDataWorkflowRunner:
             self._set_database_allow_connections(True)
             raise
         self.run_command(f"createdb -h {local_host} -U {local_user} {local_db}")
-        _logger.info("Restoring database into %s", self.local.db_name)
-        restore_cmd = (
-            f"gunzip < {backup_path_quoted} | pg_restore -d {local_db} -h {local_host} "
-            f"-U {local_user} --no-owner --role={local_user}"
+
+    def _overwrite_database_parallel(self) -> None:
+        # Directory-format dumps are the only format pg_dump and pg_restore can both parallelize.
+        # The dump directory is streamed over ssh as a tar (its table files are already
+        # compressed) and unpacked straight into the local dump directory.
+        upstream = self._require_upstream()
+        dump_directory = Path("/tmp/upstream_db_dump")
+        dump_directory_quoted = shlex.quote(str(dump_directory))
+        started_at = time.monotonic()
+        _logger.info(
+            "Starting parallel upstream database dump (%s jobs) from %s to %s",
+            self.local.restore_jobs,
+            upstream.host,
+            self.local.db_name,
         )
-        self.run_command(restore_cmd)
-        _logger.info("Database restore completed.")
-        self.run_command(f"rm {backup_path_quoted}")
+        self.run_command(f"rm -rf {dump_directory_quoted} && mkdir -p {dump_directory_quoted}")
+        transfer_cmd = (
+            f"{shlex.join(self._build_ssh_command())} {shlex.quote(f'{upstream.user}@{upstream.host}')} "
+            f"{shlex.quote(self._build_remote_directory_dump_script())} | tar -C {dump_directory_quoted} -xf -"
+        )
+        self.run_command(f"bash -o pipefail -c {shlex.quote(transfer_cmd)}")
+        _logger.info("Upstream database dump and transfer completed in %.1fs.", time.monotonic() - started_at)
+        self._recreate_local_database()
+        try:
+            for restore_cmd in self._build_parallel_restore_commands(dump_directory):
+                restore_started_at = time.monotonic()
+                _logger.info("Restoring database into %s", self.local.db_name)
+                self.run_command(restore_cmd)
+                _logger.info("Restore step completed in %.1fs.", time.monotonic() - restore_started_at)
+        finally:
+            self.run_command(f"rm -rf {dump_directory_quoted}")
+        _logger.info("Parallel database restore completed in %.1fs.", time.monotonic() - started_at)
+
+    def _build_remote_directory_dump_script(self) -> str:
+        upstream = self._require_upstream()
+        upstream_db_user = shlex.quote(upstream.db_user)
+        remote_dump_directory = f"/tmp/odoo_upstream_dump_{os.getpid()}"
+        return (
+            f"set -e; dump_dir={shlex.quote(remote_dump_directory)}; "
+            f"trap 'sudo -u {upstream_db_user} rm -rf \"$dump_dir\"' EXIT; "
+            f'cd /tmp && sudo -u {upstream_db_user} pg_dump -Fd -j {self.local.restore_jobs} -f "$dump_dir" '
+            f"{shlex.quote(upstream.db_name)}; "
+            f'sudo -u {upstream_db_user} tar -C "$dump_dir" -cf - .'
+        )
+
+    def _build_parallel_restore_commands(self, dump_directory: Path) -> list[str]:
+        local_user = shlex.quote(self.local.db_user)
+        base_command = (
+            f"pg_restore -j {self.local.restore_jobs} -d {shlex.quote(self.local.db_name)} "
+            f"-h {shlex.quote(self.local.host)} -U {local_user} --no-owner --role={local_user}"
+        )
+        dump_directory_quoted = shlex.quote(str(dump_directory))
+        index_build_prefix = ""
+        if self.local.restore_maintenance_work_mem:
+            index_build_prefix = f"PGOPTIONS={shlex.quote(f'-c maintenance_work_mem={self.local.restore_maintenance_work_mem}')} "
+        if not self.local.restore_defer_post_data:
+            return [f"{index_build_prefix}{base_command} {dump_directory_quoted}"]
+        # Deferred mode loads every table before building indexes and constraints, each step
+        # parallel on its own, so index builds run against fully loaded tables with more memory.
+        return [
+            f"{base_command} --section=pre-data --section=data {dump_directory_quoted}",
+            f"{index_build_prefix}{base_command} --section=post-data {dump_directory_quoted}",
+        ]
 
     def connect_to_db(self) -> connection:
         if not self.local.db_conn:
@@ -2070,6 +2147,7 @@ with registry.cursor() as cr:
         self._assert_filestore_capacity()
         target_owner = self._resolve_filestore_owner()
         _logger.info("Resolved filestore owner: %s", target_owner or "<default>")
+        # The rsync starts before the dump so the filestore copy always overlaps the database transfer and restore.
         filestore_process = self.overwrite_filestore(target_owner)
         try:
             self.overwrite_database()
@@ -1,8 +1,11 @@
+import ast
+import hashlib
 import json
 import logging
 import re
 import shlex
 import subprocess
+import threading
 import time
 from pathlib import Path
 
@@ -11,6 +14,11 @@ from .settings import TestSettings
 
 _logger = logging.getLogger(__name__)
 DEFAULT_DATABASE_TARGET_MARKER = "database: default@default:default"
+MODULE_TEMPLATE_METADATA_PATH = Path("tmp/test-logs/module_templates.json")
+# Image identity is part of the fingerprint because core/enterprise modules are installed from the image, not the repo.
+MODULE_TEMPLATE_IMAGE_KEYS = ("DOCKER_IMAGE", "DOCKER_IMAGE_TAG", "ODOO_BASE_RUNTIME_IMAGE")
+_FINGERPRINT_SKIPPED_DIRECTORIES = {"tests", "__pycache__", "node_modules"}
+_module_template_metadata_lock = threading.Lock()
 
 
 def contains_default_database_target(log_output: str) -> bool:
@@ -408,3 +416,122 @@ def record_template(template_db: str) -> None:
         metadata_path.write_text(json.dumps({"name": template_db, "created": time.time()}))
     except OSError as exc:
         _logger.debug("db: failed to record template metadata (%s)", exc)
+
+
+def _read_manifest_dependencies(manifest_path: Path) -> list[str]:
+    try:
+        manifest = ast.literal_eval(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError) as exc:
+        _logger.debug("db: failed to read manifest %s (%s)", manifest_path, exc)
+        return []
+    if not isinstance(manifest, dict):
+        return []
+    return [str(dependency) for dependency in manifest.get("depends") or []]
+
+
+def _local_module_paths(addons_root: Path) -> dict[str, Path]:
+    # Addons live both at the root and grouped as `addons/<group>/<module>`, so index them by manifest.
+    module_paths: dict[str, Path] = {}
+    for manifest_path in sorted(addons_root.rglob("__manifest__.py")):
+        module_path = manifest_path.parent
+        if _FINGERPRINT_SKIPPED_DIRECTORIES.intersection(module_path.relative_to(addons_root).parts):
+            continue
+        module_paths.setdefault(module_path.name, module_path)
+    return module_paths
+
+
+def _local_module_closure(modules: list[str], module_paths: dict[str, Path]) -> list[str]:
+    # `-i` installs every local dependency too, so their sources belong in the template fingerprint.
+    pending = list(modules)
+    resolved: set[str] = set()
+    while pending:
+        module_name = pending.pop()
+        if module_name in resolved or module_name not in module_paths:
+            continue
+        resolved.add(module_name)
+        pending.extend(_read_manifest_dependencies(module_paths[module_name] / "__manifest__.py"))
+    return sorted(resolved)
+
+
+def module_template_fingerprint(
+    modules: list[str],
+    *,
+    addons_root: Path | None = None,
+    environment_values: dict[str, str] | None = None,
+) -> str:
+    """Hash the installed module set, the local addon sources it pulls in, and the Odoo image.
+
+    Test directories are skipped because `-i` never imports them, so editing tests keeps the template valid.
+    """
+    root = addons_root or Path("addons")
+    resolved_environment = environment_values if environment_values is not None else compose_env()
+    digest = hashlib.sha256()
+    for key in MODULE_TEMPLATE_IMAGE_KEYS:
+        digest.update(f"{key}={resolved_environment.get(key) or ''}\n".encode())
+    digest.update(f"modules={','.join(sorted(set(modules)))}\n".encode())
+    module_paths = _local_module_paths(root)
+    for module_name in _local_module_closure(modules, module_paths):
+        module_path = module_paths[module_name]
+        for file_path in sorted(module_path.rglob("*")):
+            relative_path = file_path.relative_to(root)
+            if _FINGERPRINT_SKIPPED_DIRECTORIES.intersection(relative_path.parts) or not file_path.is_file():
+                continue
+            if file_path.suffix == ".pyc":
+                continue
+            digest.update(f"{relative_path.as_posix()}\n".encode())
+            digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def module_template_name(base_db: str, fingerprint: str) -> str:
+    # Deliberately outside the `<db>_test_%` / `<db>_ut_%` patterns so post-run cleanup keeps cached templates.
+    return f"{base_db}_modtpl_{fingerprint[:16]}"
+
+
+def _load_module_template_entries() -> dict[str, dict[str, object]]:
+    try:
+        data = json.loads(MODULE_TEMPLATE_METADATA_PATH.read_text())
+    except (OSError, json.JSONDecodeError) as exc:
+        _logger.debug("db: failed to read module template metadata (%s)", exc)
+        return {}
+    entries = data.get("templates") if isinstance(data, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_module_template_entries(entries: dict[str, dict[str, object]]) -> None:
+    try:
+        MODULE_TEMPLATE_METADATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        MODULE_TEMPLATE_METADATA_PATH.write_text(json.dumps({"templates": entries}, indent=2, sort_keys=True))
+    except OSError as exc:
+        _logger.debug("db: failed to record module template metadata (%s)", exc)
+
+
+def cached_module_template(fingerprint: str) -> str | None:
+    with _module_template_metadata_lock:
+        entries = _load_module_template_entries()
+        entry = entries.get(fingerprint)
+        if not entry:
+            return None
+        name = str(entry.get("name") or "")
+        if not name or not _db_exists(name, get_db_user()):
+            entries.pop(fingerprint, None)
+            _save_module_template_entries(entries)
+            return None
+        entry["last_used"] = time.time()
+        _save_module_template_entries(entries)
+        return name
+
+
+def record_module_template(fingerprint: str, template_db: str, modules: list[str], *, max_entries: int) -> None:
+    with _module_template_metadata_lock:
+        entries = _load_module_template_entries()
+        now = time.time()
+        entries[fingerprint] = {"name": template_db, "modules": sorted(modules), "created": now, "last_used": now}
+        by_recency = sorted(entries, key=lambda key: float(entries[key].get("last_used") or 0), reverse=True)
+        for evicted_fingerprint in by_recency[max(1, max_entries) :]:
+            evicted_name = str(entries.pop(evicted_fingerprint).get("name") or "")
+            if evicted_name and evicted_name != template_db:
+                _logger.info("db: evicting module template %s", evicted_name)
+                _terminate_backends(evicted_name, get_db_user())
+                force_drop_database(evicted_name)
+        _save_module_template_entries(entries)
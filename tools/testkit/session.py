@@ -122,6 +122,7 @@ class TestSession:
             "unit": threading.Lock(),
             "js": threading.Lock(),
         }
+        self._module_template_locks: dict[str, threading.Lock] = {}
         self._preflight_state = {"services": False, "template": False}
         self._preflight_started: float | None = None
         self._preflight_steps: list[dict[str, object]] = []
@@ -843,24 +844,52 @@ class TestSession:
                 return None
             session_dir = self._require_session_dir()
             base = get_production_db_name()
-            module_key = ",".join(sorted(modules))
-            hash_prefix = hashlib.sha1(module_key.encode()).hexdigest()[:8]
-            suffix = (self.session_name or "template").replace("test-", "")
-            template_name = f"{base}_test_template_{phase}_{hash_prefix}_{suffix}"
-            log_dir = session_dir / phase
-            log_path = log_dir / f"template-{hash_prefix}.log"
-            try:
-                from .db import build_module_template
-
-                print(f"🧱 Building {phase} template with {len(modules)} module(s)")
-                build_module_template(template_name, modules, timeout_sec=timeout, log_path=log_path)
-            except Exception as error:
-                _logger.warning("phase template build failed for %s (%s)", phase, error)
-                self._phase_template_failed.add(phase)
-                return None
+            from .db import cached_module_template, module_template_fingerprint, module_template_name, record_module_template
+
+            cache_size = int(self.settings.module_template_cache_size) if self.settings.reuse_template else 0
+            if cache_size <= 0:
+                module_key = ",".join(sorted(modules))
+                hash_prefix = hashlib.sha1(module_key.encode()).hexdigest()[:8]
+                suffix = (self.session_name or "template").replace("test-", "")
+                template_name = f"{base}_test_template_{phase}_{hash_prefix}_{suffix}"
+                if not self._build_phase_template(phase, template_name, modules, timeout, session_dir / phase, hash_prefix):
+                    return None
+                self._phase_templates[phase] = template_name
+                return template_name
+            # Content-addressed templates outlive the session; unit and js share one when their module sets match.
+            fingerprint = module_template_fingerprint(modules)
+            with self._module_template_locks.setdefault(fingerprint, threading.Lock()):
+                template_name = cached_module_template(fingerprint)
+                if template_name:
+                    print(f"♻️  Reusing {phase} template {template_name}")
+                else:
+                    template_name = module_template_name(base, fingerprint)
+                    if not self._build_phase_template(phase, template_name, modules, timeout, session_dir / phase, fingerprint[:8]):
+                        return None
+                    record_module_template(fingerprint, template_name, modules, max_entries=cache_size)
             self._phase_templates[phase] = template_name
             return template_name
 
+    def _build_phase_template(
+        self,
+        phase: str,
+        template_name: str,
+        modules: list[str],
+        timeout: int,
+        log_dir: Path,
+        log_key: str,
+    ) -> bool:
+        from .db import build_module_template
+
+        try:
+            print(f"🧱 Building {phase} template with {len(modules)} module(s)")
+            build_module_template(template_name, modules, timeout_sec=timeout, log_path=log_dir / f"template-{log_key}.log")
+        except Exception as error:
+            _logger.warning("phase template build failed for %s (%s)", phase, error)
+            self._phase_template_failed.add(phase)
+            return False
+        return True
+
     # ————— Discovery helpers —————
     def _discover_unit_modules(self) -> list[str]:
         modules = self._manifest_modules(patterns=["**/tests/unit/**/*.py"]) or self._all_modules()
@@ -103,6 +103,7 @@ class TestSettings(BaseSettings):
     # Template reuse (between sessions)
     reuse_template: bool = Field(_template_bool("reuse", False), alias="REUSE_TEMPLATE")
     template_ttl_sec: int = Field(_template_int("ttl_sec", 0), alias="TEMPLATE_TTL_SEC")
+    module_template_cache_size: int = Field(_template_int("cache_size", 4), alias="TEMPLATE_CACHE_SIZE")
 
     # Coverage toggles (pass-through / future use)
     coverage_py: bool = Field(False, alias="COVERAGE_PY")
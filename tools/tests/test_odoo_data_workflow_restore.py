@@ -0,0 +1,85 @@
+import unittest
+from types import SimpleNamespace
+
+from tools.tests.test_odoo_data_workflow_admin_policy import odoo_data_workflow
+
+
+def _build_runner(**local_overrides: object) -> tuple[object, list[str]]:
+    commands: list[str] = []
+    workflow_runner = odoo_data_workflow.OdooDataWorkflowRunner.__new__(odoo_data_workflow.OdooDataWorkflowRunner)
+    local_values = {
+        "host": "database",
+        "db_user": "odoo",
+        "db_name": "cm",
+        "fast_restore": True,
+        "restore_jobs": 6,
+        "restore_defer_post_data": False,
+        "restore_maintenance_work_mem": None,
+    }
+    local_values.update(local_overrides)
+    workflow_runner.local = SimpleNamespace(**local_values)
+    workflow_runner.upstream = SimpleNamespace(user="deploy", host="upstream.example", db_user="postgres", db_name="prod")
+    workflow_runner._build_ssh_command = lambda: ["ssh", "-o", "StrictHostKeyChecking=yes"]
+    workflow_runner._set_database_allow_connections = lambda _allow: None
+    workflow_runner.terminate_all_db_connections = lambda: None
+    workflow_runner.run_command = commands.append
+    return workflow_runner, commands
+
+
+class OdooDataWorkflowRestoreTests(unittest.TestCase):
+    def test_fast_restore_streams_directory_dump_and_restores_in_parallel(self) -> None:
+        workflow_runner, commands = _build_runner()
+
+        workflow_runner.overwrite_database()
+
+        transfer_command = commands[1]
+        self.assertTrue(transfer_command.startswith("bash -o pipefail -c "))
+        self.assertIn("pg_dump -Fd -j 6", transfer_command)
+        self.assertIn("tar -C /tmp/upstream_db_dump -xf -", transfer_command)
+        self.assertEqual(commands[2], "dropdb --if-exists -h database -U odoo cm")
+        self.assertEqual(commands[3], "createdb -h database -U odoo cm")
+        self.assertEqual(
+            commands[4],
+            "pg_restore -j 6 -d cm -h database -U odoo --no-owner --role=odoo /tmp/upstream_db_dump",
+        )
+        self.assertEqual(commands[-1], "rm -rf /tmp/upstream_db_dump")
+
+    def test_fast_restore_defers_post_data_with_index_build_memory(self) -> None:
+        workflow_runner, commands = _build_runner(restore_defer_post_data=True, restore_maintenance_work_mem="2GB")
+
+        workflow_runner.overwrite_database()
+
+        restore_commands = [command for command in commands if "pg_restore" in command]
+        self.assertEqual(len(restore_commands), 2)
+        self.assertIn("--section=pre-data --section=data", restore_commands[0])
+        self.assertNotIn("PGOPTIONS", restore_commands[0])
+        self.assertTrue(restore_commands[1].startswith("PGOPTIONS='-c maintenance_work_mem=2GB' pg_restore -j 6"))
+        self.assertIn("--section=post-data", restore_commands[1])
+
+    def test_fast_restore_removes_dump_directory_when_restore_fails(self) -> None:
+        workflow_runner, commands = _build_runner()
+
+        def _run_command(command: str) -> None:
+            commands.append(command)
+            if command.startswith("pg_restore"):
+                raise odoo_data_workflow.OdooRestorerError("restore failed")
+
+        workflow_runner.run_command = _run_command
+
+        with self.assertRaises(odoo_data_workflow.OdooRestorerError):
+            workflow_runner.overwrite_database()
+
+        self.assertEqual(commands[-1], "rm -rf /tmp/upstream_db_dump")
+
+    def test_default_restore_keeps_custom_format_dump(self) -> None:
+        workflow_runner, commands = _build_runner(fast_restore=False)
+
+        workflow_runner.overwrite_database()
+
+        self.assertIn("pg_dump -Fc prod", commands[0])
+        self.assertTrue(commands[3].startswith("gunzip < /tmp/upstream_db_backup.sql.gz | pg_restore -d cm"))
+        self.assertEqual(commands[-1], "rm /tmp/upstream_db_backup.sql.gz")
+
+
+if __name__ == "__main__":
+    unittest.main()
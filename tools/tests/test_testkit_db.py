@@ -8,12 +8,25 @@ from unittest.mock import patch
 from tools.testkit.db import (
     assert_no_default_database_target,
     build_module_template,
+    cached_module_template,
     clone_production_database,
     create_template_from_production,
+    module_template_fingerprint,
+    record_module_template,
     resolve_database_connection_flags,
 )
 
 
+def _write_addon(addons_root: Path, name: str, depends: list[str]) -> Path:
+    addon_path = addons_root / name
+    (addon_path / "models").mkdir(parents=True)
+    (addon_path / "tests").mkdir()
+    (addon_path / "__manifest__.py").write_text(repr({"name": name, "depends": depends}))
+    (addon_path / "models" / "model.py").write_text("VALUE = 1\n")
+    (addon_path / "tests" / "test_model.py").write_text("VALUE = 1\n")
+    return addon_path
+
+
 class TestkitDatabaseHelpersTests(unittest.TestCase):
     def test_resolve_database_connection_flags_uses_environment_values(self) -> None:
         flags = resolve_database_connection_flags(
@@ -127,5 +140,91 @@ class TestkitDatabaseHelpersTests(unittest.TestCase):
         self.assertIn(shlex.quote("template;db"), command)
 
 
+class TestkitModuleTemplateCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.root = Path(temporary_directory.name)
+        self.addons_root = self.root / "addons"
+        self.environment = {"DOCKER_IMAGE": "odoo-ai", "DOCKER_IMAGE_TAG": "19.0"}
+        self.base_addon = _write_addon(self.addons_root, "base_addon", ["base"])
+        _write_addon(self.addons_root, "feature_addon", ["base_addon"])
+        self.unrelated_addon = _write_addon(self.addons_root, "unrelated_addon", ["base"])
+
+    def _fingerprint(self, environment: dict[str, str] | None = None) -> str:
+        return module_template_fingerprint(
+            ["feature_addon"],
+            addons_root=self.addons_root,
+            environment_values=environment or self.environment,
+        )
+
+    def test_fingerprint_tracks_dependency_sources_and_image(self) -> None:
+        fingerprint = self._fingerprint()
+
+        (self.base_addon / "models" / "model.py").write_text("VALUE = 2\n")
+
+        self.assertNotEqual(self._fingerprint(), fingerprint)
+        self.assertNotEqual(self._fingerprint({**self.environment, "DOCKER_IMAGE_TAG": "19.1"}), self._fingerprint())
+
+    def test_fingerprint_tracks_dependencies_in_grouped_addon_layout(self) -> None:
+        grouped_root = self.root / "grouped_addons"
+        shared_addon = _write_addon(grouped_root / "shared", "shared_addon", ["base"])
+        _write_addon(grouped_root / "opw", "sync_addon", ["shared_addon"])
+        _write_addon(grouped_root, "custom_addon", ["sync_addon"])
+
+        def fingerprint() -> str:
+            return module_template_fingerprint(
+                ["custom_addon"],
+                addons_root=grouped_root,
+                environment_values=self.environment,
+            )
+
+        original_fingerprint = fingerprint()
+
+        (shared_addon / "models" / "model.py").write_text("VALUE = 2\n")
+
+        self.assertNotEqual(fingerprint(), original_fingerprint)
+
+    def test_fingerprint_ignores_tests_and_unrelated_addons(self) -> None:
+        fingerprint = self._fingerprint()
+
+        (self.base_addon / "tests" / "test_model.py").write_text("VALUE = 2\n")
+        (self.unrelated_addon / "models" / "model.py").write_text("VALUE = 2\n")
+
+        self.assertEqual(self._fingerprint(), fingerprint)
+
+    def test_record_module_template_evicts_least_recently_used(self) -> None:
+        metadata_path = self.root / "module_templates.json"
+        with (
+            patch("tools.testkit.db.MODULE_TEMPLATE_METADATA_PATH", metadata_path),
+            patch("tools.testkit.db.get_db_user", return_value="odoo"),
+            patch("tools.testkit.db._db_exists", return_value=True),
+            patch("tools.testkit.db._terminate_backends"),
+            patch("tools.testkit.db.force_drop_database") as drop_mock,
+            patch("tools.testkit.db.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]),
+        ):
+            record_module_template("first", "cm_modtpl_first", ["a"], max_entries=2)
+            record_module_template("second", "cm_modtpl_second", ["b"], max_entries=2)
+            self.assertEqual(cached_module_template("first"), "cm_modtpl_first")
+            record_module_template("third", "cm_modtpl_third", ["c"], max_entries=2)
+
+            self.assertIsNone(cached_module_template("second"))
+
+        drop_mock.assert_called_once_with("cm_modtpl_second")
+
+    def test_cached_module_template_forgets_missing_database(self) -> None:
+        metadata_path = self.root / "module_templates.json"
+        with (
+            patch("tools.testkit.db.MODULE_TEMPLATE_METADATA_PATH", metadata_path),
+            patch("tools.testkit.db.get_db_user", return_value="odoo"),
+            patch("tools.testkit.db._db_exists", return_value=False),
+        ):
+            record_module_template("first", "cm_modtpl_first", ["a"], max_entries=2)
+
+            self.assertIsNone(cached_module_template("first"))
+
+        self.assertNotIn("first", metadata_path.read_text())
+
+
 if __name__ == "__main__":
     unittest.main()